@@ -0,0 +1,45 @@
+"""Lowercase stored emails and add unique lower(email) index
+
+Revision ID: add_users_email_lower_index
+Revises: add_vendor_image_lookup_index
+Create Date: 2026-02-10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_users_email_lower_index'
+down_revision: Union[str, None] = 'add_vendor_image_lookup_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Normalize existing emails, then enforce case-insensitive uniqueness."""
+    # Request DTOs now lowercase emails, so exact-match lookups only find
+    # rows that are stored lowercased too. Fails on case-only duplicates,
+    # which have to be merged by hand first.
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_lower',
+            'users',
+            [sa.text('lower(email)')],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the lower(email) index; stored emails stay lowercased."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_lower',
+            table_name='users',
+            postgresql_concurrently=True,
+        )
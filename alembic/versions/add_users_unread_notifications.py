@@ -0,0 +1,44 @@
+"""Add denormalized unread notification counter to users
+
+Revision ID: add_users_unread_notifications
+Revises: add_users_email_lower_index
+Create Date: 2026-02-12
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_users_unread_notifications'
+down_revision: Union[str, None] = 'add_users_email_lower_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add users.unread_notifications and backfill it from notifications."""
+    op.add_column(
+        'users',
+        sa.Column('unread_notifications', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.execute(
+        """
+        UPDATE users
+        SET unread_notifications = unread.count
+        FROM (
+            SELECT user_id, COUNT(*) AS count
+            FROM notifications
+            WHERE NOT is_read
+            GROUP BY user_id
+        ) AS unread
+        WHERE users.id = unread.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop users.unread_notifications."""
+    op.drop_column('users', 'unread_notifications')
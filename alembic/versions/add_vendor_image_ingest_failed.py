@@ -0,0 +1,31 @@
+"""Add image_ingest_failed flag to service_vendors
+
+Revision ID: add_vendor_image_ingest_failed
+Revises: add_users_unread_notifications
+Create Date: 2026-02-14
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_vendor_image_ingest_failed'
+down_revision: Union[str, None] = 'add_users_unread_notifications'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add service_vendors.image_ingest_failed."""
+    op.add_column(
+        'service_vendors',
+        sa.Column('image_ingest_failed', sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+
+
+def downgrade() -> None:
+    """Drop service_vendors.image_ingest_failed."""
+    op.drop_column('service_vendors', 'image_ingest_failed')
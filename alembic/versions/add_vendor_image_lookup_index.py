@@ -0,0 +1,52 @@
+"""Add covering lookup index on vendor_images
+
+Revision ID: add_vendor_image_lookup_index
+Revises: convert_users_tier_to_enum
+Create Date: 2026-02-08
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_vendor_image_lookup_index'
+down_revision: Union[str, None] = 'convert_users_tier_to_enum'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace (vendor_id, image_type) with a covering (vendor_id, image_type, display_order) index."""
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_image_vendor_type_order',
+            'vendor_images',
+            ['vendor_id', 'image_type', 'display_order'],
+            postgresql_include=['image_url', 'thumbnail_url', 'caption'],
+            postgresql_concurrently=True,
+        )
+        # The new index's leading columns serve every query the old one did
+        op.drop_index(
+            'idx_image_vendor_type',
+            table_name='vendor_images',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the (vendor_id, image_type) index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_image_vendor_type',
+            'vendor_images',
+            ['vendor_id', 'image_type'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_image_vendor_type_order',
+            table_name='vendor_images',
+            postgresql_concurrently=True,
+        )
@@ -6,7 +6,9 @@ import logging
 from src.config import settings
 from src.shared.logger.config import get_logger
 from src.infrastructure.persistence.database import init_db, close_db
+from src.infrastructure.web.api.responses import PydanticJSONResponse
 from src.infrastructure.tasks import start_scheduler, stop_scheduler
+from src.shared.utils.password_utils import calibrate_bcrypt_rounds, configure_bcrypt_rounds
 from src.infrastructure.web.api.routers import auth
 from src.infrastructure.web.api.routers import requests
 from src.infrastructure.web.api.routers import conversations
@@ -38,6 +40,7 @@ app = FastAPI(
     title="AJLA Concierge API",
     description="Premium lifestyle concierge platform API",
     version="1.0.0",
+    default_response_class=PydanticJSONResponse,
 )
 
 
@@ -84,6 +87,12 @@ async def startup_event():
     init_db()
     logger.info("Database initialized")
     
+    if settings.bcrypt_target_hash_ms:
+        rounds = calibrate_bcrypt_rounds(settings.bcrypt_target_hash_ms)
+    else:
+        rounds = configure_bcrypt_rounds(settings.bcrypt_rounds)
+    logger.info(f"Password hashing uses bcrypt cost {rounds}")
+    
     # Start background scheduler for periodic tasks
     start_scheduler()
     logger.info("Background scheduler started")
@@ -1,6 +1,6 @@
 """Booking use cases - application layer."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.domain.booking.repository.booking_repository import BookingRepository
 from src.domain.request.repository.request_repository import RequestRepository
 from src.domain.service.repository.service_vendor_repository import ServiceVendorRepository
@@ -17,6 +17,27 @@ from src.shared.logger.config import get_logger
 logger = get_logger(__name__)
 
 
+def _vendor_summaries(
+    vendor_repo: ServiceVendorRepository,
+    image_repo: VendorImageRepository,
+    bookings: List[Booking],
+) -> Dict[int, dict]:
+    """Resolve the vendor summary shown on each booking with two batched queries."""
+    vendor_ids = {b.vendor_id for b in bookings if b.vendor_id}
+    if not vendor_ids:
+        return {}
+    vendors = vendor_repo.find_by_ids(list(vendor_ids))
+    heroes = image_repo.find_first_hero_images_for_vendors(list(vendors))
+    return {
+        vendor_id: {
+            "id": vendor.vendor_id,
+            "name": vendor.name,
+            "hero_url": heroes[vendor_id].image_url if vendor_id in heroes else None,
+        }
+        for vendor_id, vendor in vendors.items()
+    }
+
+
 class CreateBookingUseCase:
     """Create a booking for a confirmed request (admin action)."""
 
@@ -122,19 +143,14 @@ class ListUserBookingsUseCase:
                 "Invalid status. Expected one of: upcoming|completed|cancelled"
             )
 
-        total = self.booking_repo.count_by_user_and_status(user_id, normalized_status)
-        bookings = self.booking_repo.find_by_user_and_status(user_id, normalized_status, skip, limit)
+        bookings, total = self.booking_repo.find_page_by_user_and_status(user_id, normalized_status, skip, limit)
+
+        # Vendors and their hero images for the whole page, not one lookup per booking
+        vendor_summaries = _vendor_summaries(self.vendor_repo, self.image_repo, bookings)
 
         result_items = []
         for b in bookings:
-            vendor_obj = None
-            if b.vendor_id:
-                v = self.vendor_repo.find_by_id(b.vendor_id)
-                if v:
-                    # try to get hero image URL from image repo (prefer direct hero image)
-                    thumb = self.image_repo.find_first_hero_image(b.vendor_id)
-                    hero_url = getattr(thumb, 'image_url', None) if thumb else None
-                    vendor_obj = {"id": v.vendor_id, "name": v.name, "hero_url": hero_url}
+            vendor_obj = vendor_summaries.get(b.vendor_id)
 
             item = BookingResponseDTO(
                 id=b.booking_id,
@@ -184,15 +200,12 @@ class ListAllBookingsUseCase:
         total = self.booking_repo.count_all(normalized_status)
         bookings = self.booking_repo.find_all(normalized_status, skip, limit)
 
+        # Vendors and their hero images for the whole page, not one lookup per booking
+        vendor_summaries = _vendor_summaries(self.vendor_repo, self.image_repo, bookings)
+
         result_items = []
         for b in bookings:
-            vendor_obj = None
-            if b.vendor_id:
-                v = self.vendor_repo.find_by_id(b.vendor_id)
-                if v:
-                    thumb = self.image_repo.find_first_hero_image(b.vendor_id)
-                    hero_url = getattr(thumb, 'image_url', None) if thumb else None
-                    vendor_obj = {"id": v.vendor_id, "name": v.name, "hero_url": hero_url}
+            vendor_obj = vendor_summaries.get(b.vendor_id)
 
             item = BookingResponseDTO(
                 id=b.booking_id,
@@ -240,16 +253,8 @@ class UpdateBookingStatusUseCase:
 
         old_status = booking.status
 
-        # Update status based on action
-        if normalized_status == "completed":
-            booking.complete()
-        elif normalized_status == "cancelled":
-            booking.cancel()
-        elif normalized_status == "upcoming":
-            # Allow resetting to upcoming if not completed
-            if booking.status == "completed":
-                raise ValidationError("Cannot change completed booking back to upcoming")
-            booking.status = "upcoming"
+        # Update status (completed bookings can't change; others may reset to upcoming)
+        booking.transition_to(normalized_status)
 
         # Save changes
         updated_booking = self.booking_repo.update(booking)
@@ -357,7 +362,7 @@ class GetBookingDetailUseCase:
         user_dto = UserSummaryDTO(
             id=user.user_id,
             email=user.email,
-            full_name=f"{user.first_name} {user.last_name}",
+            full_name=user.full_name,
             phone_number=user.phone_number,
         )
 
@@ -135,7 +135,9 @@ class ListUserConversationsUseCase:
         self.conversation_repo = conversation_repo
     
     def execute(self, user_id: int, skip: int = 0, limit: int = 20) -> List[ConversationListItemDTO]:
-        conversations = self.conversation_repo.find_by_user_id(user_id, skip, limit)
+        conversations = self.conversation_repo.find_by_user_id(
+            user_id, skip, limit, with_last_message=True
+        )
         
         return [
             ConversationListItemDTO(
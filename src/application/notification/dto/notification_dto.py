@@ -27,6 +27,11 @@ class NotificationListResponseDTO(BaseModel):
     unread_count: int
 
 
+class MarkNotificationsAsReadRequestDTO(BaseModel):
+    """DTO for marking several notifications as read."""
+    notification_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
 class MarkAsReadResponseDTO(BaseModel):
     """DTO for mark as read response."""
     success: bool
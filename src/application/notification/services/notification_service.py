@@ -1,6 +1,7 @@
 """Notification service for creating notifications throughout the application."""
 
 from datetime import datetime
+from typing import List
 from sqlalchemy.orm import Session
 
 from src.domain.notification.entities.notification import Notification, NotificationType
@@ -119,14 +120,32 @@ class NotificationService:
 
     def notify_new_request(self, admin_user_id: int, request_id: int, request_title: str, user_name: str = None):
         """Create notification for admin about new request."""
+        return self.notify_new_request_many([admin_user_id], request_id, request_title, user_name)[0]
+
+    def notify_new_request_many(
+        self,
+        admin_user_ids: List[int],
+        request_id: int,
+        request_title: str,
+        user_name: str = None,
+    ) -> List[Notification]:
+        """Create new-request notifications for several admins in one insert."""
         user_info = f" from {user_name}" if user_name else ""
-        return self.create_notification(
-            user_id=admin_user_id,
-            title="New Request",
-            message=f"New request{user_info}: {request_title}",
-            notification_type=NotificationType.NEW_REQUEST,
-            related_id=request_id,
-        )
+        now = datetime.utcnow()
+        notifications = [
+            Notification(
+                notification_id=0,  # Will be set by repository
+                user_id=admin_user_id,
+                title="New Request",
+                message=f"New request{user_info}: {request_title}",
+                notification_type=NotificationType.NEW_REQUEST,
+                is_read=False,
+                related_id=request_id,
+                created_at=now,
+            )
+            for admin_user_id in admin_user_ids
+        ]
+        return self.notification_repo.create_many(notifications)
 
 
 def get_notification_service(db: Session) -> NotificationService:
@@ -3,6 +3,7 @@
 from .notification_use_cases import (
     GetUserNotificationsUseCase,
     MarkNotificationAsReadUseCase,
+    MarkNotificationsAsReadUseCase,
     MarkAllNotificationsAsReadUseCase,
     GetUnreadCountUseCase,
 )
@@ -10,6 +11,7 @@ from .notification_use_cases import (
 __all__ = [
     "GetUserNotificationsUseCase",
     "MarkNotificationAsReadUseCase",
+    "MarkNotificationsAsReadUseCase",
     "MarkAllNotificationsAsReadUseCase",
     "GetUnreadCountUseCase",
 ]
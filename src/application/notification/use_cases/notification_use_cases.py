@@ -5,6 +5,7 @@ from src.application.notification.dto.notification_dto import (
     NotificationDTO,
     NotificationListResponseDTO,
     MarkAsReadResponseDTO,
+    MarkNotificationsAsReadRequestDTO,
     UnreadCountResponseDTO,
 )
 
@@ -83,6 +84,23 @@ class MarkNotificationAsReadUseCase:
         )
 
 
+class MarkNotificationsAsReadUseCase:
+    """Use case for marking several notifications as read."""
+
+    def __init__(self, notification_repository: NotificationRepository):
+        self.notification_repository = notification_repository
+
+    def execute(self, dto: MarkNotificationsAsReadRequestDTO, user_id: int) -> MarkAsReadResponseDTO:
+        """Execute the use case."""
+        # The update is scoped to the user, so other users' IDs are ignored
+        count = self.notification_repository.mark_as_read_many(dto.notification_ids, user_id)
+        
+        return MarkAsReadResponseDTO(
+            success=True,
+            message=f"Marked {count} notifications as read"
+        )
+
+
 class MarkAllNotificationsAsReadUseCase:
     """Use case for marking all notifications as read."""
 
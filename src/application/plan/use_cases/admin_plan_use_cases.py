@@ -32,8 +32,7 @@ class CreatePlanUseCase:
         if isinstance(tier, str):
             tier = PlanTier(tier)
         
-        plan = Plan(
-            plan_id=0,  # Will be set by repository
+        plan = Plan.create(
             name=name,
             description=description,
             price=price,
@@ -102,6 +101,7 @@ class UpdatePlanUseCase:
             plan.features = json.dumps(features)
         if is_active is not None:
             plan.is_active = is_active
+        plan.validate()
         
         updated_plan = self.plan_repository.update(plan)
         
@@ -1,5 +1,6 @@
 """Admin subscription use cases."""
 
+from datetime import datetime
 from typing import List
 from src.domain.plan.repository.subscription_repository import SubscriptionRepository
 from src.domain.plan.repository.plan_repository import PlanRepository
@@ -20,15 +21,21 @@ class ListAllSubscriptionsUseCase:
     async def execute(self, user_id: int = None) -> List[SubscriptionDTO]:
         """Execute the use case. If user_id provided, filter by user."""
         if user_id:
-            subscriptions = await self.subscription_repository.find_by_user_id(user_id)
+            subscriptions = self.subscription_repository.find_by_user_id(user_id)
         else:
             # Would need to add a find_all method to repository
             # For now, just return empty list or implement pagination
             subscriptions = []
         
+        # One query for every referenced plan instead of one per subscription
+        plans = self.plan_repository.find_by_ids(
+            list({subscription.plan_id for subscription in subscriptions})
+        )
+        
+        now = datetime.utcnow()
         result = []
         for subscription in subscriptions:
-            plan = await self.plan_repository.find_by_id(subscription.plan_id)
+            plan = plans.get(subscription.plan_id)
             plan_name = plan.name if plan else "Unknown Plan"
             
             result.append(SubscriptionDTO(
@@ -39,7 +46,7 @@ class ListAllSubscriptionsUseCase:
                 status=subscription.status.value,
                 start_date=subscription.start_date,
                 end_date=subscription.end_date,
-                days_remaining=subscription.days_remaining(),
+                days_remaining=subscription.days_remaining_at(now),
                 payment_reference=subscription.payment_reference,
                 created_at=subscription.created_at,
                 updated_at=subscription.updated_at,
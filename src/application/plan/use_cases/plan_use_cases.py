@@ -142,9 +142,11 @@ class VerifyPaymentUseCase:
         subscription.status = SubscriptionStatus.ACTIVE
         updated_subscription = self.subscription_repository.update(subscription)
         
+        # The plan drives both the user tier and the notification
+        plan = self.plan_repository.find_by_id(subscription.plan_id) if self.plan_repository else None
+        
         # Update user tier based on plan (if plan_repository provided)
         if self.plan_repository:
-            plan = self.plan_repository.find_by_id(subscription.plan_id)
             if plan:
                 user = self.user_repository.find_by_id(subscription.user_id)
                 if user:
@@ -153,7 +155,6 @@ class VerifyPaymentUseCase:
         
         # Create notification for user (if notification_service provided)
         if self.notification_service and self.plan_repository:
-            plan = self.plan_repository.find_by_id(subscription.plan_id)
             if plan:
                 self.notification_service.notify_subscription_activated(
                     user_id=subscription.user_id,
@@ -1,5 +1,6 @@
 """Request use cases - application layer orchestration."""
 
+from datetime import datetime
 from typing import List
 from src.domain.request.entities.request import Request
 from src.domain.conversation.entities.conversation import Conversation
@@ -38,12 +39,15 @@ class SubmitRequestUseCase:
         category_slug = vendor.category_slug
         
         # 2. Create request entity (validates business rules)
+        # Request, conversation and first message share one timestamp
+        now = datetime.utcnow()
         request = Request.create(
             user_id=user_id,
             title=title,
             category_slug=category_slug,
             description=dto.description,
             vendor_id=dto.vendor_id,
+            now=now,
         )
         
         # 3. Save request
@@ -53,6 +57,7 @@ class SubmitRequestUseCase:
         conversation = Conversation.create(
             request_id=saved_request.request_id,
             user_id=user_id,
+            now=now,
         )
         saved_conversation = self.conversation_repo.save(conversation)
         
@@ -61,6 +66,7 @@ class SubmitRequestUseCase:
             sender_id=user_id,
             sender_type="user",
             content=dto.description,
+            now=now,
         )
         self.conversation_repo.add_message(first_message)
         
@@ -69,17 +75,16 @@ class SubmitRequestUseCase:
             try:
                 # Get user name for notification
                 user = self.user_repo.find_by_id(user_id)
-                user_name = f"{user.first_name} {user.last_name}" if user else None
+                user_name = user.full_name if user else None
                 
                 # Get all admin users
                 admins = self.user_repo.find_all_admins()
-                for admin in admins:
-                    self.notification_service.notify_new_request(
-                        admin_user_id=admin.user_id,
-                        request_id=saved_request.request_id,
-                        request_title=title,
-                        user_name=user_name,
-                    )
+                self.notification_service.notify_new_request_many(
+                    admin_user_ids=[admin.user_id for admin in admins],
+                    request_id=saved_request.request_id,
+                    request_title=title,
+                    user_name=user_name,
+                )
             except Exception:
                 # Don't fail request submission if notification fails
                 pass
@@ -118,7 +123,7 @@ class GetRequestUseCase:
             raise AccessDeniedError("You don't have access to this request")
         
         # Get conversation ID
-        conversation = self.conversation_repo.find_by_request_id(request_id)
+        conversation = self.conversation_repo.find_by_request_id(request_id, with_messages=False)
         
         return RequestResponseDTO(
             id=request.request_id,
@@ -483,6 +483,17 @@ class ServiceCategoryResponseDTO(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_entity(cls, category: Any) -> "ServiceCategoryResponseDTO":
+        """Build from a ServiceCategory entity without re-validating trusted fields."""
+        return cls.model_construct(
+            id=category.category_id,
+            slug=category.slug,
+            name=category.name,
+            icon_url=category.icon_url,
+            display_order=category.display_order,
+        )
 
 
 # =============================================================================
@@ -500,6 +511,18 @@ class ServiceSubcategoryResponseDTO(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_entity(cls, subcategory: Any) -> "ServiceSubcategoryResponseDTO":
+        """Build from a ServiceSubcategory entity without re-validating trusted fields."""
+        return cls.model_construct(
+            id=subcategory.subcategory_id,
+            category_id=subcategory.category_id,
+            slug=subcategory.slug,
+            name=subcategory.name,
+            icon_url=subcategory.icon_url,
+            display_order=subcategory.display_order,
+        )
 
 
 # Category DTOs that reference subcategories (must come after ServiceSubcategoryResponseDTO)
@@ -515,6 +538,18 @@ class ServiceCategoryWithSubcategoriesDTO(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_entity(cls, category: Any, subcategories: List[Any]) -> "ServiceCategoryWithSubcategoriesDTO":
+        """Build from a ServiceCategory and its subcategory entities without re-validation."""
+        return cls.model_construct(
+            id=category.category_id,
+            slug=category.slug,
+            name=category.name,
+            icon_url=category.icon_url,
+            display_order=category.display_order,
+            subcategories=[ServiceSubcategoryResponseDTO.from_entity(sc) for sc in subcategories],
+        )
+
 
 class ServiceCategoryListResponseDTO(BaseModel):
     """List of all service categories."""
@@ -580,6 +615,18 @@ class VendorImageDTO(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_entity(cls, image: Any) -> "VendorImageDTO":
+        """Build from a VendorImage entity without re-validating trusted fields."""
+        return cls.model_construct(
+            id=image.image_id,
+            image_type=image.image_type,
+            url=image.image_url,
+            thumbnail_url=image.thumbnail_url,
+            caption=image.caption,
+            display_order=image.display_order,
+        )
 
 
 class ImageCreateDTO(BaseModel):
@@ -638,14 +685,35 @@ class VendorListItemDTO(BaseModel):
     
     class Config:
         from_attributes = True
+    
+    @classmethod
+    def from_entity(
+        cls,
+        vendor: Any,
+        thumbnail_url: Optional[str],
+        short_description: str,
+    ) -> "VendorListItemDTO":
+        """Build from a ServiceVendor entity without re-validating trusted fields."""
+        return cls.model_construct(
+            id=vendor.vendor_id,
+            name=vendor.name,
+            category_slug=vendor.category_slug,
+            category_name=vendor.category_name,
+            thumbnail_url=thumbnail_url,
+            rating=vendor.rating,
+            short_description=short_description,
+            city=vendor.city,
+            address=vendor.address,
+        )
 
 
 class VendorListResponseDTO(BaseModel):
     """Paginated list of vendors."""
     vendors: List[VendorListItemDTO]
-    total: int
+    total: Optional[int] = None  # None when the client passed include_total=false
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 # =============================================================================
@@ -678,6 +746,8 @@ class VendorDetailDTO(BaseModel):
     # Images
     hero_images: List[VendorImageDTO] = []
     gallery_images: List[VendorImageDTO] = []
+    images_processing: bool = False  # True while submitted images are still being saved
+    image_ingest_failed: bool = False  # True if the background save of submitted images failed
     
     # Type-specific metadata (dishes, rooms, aircraft, etc.)
     metadata: Dict[str, Any] = {}
@@ -0,0 +1,21 @@
+"""Port for deferring vendor image persistence off the request path."""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.service.entities.vendor_image import VendorImage
+
+
+class ImageIngestQueue(ABC):
+    """Queue that persists already-validated vendor images after the response is sent."""
+
+    @abstractmethod
+    def enqueue_batch(self, vendor_id: int, images: List[VendorImage]) -> None:
+        """
+        Schedule images for a vendor to be saved.
+
+        Args:
+            vendor_id: The vendor the images belong to
+            images: Validated image entities (hero and gallery) to persist
+        """
+        pass
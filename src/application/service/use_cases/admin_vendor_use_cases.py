@@ -1,5 +1,7 @@
 """Admin vendor use cases - CRUD operations."""
 
+from typing import List, Optional
+
 from src.domain.service.entities.service_vendor import ServiceVendor
 from src.domain.service.entities.vendor_image import VendorImage
 from src.domain.service.repository.service_category_repository import ServiceCategoryRepository
@@ -11,7 +13,24 @@ from src.application.service.dto.service_dto import (
     VendorUpdateDTO,
     VendorDetailDTO,
     VendorImageDTO,
+    ImageCreateDTO,
 )
+from src.application.service.services.image_ingest_queue import ImageIngestQueue
+
+
+def _build_images(vendor_id: int, image_type: str, image_dtos: List[ImageCreateDTO]) -> List[VendorImage]:
+    """Validate image inputs and build entities ordered by their input position."""
+    return [
+        VendorImage.create(
+            vendor_id=vendor_id,
+            image_type=image_type,
+            image_url=img_dto.image_url,
+            thumbnail_url=img_dto.thumbnail_url,
+            caption=img_dto.caption,
+            display_order=idx,
+        )
+        for idx, img_dto in enumerate(image_dtos)
+    ]
 
 
 class CreateVendorUseCase:
@@ -22,13 +41,21 @@ class CreateVendorUseCase:
         category_repo: ServiceCategoryRepository,
         vendor_repo: ServiceVendorRepository,
         image_repo: VendorImageRepository,
+        image_queue: Optional[ImageIngestQueue] = None,
     ):
         self.category_repo = category_repo
         self.vendor_repo = vendor_repo
         self.image_repo = image_repo
+        self.image_queue = image_queue
     
     def execute(self, dto: VendorCreateDTO) -> VendorDetailDTO:
-        """Create a new vendor."""
+        """
+        Create a new vendor.
+        
+        When an image queue is configured, images are validated here but saved
+        after the response; the returned DTO then has empty image lists and
+        images_processing=True.
+        """
         # Find category by slug
         category = self.category_repo.find_by_slug(dto.category_slug)
         if not category:
@@ -55,49 +82,23 @@ class CreateVendorUseCase:
         # Save vendor
         saved_vendor = self.vendor_repo.save(vendor)
         
-        # Add images if provided
+        # Build (and validate) images if provided
+        new_images = (
+            _build_images(saved_vendor.vendor_id, "hero", dto.hero_images or [])
+            + _build_images(saved_vendor.vendor_id, "gallery", dto.gallery_images or [])
+        )
+        
         hero_images = []
         gallery_images = []
+        images_processing = False
         
-        if dto.hero_images:
-            for idx, img_dto in enumerate(dto.hero_images):
-                image = VendorImage.create(
-                    vendor_id=saved_vendor.vendor_id,
-                    image_type="hero",
-                    image_url=img_dto.image_url,
-                    thumbnail_url=img_dto.thumbnail_url,
-                    caption=img_dto.caption,
-                    display_order=idx,
-                )
-                saved_image = self.image_repo.save(image)
-                hero_images.append(VendorImageDTO(
-                    id=saved_image.image_id,
-                    image_type=saved_image.image_type,
-                    url=saved_image.image_url,
-                    thumbnail_url=saved_image.thumbnail_url,
-                    caption=saved_image.caption,
-                    display_order=saved_image.display_order,
-                ))
-        
-        if dto.gallery_images:
-            for idx, img_dto in enumerate(dto.gallery_images):
-                image = VendorImage.create(
-                    vendor_id=saved_vendor.vendor_id,
-                    image_type="gallery",
-                    image_url=img_dto.image_url,
-                    thumbnail_url=img_dto.thumbnail_url,
-                    caption=img_dto.caption,
-                    display_order=idx,
-                )
-                saved_image = self.image_repo.save(image)
-                gallery_images.append(VendorImageDTO(
-                    id=saved_image.image_id,
-                    image_type=saved_image.image_type,
-                    url=saved_image.image_url,
-                    thumbnail_url=saved_image.thumbnail_url,
-                    caption=saved_image.caption,
-                    display_order=saved_image.display_order,
-                ))
+        if new_images and self.image_queue is not None:
+            self.image_queue.enqueue_batch(saved_vendor.vendor_id, new_images)
+            images_processing = True
+        else:
+            for saved_image in self.image_repo.save_many(new_images):
+                target = hero_images if saved_image.is_hero else gallery_images
+                target.append(VendorImageDTO.from_entity(saved_image))
         
         return VendorDetailDTO(
             id=saved_vendor.vendor_id,
@@ -114,6 +115,7 @@ class CreateVendorUseCase:
             rating=saved_vendor.rating,
             hero_images=hero_images,
             gallery_images=gallery_images,
+            images_processing=images_processing,
             metadata=saved_vendor.metadata,
             is_active=saved_vendor.is_active,
             created_at=saved_vendor.created_at,
@@ -140,7 +142,7 @@ class UpdateVendorUseCase:
             raise ResourceNotFoundError(f"Vendor {vendor_id} not found")
         
         # Update fields
-        vendor.update(
+        changed = vendor.update(
             name=dto.name,
             description=dto.description,
             address=dto.address,
@@ -153,73 +155,24 @@ class UpdateVendorUseCase:
             is_active=dto.is_active,
         )
         
-        # Save updates
-        updated_vendor = self.vendor_repo.update(vendor)
+        # Save updates (skip the UPDATE round-trip when nothing changed)
+        updated_vendor = self.vendor_repo.update(vendor) if changed else vendor
         
-        # Update images if provided
+        # Replace images if provided (one DELETE + batched INSERT per type)
         if dto.hero_images is not None:
-            # Delete existing hero images
-            existing_hero = self.image_repo.find_hero_images(vendor_id)
-            for img in existing_hero:
-                self.image_repo.delete(img.image_id)
-            
-            # Add new hero images
-            for idx, img_dto in enumerate(dto.hero_images):
-                image = VendorImage.create(
-                    vendor_id=vendor_id,
-                    image_type="hero",
-                    image_url=img_dto.image_url,
-                    thumbnail_url=img_dto.thumbnail_url,
-                    caption=img_dto.caption,
-                    display_order=idx,
-                )
-                self.image_repo.save(image)
+            self.image_repo.replace_images(
+                vendor_id, "hero", _build_images(vendor_id, "hero", dto.hero_images)
+            )
         
         if dto.gallery_images is not None:
-            # Delete existing gallery images
-            existing_gallery = self.image_repo.find_gallery_images(vendor_id)
-            for img in existing_gallery:
-                self.image_repo.delete(img.image_id)
-            
-            # Add new gallery images
-            for idx, img_dto in enumerate(dto.gallery_images):
-                image = VendorImage.create(
-                    vendor_id=vendor_id,
-                    image_type="gallery",
-                    image_url=img_dto.image_url,
-                    thumbnail_url=img_dto.thumbnail_url,
-                    caption=img_dto.caption,
-                    display_order=idx,
-                )
-                self.image_repo.save(image)
-        
-        # Get final images
-        hero_images = self.image_repo.find_hero_images(vendor_id)
-        gallery_images = self.image_repo.find_gallery_images(vendor_id)
-        
-        hero_dtos = [
-            VendorImageDTO(
-                id=img.image_id,
-                image_type=img.image_type,
-                url=img.image_url,
-                thumbnail_url=img.thumbnail_url,
-                caption=img.caption,
-                display_order=img.display_order,
+            self.image_repo.replace_images(
+                vendor_id, "gallery", _build_images(vendor_id, "gallery", dto.gallery_images)
             )
-            for img in hero_images
-        ]
         
-        gallery_dtos = [
-            VendorImageDTO(
-                id=img.image_id,
-                image_type=img.image_type,
-                url=img.image_url,
-                thumbnail_url=img.thumbnail_url,
-                caption=img.caption,
-                display_order=img.display_order,
-            )
-            for img in gallery_images
-        ]
+        # Get final images (one query, partitioned by type)
+        images = self.image_repo.find_images_grouped(vendor_id)
+        hero_dtos = [VendorImageDTO.from_entity(img) for img in images["hero"]]
+        gallery_dtos = [VendorImageDTO.from_entity(img) for img in images["gallery"]]
         
         return VendorDetailDTO(
             id=updated_vendor.vendor_id,
@@ -1,6 +1,6 @@
 """Service category use cases."""
 
-from typing import List
+from typing import Iterator, List
 
 from src.domain.service.repository.service_category_repository import ServiceCategoryRepository
 from src.domain.service.repository.service_subcategory_repository import ServiceSubcategoryRepository
@@ -11,10 +11,9 @@ from src.application.service.dto.service_dto import (
     ServiceCategoryUpdateDTO,
     ServiceCategoryWithSubcategoriesDTO,
     ServiceCategoryWithSubcategoriesListResponseDTO,
-    ServiceSubcategoryResponseDTO,
 )
 from src.domain.service.entities.service_category import ServiceCategory
-from urllib.parse import urlparse
+from src.domain.shared.urls import is_http_url
 
 
 class ListCategoriesUseCase:
@@ -27,16 +26,7 @@ class ListCategoriesUseCase:
         """Get all categories ordered by display_order."""
         categories = self.category_repo.find_all()
         
-        category_dtos = [
-            ServiceCategoryResponseDTO(
-                id=cat.category_id,
-                slug=cat.slug,
-                name=cat.name,
-                icon_url=getattr(cat, 'icon_url', None),
-                display_order=cat.display_order,
-            )
-            for cat in categories
-        ]
+        category_dtos = [ServiceCategoryResponseDTO.from_entity(cat) for cat in categories]
         
         return ServiceCategoryListResponseDTO(categories=category_dtos)
 
@@ -49,31 +39,21 @@ class ListCategoriesWithSubcategoriesUseCase:
 
     def execute(self) -> ServiceCategoryWithSubcategoriesListResponseDTO:
         """Get all categories with nested subcategories."""
+        return ServiceCategoryWithSubcategoriesListResponseDTO(categories=list(self.iter_categories()))
+
+    def iter_categories(self) -> Iterator[ServiceCategoryWithSubcategoriesDTO]:
+        """Return a lazy iterator of category DTOs, for streaming responses.
+
+        The repository is queried eagerly so that no database access happens
+        while the caller iterates (e.g. after the request session has closed).
+        """
         items = self.category_repo.find_all_with_subcategories()
+        return (self._to_dto(item["category"], item["subcategories"]) for item in items)
 
-        category_dtos = [
-            ServiceCategoryWithSubcategoriesDTO(
-                id=item["category"].category_id,
-                slug=item["category"].slug,
-                name=item["category"].name,
-                icon_url=getattr(item["category"], "icon_url", None),
-                display_order=item["category"].display_order,
-                subcategories=[
-                    ServiceSubcategoryResponseDTO(
-                        id=sc.subcategory_id,
-                        category_id=sc.category_id,
-                        slug=sc.slug,
-                        name=sc.name,
-                        icon_url=sc.icon_url,
-                        display_order=sc.display_order,
-                    )
-                    for sc in item["subcategories"]
-                ],
-            )
-            for item in items
-        ]
-
-        return ServiceCategoryWithSubcategoriesListResponseDTO(categories=category_dtos)
+    @staticmethod
+    def _to_dto(category, subcategories) -> ServiceCategoryWithSubcategoriesDTO:
+        """Map a category and its subcategories to the nested DTO."""
+        return ServiceCategoryWithSubcategoriesDTO.from_entity(category, subcategories)
 
 
 class CreateCategoryUseCase:
@@ -89,10 +69,8 @@ class CreateCategoryUseCase:
 
     def execute(self, dto: ServiceCategoryCreateDTO) -> ServiceCategoryWithSubcategoriesDTO:
         # Validate icon_url if provided
-        if dto.icon_url:
-            parsed = urlparse(dto.icon_url)
-            if parsed.scheme not in ("http", "https") or not parsed.netloc:
-                raise ValueError("Invalid icon_url; must be a valid http/https URL")
+        if dto.icon_url and not is_http_url(dto.icon_url):
+            raise ValueError("Invalid icon_url; must be a valid http/https URL")
 
         # Build domain entity and persist
         category = ServiceCategory.create(slug=dto.slug, name=dto.name, display_order=dto.display_order, icon_url=dto.icon_url)
@@ -109,24 +87,7 @@ class CreateCategoryUseCase:
                 updated_sc = self.subcategory_repo.update(sc)
                 attached_subcategories.append(updated_sc)
 
-        return ServiceCategoryWithSubcategoriesDTO(
-            id=saved.category_id,
-            slug=saved.slug,
-            name=saved.name,
-            icon_url=getattr(saved, 'icon_url', None),
-            display_order=saved.display_order,
-            subcategories=[
-                ServiceSubcategoryResponseDTO(
-                    id=sc.subcategory_id,
-                    category_id=sc.category_id,
-                    slug=sc.slug,
-                    name=sc.name,
-                    icon_url=sc.icon_url,
-                    display_order=sc.display_order,
-                )
-                for sc in attached_subcategories
-            ],
-        )
+        return ServiceCategoryWithSubcategoriesDTO.from_entity(saved, attached_subcategories)
 
 
 class UpdateCategoryUseCase:
@@ -140,14 +101,8 @@ class UpdateCategoryUseCase:
         if not existing:
             raise ValueError("Category not found")
 
-        # Use entity update method
-        existing.update(name=dto.name, display_order=dto.display_order, icon_url=dto.icon_url)
-        updated = self.category_repo.update(existing)
-
-        return ServiceCategoryResponseDTO(
-            id=updated.category_id,
-            slug=updated.slug,
-            name=updated.name,
-            icon_url=getattr(updated, 'icon_url', None),
-            display_order=updated.display_order,
-        )
+        # Use entity update method; skip the UPDATE round-trip for no-op saves
+        changed = existing.update(name=dto.name, display_order=dto.display_order, icon_url=dto.icon_url)
+        updated = self.category_repo.update(existing) if changed else existing
+
+        return ServiceCategoryResponseDTO.from_entity(updated)
@@ -1,6 +1,6 @@
 """Use cases for managing service subcategories."""
 
-from typing import List
+from typing import Iterator, List
 from src.domain.service.entities.service_subcategory import ServiceSubcategory, InvalidSubcategoryError
 from src.domain.service.repository.service_subcategory_repository import ServiceSubcategoryRepository
 from src.domain.service.repository.service_category_repository import ServiceCategoryRepository
@@ -25,7 +25,7 @@ class CreateSubcategoryUseCase:
     
     def execute(self, dto: ServiceSubcategoryCreateDTO) -> ServiceSubcategoryResponseDTO:
         """Create and save a new subcategory."""
-        # Verify category exists
+        # Verify category exists (served from the category repo's in-process cache)
         category = self.category_repo.find_by_id(dto.category_id)
         if not category:
             raise ValueError(f"Category with ID {dto.category_id} not found")
@@ -45,14 +45,7 @@ class CreateSubcategoryUseCase:
         # Save to repository
         saved = self.subcategory_repo.save(subcategory)
         
-        return ServiceSubcategoryResponseDTO(
-            id=saved.subcategory_id,
-            category_id=saved.category_id,
-            slug=saved.slug,
-            name=saved.name,
-            icon_url=saved.icon_url,
-            display_order=saved.display_order,
-        )
+        return ServiceSubcategoryResponseDTO.from_entity(saved)
 
 
 class UpdateSubcategoryUseCase:
@@ -94,14 +87,7 @@ class UpdateSubcategoryUseCase:
         
         updated = self.subcategory_repo.update(subcategory)
         
-        return ServiceSubcategoryResponseDTO(
-            id=updated.subcategory_id,
-            category_id=updated.category_id,
-            slug=updated.slug,
-            name=updated.name,
-            icon_url=updated.icon_url,
-            display_order=updated.display_order,
-        )
+        return ServiceSubcategoryResponseDTO.from_entity(updated)
 
 
 class GetSubcategoryUseCase:
@@ -116,14 +102,7 @@ class GetSubcategoryUseCase:
         if not subcategory:
             raise ValueError(f"Subcategory with ID {subcategory_id} not found")
         
-        return ServiceSubcategoryResponseDTO(
-            id=subcategory.subcategory_id,
-            category_id=subcategory.category_id,
-            slug=subcategory.slug,
-            name=subcategory.name,
-            icon_url=subcategory.icon_url,
-            display_order=subcategory.display_order,
-        )
+        return ServiceSubcategoryResponseDTO.from_entity(subcategory)
 
 
 class ListSubcategoriesByCategoryUseCase:
@@ -137,17 +116,7 @@ class ListSubcategoriesByCategoryUseCase:
         subcategories = self.subcategory_repo.find_by_category_id(category_id)
         
         return ServiceSubcategoryListResponseDTO(
-            subcategories=[
-                ServiceSubcategoryResponseDTO(
-                    id=sc.subcategory_id,
-                    category_id=sc.category_id,
-                    slug=sc.slug,
-                    name=sc.name,
-                    icon_url=sc.icon_url,
-                    display_order=sc.display_order,
-                )
-                for sc in subcategories
-            ]
+            subcategories=[ServiceSubcategoryResponseDTO.from_entity(sc) for sc in subcategories]
         )
 
 
@@ -159,21 +128,16 @@ class ListAllSubcategoriesUseCase:
     
     def execute(self) -> ServiceSubcategoryListResponseDTO:
         """Get all subcategories."""
-        subcategories = self.subcategory_repo.find_all()
+        return ServiceSubcategoryListResponseDTO(subcategories=list(self.iter_subcategories()))
+    
+    def iter_subcategories(self) -> Iterator[ServiceSubcategoryResponseDTO]:
+        """Return a lazy iterator of subcategory DTOs, for streaming responses.
         
-        return ServiceSubcategoryListResponseDTO(
-            subcategories=[
-                ServiceSubcategoryResponseDTO(
-                    id=sc.subcategory_id,
-                    category_id=sc.category_id,
-                    slug=sc.slug,
-                    name=sc.name,
-                    icon_url=sc.icon_url,
-                    display_order=sc.display_order,
-                )
-                for sc in subcategories
-            ]
-        )
+        The repository is queried eagerly so that no database access happens
+        while the caller iterates (e.g. after the request session has closed).
+        """
+        subcategories = self.subcategory_repo.find_all()
+        return (ServiceSubcategoryResponseDTO.from_entity(sc) for sc in subcategories)
 
 
 class DeleteSubcategoryUseCase:
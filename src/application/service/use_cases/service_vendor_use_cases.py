@@ -1,16 +1,26 @@
 """Service vendor use cases - user-facing operations."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from src.domain.service.repository.service_vendor_repository import ServiceVendorRepository
 from src.domain.service.repository.vendor_image_repository import VendorImageRepository
-from src.domain.shared.exceptions import ResourceNotFoundError
+from src.domain.shared.exceptions import ResourceNotFoundError, ValidationError
 from src.application.service.dto.service_dto import (
     VendorListItemDTO,
     VendorListResponseDTO,
-    VendorDetailDTO,
-    VendorImageDTO,
 )
+from src.shared.utils.cursor import encode_cursor, decode_cursor
+
+# Characters of description shown in list views before the "..." marker
+SHORT_DESCRIPTION_CHARS = 150
+
+
+def _shorten(description: str) -> str:
+    """Truncate a description for list views; a one-char probe detects overflow."""
+    if description[SHORT_DESCRIPTION_CHARS:SHORT_DESCRIPTION_CHARS + 1]:
+        return description[:SHORT_DESCRIPTION_CHARS] + "..."
+    return description
 
 
 class ListVendorsByCategoryUseCase:
@@ -30,8 +40,21 @@ class ListVendorsByCategoryUseCase:
         skip: int = 0,
         limit: int = 20,
         city: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> VendorListResponseDTO:
-        """Get vendors for a category with pagination and optional city filter. If category_slug is None, list all vendors."""
+        """
+        Get vendors for a category with pagination and optional city filter. If category_slug is None, list all vendors.
+        
+        Pass the previous response's next_cursor as `cursor` to page with a
+        keyset seek (constant cost at any depth); `skip` is then ignored.
+        Set include_total=False to skip the COUNT(*) query (total is None).
+        """
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            raise ValidationError(str(e)) from e
+
         if category_slug:
             vendors, total = self.vendor_repo.find_by_category_slug(
                 category_slug=category_slug,
@@ -39,6 +62,9 @@ class ListVendorsByCategoryUseCase:
                 limit=limit,
                 active_only=True,
                 city=city,
+                after=self._category_keyset(after) if after else None,
+                include_total=include_total,
+                summary_only=True,
             )
         else:
             vendors, total = self.vendor_repo.find_all(
@@ -46,101 +72,77 @@ class ListVendorsByCategoryUseCase:
                 limit=limit,
                 active_only=True,
                 city=city,
+                after=self._recency_keyset(after) if after else None,
+                include_total=include_total,
+                summary_only=True,
             )
 
+        # A full page may have more after it; hand back the last row's sort key
+        next_cursor = None
+        if vendors and len(vendors) == limit:
+            last = vendors[-1]
+            if category_slug:
+                next_cursor = encode_cursor([last.rating, last.name, last.vendor_id])
+            else:
+                next_cursor = encode_cursor([last.created_at.isoformat(), last.vendor_id])
+
+        # Fetch every vendor's first hero image in one query (not one per vendor)
+        first_heroes = self.image_repo.find_first_hero_images_for_vendors(
+            [vendor.vendor_id for vendor in vendors]
+        )
+        hero_by_vendor = {vendor_id: image.image_url for vendor_id, image in first_heroes.items()}
+
         vendor_dtos = []
         for vendor in vendors:
-            # Get first hero image and use its direct image URL as the list hero URL
-            first_hero = self.image_repo.find_first_hero_image(vendor.vendor_id)
-            hero_url = first_hero.image_url if first_hero else None
-
-            # Truncate description for list view
-            short_desc = vendor.description[:150] + "..." if len(vendor.description) > 150 else vendor.description
+            # Use the first hero image's direct URL as the list hero URL
+            hero_url = hero_by_vendor.get(vendor.vendor_id)
 
-            vendor_dtos.append(
-                VendorListItemDTO(
-                    id=vendor.vendor_id,
-                    name=vendor.name,
-                    category_slug=vendor.category_slug,
-                    category_name=vendor.category_name,
-                    thumbnail_url=hero_url,
-                    rating=vendor.rating,
-                    short_description=short_desc,
-                    city=vendor.city,
-                    address=vendor.address,
-                )
-            )
+            vendor_dtos.append(VendorListItemDTO.from_entity(vendor, hero_url, _shorten(vendor.description)))
 
         return VendorListResponseDTO(
             vendors=vendor_dtos,
             total=total,
             skip=skip,
             limit=limit,
+            next_cursor=next_cursor,
         )
+    
+    @staticmethod
+    def _category_keyset(values: list) -> tuple:
+        """Validate a decoded (rating, name, vendor_id) cursor."""
+        try:
+            rating, name, vendor_id = values
+            return float(rating), str(name), int(vendor_id)
+        except (TypeError, ValueError) as e:
+            raise ValidationError("Malformed pagination cursor") from e
+    
+    @staticmethod
+    def _recency_keyset(values: list) -> tuple:
+        """Validate a decoded (created_at, vendor_id) cursor."""
+        try:
+            created_at, vendor_id = values
+            return datetime.fromisoformat(created_at), int(vendor_id)
+        except (TypeError, ValueError) as e:
+            raise ValidationError("Malformed pagination cursor") from e
 
 
 class GetVendorDetailUseCase:
     """Get full details for a specific vendor."""
     
-    def __init__(
-        self,
-        vendor_repo: ServiceVendorRepository,
-        image_repo: VendorImageRepository,
-    ):
+    def __init__(self, vendor_repo: ServiceVendorRepository):
         self.vendor_repo = vendor_repo
-        self.image_repo = image_repo
     
-    def execute(self, vendor_id: int) -> VendorDetailDTO:
-        """Get vendor details including images and metadata."""
-        vendor = self.vendor_repo.find_by_id(vendor_id)
+    def execute(self, vendor_id: int) -> bytes:
+        """
+        Get vendor details including images and metadata.
         
-        if not vendor:
-            raise ResourceNotFoundError(f"Vendor {vendor_id} not found")
-        
-        # Get hero images
-        hero_images = self.image_repo.find_hero_images(vendor_id)
-        hero_dtos = [
-            VendorImageDTO(
-                id=img.image_id,
-                image_type=img.image_type,
-                url=img.image_url,
-                thumbnail_url=img.thumbnail_url,
-                caption=img.caption,
-                display_order=img.display_order,
-            )
-            for img in hero_images
-        ]
+        Returns the VendorDetailDTO document as JSON bytes, built by the
+        database in one query, for the read-only detail endpoints to return
+        as-is.
+        """
+        detail = self.vendor_repo.get_detail_json(vendor_id)
         
-        # Get gallery images
-        gallery_images = self.image_repo.find_gallery_images(vendor_id)
-        gallery_dtos = [
-            VendorImageDTO(
-                id=img.image_id,
-                image_type=img.image_type,
-                url=img.image_url,
-                thumbnail_url=img.thumbnail_url,
-                caption=img.caption,
-                display_order=img.display_order,
-            )
-            for img in gallery_images
-        ]
+        if detail is None:
+            raise ResourceNotFoundError(f"Vendor {vendor_id} not found")
         
-        return VendorDetailDTO(
-            id=vendor.vendor_id,
-            category_id=vendor.category_id,
-            category_slug=vendor.category_slug,
-            category_name=vendor.category_name,
-            name=vendor.name,
-            description=vendor.description,
-            address=vendor.address,
-            phone=vendor.phone,
-            website=vendor.website,
-            whatsapp=vendor.whatsapp,
-            rating=vendor.rating,
-            hero_images=hero_dtos,
-            gallery_images=gallery_dtos,
-            metadata=vendor.metadata,
-            is_active=vendor.is_active,
-            created_at=vendor.created_at,
-            updated_at=vendor.updated_at,
-        )
+        return detail
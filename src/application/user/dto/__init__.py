@@ -1,2 +1,27 @@
 """User DTOs - Data Transfer Objects for API contracts."""
 
+from .user_dto import (
+    UserCreateRequest,
+    UserLoginRequest,
+    UserResponse,
+    UserUpdateRequest,
+    AdminUserUpdateRequest,
+    UserListResponse,
+    ChangePasswordRequest,
+    ChangePasswordResponse,
+    DeleteAccountResponse,
+    TokenResponse,
+)
+
+__all__ = [
+    "UserCreateRequest",
+    "UserLoginRequest",
+    "UserResponse",
+    "UserUpdateRequest",
+    "AdminUserUpdateRequest",
+    "UserListResponse",
+    "ChangePasswordRequest",
+    "ChangePasswordResponse",
+    "DeleteAccountResponse",
+    "TokenResponse",
+]
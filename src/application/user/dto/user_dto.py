@@ -4,12 +4,45 @@ These are separate from domain entities. They handle serialization/deserializati
 and API request/response formatting.
 """
 
-from typing import Optional, List
+import re
+from typing import Any, Optional, List
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from src.domain.plan.entities.plan_tier import PlanTier
 
 
+# Shared OpenAPI example for a user payload (UserResponse, UserListResponse items)
+_USER_EXAMPLE = {
+    "id": 1,
+    "email": "john.doe@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "full_name": "John Doe",
+    "phone_number": "+966501234567",
+    "tier": "Lifestyle",
+    "is_active": True,
+    "is_admin": False,
+    "created_at": "2024-01-01T12:00:00Z",
+    "updated_at": "2024-01-15T15:30:00Z",
+}
+
+
+def _normalize_email(value: str) -> str:
+    """Canonical form for stored and looked-up emails."""
+    return value.strip().lower()
+
+
+def _normalize_phone(value: Optional[str]) -> Optional[str]:
+    """Drop spacing and punctuation, keeping a leading '+' country prefix."""
+    if value is None:
+        return None
+    value = value.strip()
+    digits = re.sub(r"\D", "", value)
+    if not digits:
+        return None
+    return "+" + digits if value.startswith("+") else digits
+
+
 class UserCreateRequest(BaseModel):
     """Request DTO for user registration."""
     
@@ -19,6 +52,17 @@ class UserCreateRequest(BaseModel):
     last_name: str = Field(..., min_length=1, description="Last name")
     phone_number: Optional[str] = Field(None, description="Phone number")
     
+    # Normalized here so repositories only ever see canonical values
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return _normalize_email(value)
+    
+    @field_validator("phone_number")
+    @classmethod
+    def normalize_phone(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_phone(value)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -37,6 +81,11 @@ class UserLoginRequest(BaseModel):
     email: EmailStr = Field(..., description="User email address")
     password: str = Field(..., description="User password")
     
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, value: str) -> str:
+        return _normalize_email(value)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -63,21 +112,24 @@ class UserResponse(BaseModel):
     
     class Config:
         from_attributes = True  # orm_mode in Pydantic v2
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "email": "john.doe@example.com",
-                "first_name": "John",
-                "last_name": "Doe",
-                "full_name": "John Doe",
-                "phone_number": "+966501234567",
-                "tier": "Lifestyle",
-                "is_active": True,
-                "is_admin": False,
-                "created_at": "2024-01-01T12:00:00Z",
-                "updated_at": "2024-01-15T15:30:00Z",
-            }
-        }
+        json_schema_extra = {"example": _USER_EXAMPLE}
+    
+    @classmethod
+    def from_entity(cls, user: Any) -> "UserResponse":
+        """Build from a User entity without re-validating trusted fields."""
+        return cls.model_construct(
+            id=user.user_id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            full_name=user.full_name,
+            phone_number=user.phone_number,
+            tier=user.tier,
+            is_active=user.is_active,
+            is_admin=user.is_admin,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
 
 
 class UserUpdateRequest(BaseModel):
@@ -87,6 +139,11 @@ class UserUpdateRequest(BaseModel):
     first_name: Optional[str] = Field(None, min_length=1, description="First name")
     last_name: Optional[str] = Field(None, min_length=1, description="Last name")
     
+    @field_validator("phone_number")
+    @classmethod
+    def normalize_phone(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_phone(value)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -107,6 +164,11 @@ class AdminUserUpdateRequest(BaseModel):
     is_active: Optional[bool] = Field(None, description="Whether user is active")
     is_admin: Optional[bool] = Field(None, description="Whether user is an admin")
     
+    @field_validator("phone_number")
+    @classmethod
+    def normalize_phone(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_phone(value)
+    
     class Config:
         json_schema_extra = {
             "example": {
@@ -131,21 +193,7 @@ class UserListResponse(BaseModel):
     class Config:
         json_schema_extra = {
             "example": {
-                "items": [
-                    {
-                        "id": 1,
-                        "email": "john.doe@example.com",
-                        "first_name": "John",
-                        "last_name": "Doe",
-                        "full_name": "John Doe",
-                        "phone_number": "+966501234567",
-                        "tier": "Lifestyle",
-                        "is_active": True,
-                        "is_admin": False,
-                        "created_at": "2024-01-01T12:00:00Z",
-                        "updated_at": "2024-01-15T15:30:00Z",
-                    }
-                ],
+                "items": [_USER_EXAMPLE],
                 "total": 50,
                 "skip": 0,
                 "limit": 20,
@@ -0,0 +1,27 @@
+"""User use cases."""
+
+from .user_use_cases import (
+    CreateUserUseCase,
+    ListAllUsersUseCase,
+    GetUserByIdUseCase,
+    UpdateUserUseCase,
+    DeleteUserUseCase,
+    CreateAdminUserUseCase,
+    AuthenticateUserUseCase,
+    GetUserUseCase,
+    ChangePasswordUseCase,
+    DeleteAccountUseCase,
+)
+
+__all__ = [
+    "CreateUserUseCase",
+    "ListAllUsersUseCase",
+    "GetUserByIdUseCase",
+    "UpdateUserUseCase",
+    "DeleteUserUseCase",
+    "CreateAdminUserUseCase",
+    "AuthenticateUserUseCase",
+    "GetUserUseCase",
+    "ChangePasswordUseCase",
+    "DeleteAccountUseCase",
+]
@@ -13,9 +13,8 @@ from src.application.user.dto.user_dto import (
     AdminUserUpdateRequest,
     UserListResponse,
 )
-from src.domain.user.entities.user import User
 from src.domain.user.repository.user_repository import UserRepository
-from src.domain.shared.exceptions import InvalidUserError, DuplicateResourceError, ResourceNotFoundError
+from src.domain.shared.exceptions import InvalidUserError, ResourceNotFoundError
 from src.shared.utils.password_utils import hash_password
 from src.infrastructure.auth.jwt_handler import create_access_token
 import logging
@@ -23,6 +22,25 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _create_user(user_repository: UserRepository, request: UserCreateRequest, is_admin: bool = False):
+    """Hash the password and insert the user; shared by the create use cases."""
+    # Hash password before touching the DB: bcrypt is slow CPU work and
+    # shouldn't run while the session holds a pooled connection
+    hashed_pwd = hash_password(request.password)
+
+    # Insert the user; the database assigns the ID. Duplicate emails are
+    # rejected by the unique constraint (DuplicateResourceError), so no
+    # lookup round trip is needed for the common, unique-email case.
+    return user_repository.create(
+        email=request.email,
+        hashed_password=hashed_pwd,
+        first_name=request.first_name,
+        last_name=request.last_name,
+        phone_number=request.phone_number,
+        is_admin=is_admin,
+    )
+
+
 class CreateUserUseCase:
     """User registration use case."""
 
@@ -41,45 +59,12 @@ class CreateUserUseCase:
         Raises:
             DuplicateResourceError: If email already exists
         """
-        # Check for duplicate email
-        existing_user = self._user_repository.find_by_email(request.email)
-        if existing_user:
-            raise DuplicateResourceError(f"User with email {request.email} already exists")
-
-        # Hash password
-        hashed_pwd = hash_password(request.password)
-
-        # Create User entity
-        user = User(
-            user_id=999999,  # Temporary, will be replaced by DB
-            email=request.email,
-            hashed_password=hashed_pwd,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            phone_number=request.phone_number,
-        )
+        saved_user = _create_user(self._user_repository, request)
 
-        # Save user
-        saved_user = self._user_repository.save(user)
-
-        # Simple logging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"User created: {saved_user.email}")
+        logger.info("User created: %s", saved_user.email)
 
         # Return response DTO
-        return UserResponse(
-            id=saved_user.user_id,
-            email=saved_user.email,
-            first_name=saved_user.first_name,
-            last_name=saved_user.last_name,
-            full_name=f"{saved_user.first_name} {saved_user.last_name}",
-            phone_number=saved_user.phone_number,
-            tier=getattr(saved_user, 'tier', None),
-            is_active=getattr(saved_user, 'is_active', True),
-            created_at=saved_user.created_at,
-            updated_at=saved_user.updated_at,
-        )
+        return UserResponse.from_entity(saved_user)
 
 
 class ListAllUsersUseCase:
@@ -98,25 +83,9 @@ class ListAllUsersUseCase:
         Returns:
             UserListResponse with paginated users
         """
-        users = self._user_repository.find_all(skip=skip, limit=limit)
-        total = self._user_repository.count_all()
+        users, total = self._user_repository.find_page_projection(skip=skip, limit=limit)
         
-        user_responses = [
-            UserResponse(
-                id=user.user_id,
-                email=user.email,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                full_name=f"{user.first_name} {user.last_name}",
-                phone_number=user.phone_number,
-                tier=getattr(user, 'tier', None),
-                is_active=getattr(user, 'is_active', True),
-                is_admin=getattr(user, 'is_admin', False),
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
-            for user in users
-        ]
+        user_responses = [UserResponse.from_entity(user) for user in users]
         
         return UserListResponse(
             items=user_responses,
@@ -144,23 +113,11 @@ class GetUserByIdUseCase:
         Raises:
             ResourceNotFoundError: If user not found
         """
-        user = self._user_repository.find_by_id(user_id)
+        user = self._user_repository.find_projection_by_id(user_id)
         if not user:
             raise ResourceNotFoundError(f"User {user_id} not found")
 
-        return UserResponse(
-            id=user.user_id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            full_name=f"{user.first_name} {user.last_name}",
-            phone_number=user.phone_number,
-            tier=getattr(user, 'tier', None),
-            is_active=getattr(user, 'is_active', True),
-            is_admin=getattr(user, 'is_admin', False),
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return UserResponse.from_entity(user)
 
 
 class UpdateUserUseCase:
@@ -182,42 +139,20 @@ class UpdateUserUseCase:
         Raises:
             ResourceNotFoundError: If user not found
         """
-        user = self._user_repository.find_by_id(user_id)
-        if not user:
+        # Update only the fields provided; one UPDATE ... RETURNING also
+        # tells us whether the user exists
+        changes = {
+            field: value
+            for field, value in request.model_dump().items()
+            if value is not None
+        }
+        updated_user = self._user_repository.update_fields(user_id, changes)
+        if not updated_user:
             raise ResourceNotFoundError(f"User {user_id} not found")
-
-        # Update fields if provided
-        if request.first_name is not None:
-            user.first_name = request.first_name
-        if request.last_name is not None:
-            user.last_name = request.last_name
-        if request.phone_number is not None:
-            user.phone_number = request.phone_number
-        if request.tier is not None:
-            user.tier = request.tier
-        if request.is_active is not None:
-            user.is_active = request.is_active
-        if request.is_admin is not None:
-            user.is_admin = request.is_admin
-
-        # Save changes
-        updated_user = self._user_repository.update(user)
         
-        logger.info(f"User updated: {updated_user.email}")
-
-        return UserResponse(
-            id=updated_user.user_id,
-            email=updated_user.email,
-            first_name=updated_user.first_name,
-            last_name=updated_user.last_name,
-            full_name=f"{updated_user.first_name} {updated_user.last_name}",
-            phone_number=updated_user.phone_number,
-            tier=getattr(updated_user, 'tier', None),
-            is_active=getattr(updated_user, 'is_active', True),
-            is_admin=getattr(updated_user, 'is_admin', False),
-            created_at=updated_user.created_at,
-            updated_at=updated_user.updated_at,
-        )
+        logger.info("User updated: %s", updated_user.email)
+
+        return UserResponse.from_entity(updated_user)
 
 
 class DeleteUserUseCase:
@@ -238,20 +173,15 @@ class DeleteUserUseCase:
         Raises:
             ResourceNotFoundError: If user not found
         """
-        user = self._user_repository.find_by_id(user_id)
-        if not user:
+        # The DELETE's row count doubles as the existence check
+        if not self._user_repository.delete(user_id):
             raise ResourceNotFoundError(f"User {user_id} not found")
 
-        success = self._user_repository.delete(user_id)
-
-        if success:
-            logger.info(f"User deleted by admin: {user.email}")
-            return DeleteAccountResponse(
-                success=True,
-                message="User deleted successfully"
-            )
-        else:
-            raise InvalidUserError("Failed to delete user")
+        logger.info("User deleted by admin: %s", user_id)
+        return DeleteAccountResponse(
+            success=True,
+            message="User deleted successfully"
+        )
 
 
 class CreateAdminUserUseCase:
@@ -273,44 +203,12 @@ class CreateAdminUserUseCase:
         Raises:
             DuplicateResourceError: If email already exists
         """
-        # Check for duplicate email
-        existing_user = self._user_repository.find_by_email(request.email)
-        if existing_user:
-            raise DuplicateResourceError(f"User with email {request.email} already exists")
-
-        # Hash password
-        hashed_pwd = hash_password(request.password)
-
-        # Create User entity
-        user = User(
-            user_id=999999,  # Temporary, will be replaced by DB
-            email=request.email,
-            hashed_password=hashed_pwd,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            phone_number=request.phone_number,
-        )
-        user.is_admin = is_admin
+        saved_user = _create_user(self._user_repository, request, is_admin=is_admin)
 
-        # Save to database
-        saved_user = self._user_repository.save(user)
-
-        logger.info(f"User created by admin: {saved_user.email} (admin={is_admin})")
+        logger.info("User created by admin: %s (admin=%s)", saved_user.email, is_admin)
 
         # Return response DTO
-        return UserResponse(
-            id=saved_user.user_id,
-            email=saved_user.email,
-            first_name=saved_user.first_name,
-            last_name=saved_user.last_name,
-            full_name=f"{saved_user.first_name} {saved_user.last_name}",
-            phone_number=saved_user.phone_number,
-            tier=getattr(saved_user, 'tier', None),
-            is_active=getattr(saved_user, 'is_active', True),
-            is_admin=getattr(saved_user, 'is_admin', False),
-            created_at=saved_user.created_at,
-            updated_at=saved_user.updated_at,
-        )
+        return UserResponse.from_entity(saved_user)
 
 
 class AuthenticateUserUseCase:
@@ -345,30 +243,16 @@ class AuthenticateUserUseCase:
             data={
                 "sub": str(user.user_id),
                 "email": user.email,
-                "is_admin": getattr(user, 'is_admin', False),
+                "is_admin": user.is_admin,
             },
             expires_delta=timedelta(hours=24),
         )
 
-        # Simple logging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"User authenticated: {user.email}")
+        logger.info("User authenticated: %s", user.email)
 
         # Return response
         return (
-            UserResponse(
-                id=user.user_id,
-                email=user.email,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                full_name=f"{user.first_name} {user.last_name}",
-                phone_number=user.phone_number,
-                tier=getattr(user, 'tier', None),
-                is_active=getattr(user, 'is_active', True),
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            ),
+            UserResponse.from_entity(user),
             token,
         )
 
@@ -391,22 +275,11 @@ class GetUserUseCase:
         Raises:
             InvalidUserError: If user not found
         """
-        user = self._user_repository.find_by_id(user_id)
+        user = self._user_repository.find_projection_by_id(user_id)
         if not user:
             raise InvalidUserError(f"User {user_id} not found")
 
-        return UserResponse(
-            id=user.user_id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            full_name=f"{user.first_name} {user.last_name}",
-            phone_number=user.phone_number,
-            tier=getattr(user, 'tier', None),
-            is_active=getattr(user, 'is_active', True),
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
+        return UserResponse.from_entity(user)
 
 
 class ChangePasswordUseCase:
@@ -443,9 +316,7 @@ class ChangePasswordUseCase:
         # Save updated user
         self._user_repository.update(user)
 
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"Password changed for user: {user.email}")
+        logger.info("Password changed for user: %s", user.email)
 
         return ChangePasswordResponse(
             success=True,
@@ -471,22 +342,12 @@ class DeleteAccountUseCase:
         Raises:
             InvalidUserError: If user not found
         """
-        user = self._user_repository.find_by_id(user_id)
-        if not user:
+        # Delete user; the DELETE's row count doubles as the existence check
+        if not self._user_repository.delete(user_id):
             raise InvalidUserError(f"User {user_id} not found")
 
-        # Delete user
-        success = self._user_repository.delete(user_id)
-
-        import logging
-        logger = logging.getLogger(__name__)
-        
-        if success:
-            logger.info(f"Account deleted for user: {user.email}")
-            return DeleteAccountResponse(
-                success=True,
-                message="Account deleted successfully"
-            )
-        else:
-            logger.error(f"Failed to delete account for user: {user.email}")
-            raise InvalidUserError("Failed to delete account")
+        logger.info("Account deleted for user: %s", user_id)
+        return DeleteAccountResponse(
+            success=True,
+            message="Account deleted successfully"
+        )
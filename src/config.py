@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -6,12 +7,23 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    db_pool_size: int = 25
+    db_max_overflow: int = 25
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    # Server-side cap per statement, so a runaway query frees its pooled connection
+    db_statement_timeout_ms: int = 60_000
     
     # JWT
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
     
+    # Password hashing: fixed bcrypt cost, or calibrated at startup to take
+    # about bcrypt_target_hash_ms on this host when that is set
+    bcrypt_rounds: int = 12
+    bcrypt_target_hash_ms: Optional[int] = None
+    
     # App
     debug: bool = True
     log_level: str = "INFO"
@@ -21,5 +33,17 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        frozen = True
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process (reads the environment and .env).
+
+    Usable as a FastAPI dependency; tests can override it or call
+    get_settings.cache_clear() after changing the environment.
+    """
+    return Settings()
+
 
-settings = Settings()
+settings = get_settings()
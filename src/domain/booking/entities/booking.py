@@ -1,5 +1,6 @@
 """Booking domain entity."""
 
+import sys
 from datetime import datetime
 from typing import Optional
 from src.domain.shared.exceptions import DomainException
@@ -12,7 +13,26 @@ class InvalidBookingError(DomainException):
 class Booking:
     """Booking aggregate representing a confirmed booking."""
 
-    VALID_STATUSES = ["upcoming", "completed", "cancelled"]
+    VALID_STATUSES = frozenset({"upcoming", "completed", "cancelled"})
+
+    # Allowed (current, target) status changes; completed is final
+    _TRANSITIONS = frozenset({
+        ("upcoming", "upcoming"),
+        ("upcoming", "completed"),
+        ("upcoming", "cancelled"),
+        ("cancelled", "cancelled"),
+        ("cancelled", "upcoming"),
+    })
+    _TRANSITION_ERRORS = {
+        "upcoming": "Cannot change completed booking back to upcoming",
+        "completed": "Only upcoming bookings can be completed",
+        "cancelled": "Cannot cancel a completed booking",
+    }
+
+    __slots__ = (
+        "booking_id", "request_id", "user_id", "vendor_id", "start_at",
+        "end_at", "status", "notes", "created_at", "created_by",
+    )
 
     def __init__(
         self,
@@ -33,7 +53,8 @@ class Booking:
         self.vendor_id = vendor_id
         self.start_at = start_at
         self.end_at = end_at
-        self.status = status
+        # Interned so ORM-loaded statuses compare by identity with the literals
+        self.status = sys.intern(status)
         self.notes = notes
         self.created_at = created_at or datetime.utcnow()
         self.created_by = created_by
@@ -64,15 +85,19 @@ class Booking:
             created_by=created_by,
         )
 
+    def transition_to(self, status: str) -> None:
+        """Move to another status, checked with one lookup in the transition table."""
+        if (self.status, status) not in self._TRANSITIONS:
+            raise InvalidBookingError(
+                self._TRANSITION_ERRORS.get(status, f"Invalid booking status '{status}'")
+            )
+        self.status = sys.intern(status)
+
     def complete(self) -> None:
-        if self.status != "upcoming":
-            raise InvalidBookingError("Only upcoming bookings can be completed")
-        self.status = "completed"
+        self.transition_to("completed")
 
     def cancel(self) -> None:
-        if self.status == "completed":
-            raise InvalidBookingError("Cannot cancel a completed booking")
-        self.status = "cancelled"
+        self.transition_to("cancelled")
 
     def __repr__(self) -> str:
         return f"Booking(id={self.booking_id}, request={self.request_id}, status={self.status})"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Protocol
+from typing import List, Optional, Protocol, Tuple
 
 from src.domain.booking.entities.booking import Booking
 
@@ -20,6 +20,9 @@ class BookingRepository(Protocol):
     def count_by_user_and_status(self, user_id: int, status: Optional[str] = None) -> int:
         ...
 
+    def find_page_by_user_and_status(self, user_id: int, status: Optional[str] = None, skip: int = 0, limit: int = 20) -> Tuple[List[Booking], int]:
+        ...
+
     def find_all(self, status: Optional[str] = None, skip: int = 0, limit: int = 20) -> List[Booking]:
         ...
 
@@ -3,6 +3,7 @@
 from datetime import datetime
 from typing import Optional, List
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.strings import strip_min
 
 
 class InvalidMessageError(DomainException):
@@ -13,7 +14,9 @@ class InvalidMessageError(DomainException):
 class Message:
     """Message value object - belongs to a Conversation."""
     
-    VALID_SENDER_TYPES = ["user", "admin"]
+    __slots__ = ("message_id", "conversation_id", "sender_id", "sender_type", "content", "created_at")
+    
+    VALID_SENDER_TYPES = frozenset({"user", "admin"})
     
     def __init__(
         self,
@@ -29,7 +32,7 @@ class Message:
         self.sender_id = sender_id
         self.sender_type = sender_type
         self.content = content
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = created_at if created_at is not None else datetime.utcnow()
     
     @classmethod
     def create(
@@ -38,20 +41,24 @@ class Message:
         sender_id: int,
         sender_type: str,
         content: str,
+        now: Optional[datetime] = None,
     ) -> "Message":
-        """Create a new message with validation."""
+        """Create a new message with validation.
+        
+        Pass ``now`` to stamp a batch of messages with one captured time.
+        """
         if sender_type not in cls.VALID_SENDER_TYPES:
             raise InvalidMessageError(f"Invalid sender type: {sender_type}")
         
-        if not content or len(content.strip()) == 0:
-            raise InvalidMessageError("Message content cannot be empty")
+        content = strip_min(content, 1, InvalidMessageError, "Message content cannot be empty")
         
         return cls(
             message_id=None,
             conversation_id=conversation_id,
             sender_id=sender_id,
             sender_type=sender_type,
-            content=content.strip(),
+            content=content,
+            created_at=now,
         )
     
     def __repr__(self) -> str:
@@ -61,6 +68,20 @@ class Message:
 class Conversation:
     """Conversation aggregate - chat thread linked to a request."""
     
+    __slots__ = (
+        "conversation_id",
+        "request_id",
+        "user_id",
+        "title",
+        "description",
+        "vendor_id",
+        "vendor_name",
+        "vendor_image_url",
+        "category_slug",
+        "created_at",
+        "messages",
+    )
+    
     def __init__(
         self,
         conversation_id: Optional[int],
@@ -84,19 +105,26 @@ class Conversation:
         self.vendor_name = vendor_name
         self.vendor_image_url = vendor_image_url
         self.category_slug = category_slug
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = created_at if created_at is not None else datetime.utcnow()
         self.messages = messages or []
     
     @classmethod
-    def create(cls, request_id: int, user_id: int) -> "Conversation":
+    def create(cls, request_id: int, user_id: int, now: Optional[datetime] = None) -> "Conversation":
         """Create a new conversation."""
         return cls(
             conversation_id=None,
             request_id=request_id,
             user_id=user_id,
+            created_at=now,
         )
     
-    def add_message(self, sender_id: int, sender_type: str, content: str) -> Message:
+    def add_message(
+        self,
+        sender_id: int,
+        sender_type: str,
+        content: str,
+        now: Optional[datetime] = None,
+    ) -> Message:
         """Add a message to this conversation."""
         if self.conversation_id is None:
             raise InvalidMessageError("Cannot add message to unsaved conversation")
@@ -106,6 +134,7 @@ class Conversation:
             sender_id=sender_id,
             sender_type=sender_type,
             content=content,
+            now=now,
         )
         self.messages.append(message)
         return message
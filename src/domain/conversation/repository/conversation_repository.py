@@ -14,10 +14,12 @@ class ConversationRepository(Protocol):
     def find_by_id(self, conversation_id: int) -> Optional[Conversation]:
         ...
 
-    def find_by_request_id(self, request_id: int) -> Optional[Conversation]:
+    def find_by_request_id(self, request_id: int, with_messages: bool = True) -> Optional[Conversation]:
         ...
 
-    def find_by_user_id(self, user_id: int, skip: int = 0, limit: int = 20) -> List[Conversation]:
+    def find_by_user_id(
+        self, user_id: int, skip: int = 0, limit: int = 20, with_last_message: bool = False
+    ) -> List[Conversation]:
         ...
 
     def find_all(self, skip: int = 0, limit: int = 20) -> List[Conversation]:
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from src.domain.plan.entities.plan_tier import PlanTier
+from src.domain.shared.exceptions import ValidationError
 
 
 @dataclass
@@ -22,11 +23,40 @@ class Plan:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def __post_init__(self):
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        description: str,
+        price: float,
+        duration_days: int,
+        tier: PlanTier,
+        features: Optional[str] = None,
+        is_active: bool = True,
+    ) -> "Plan":
+        """Create a new, validated plan (ID is assigned on save).
+        
+        The plain constructor does no validation, so rows hydrated from
+        the database skip checks they already passed when written.
+        """
+        plan = cls(
+            plan_id=0,
+            name=name,
+            description=description,
+            price=price,
+            duration_days=duration_days,
+            tier=tier,
+            features=features,
+            is_active=is_active,
+        )
+        plan.validate()
+        return plan
+
+    def validate(self) -> None:
         """Validate plan data."""
         if self.price < 0:
-            raise ValueError("Price cannot be negative")
+            raise ValidationError("Price cannot be negative")
         if self.duration_days <= 0:
-            raise ValueError("Duration must be positive")
+            raise ValidationError("Duration must be positive")
         if not isinstance(self.tier, PlanTier):
-            raise ValueError("Tier must be a valid PlanTier enum value")
+            raise ValidationError("Tier must be a valid PlanTier enum value")
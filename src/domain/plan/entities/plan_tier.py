@@ -17,12 +17,14 @@ class PlanTier(str, Enum):
     @classmethod
     def from_price(cls, price: float) -> "PlanTier":
         """Get tier from price point (for backward compatibility)."""
-        price_mapping = {
-            4999: cls.LIFESTYLE,
-            24999: cls.TRAVELLER,
-        }
-        if price >= 24999:
-            return cls.ELITE
-        elif price >= 4999:
-            return cls.TRAVELLER
+        for threshold, tier in _TIER_THRESHOLDS:
+            if price >= threshold:
+                return tier
         return cls.LIFESTYLE
+
+
+# Minimum price for each tier above Lifestyle, highest first
+_TIER_THRESHOLDS = (
+    (24999, PlanTier.ELITE),
+    (4999, PlanTier.TRAVELLER),
+)
@@ -31,15 +31,21 @@ class Subscription:
 
     def is_active(self) -> bool:
         """Check if subscription is currently active."""
-        now = datetime.utcnow()
+        return self.is_active_at(datetime.utcnow())
+
+    def days_remaining(self) -> int:
+        """Calculate days remaining in subscription."""
+        return self.days_remaining_at(datetime.utcnow())
+
+    def is_active_at(self, now: datetime) -> bool:
+        """Check if subscription is active at the given (naive UTC) time."""
         return (
-            self.status == SubscriptionStatus.ACTIVE 
+            self.status is SubscriptionStatus.ACTIVE
             and self.start_date <= now <= self.end_date
         )
 
-    def days_remaining(self) -> int:
-        """Calculate days remaining in subscription."""
-        if not self.is_active():
+    def days_remaining_at(self, now: datetime) -> int:
+        """Days remaining at the given time; pass one ``now`` across a batch."""
+        if not self.is_active_at(now):
             return 0
-        delta = self.end_date - datetime.utcnow()
-        return max(0, delta.days)
+        return max(0, (self.end_date - now).days)
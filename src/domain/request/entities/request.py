@@ -1,8 +1,11 @@
 """Request domain entity."""
 
+import sys
 from datetime import datetime
 from typing import Optional
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.strings import strip_min
+from src.domain.shared.timestamps import default_timestamps
 
 
 class InvalidRequestError(DomainException):
@@ -13,7 +16,19 @@ class InvalidRequestError(DomainException):
 class Request:
     """Request aggregate - represents a concierge service request."""
     
-    VALID_STATUSES = ["new", "assigned", "in_progress", "fulfilled", "cancelled"]
+    __slots__ = (
+        "request_id",
+        "user_id",
+        "title",
+        "category_slug",
+        "description",
+        "status",
+        "vendor_id",
+        "created_at",
+        "updated_at",
+    )
+    
+    VALID_STATUSES = frozenset({"new", "assigned", "in_progress", "fulfilled", "cancelled"})
     
     def __init__(
         self,
@@ -32,10 +47,10 @@ class Request:
         self.title = title
         self.category_slug = category_slug
         self.description = description
-        self.status = status
+        # Interned so status checks against the literals compare by identity first
+        self.status = sys.intern(status)
         self.vendor_id = vendor_id
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.created_at, self.updated_at = default_timestamps(created_at, updated_at)
     
     @classmethod
     def create(
@@ -45,20 +60,24 @@ class Request:
         category_slug: str,
         description: str,
         vendor_id: Optional[int] = None,
+        now: Optional[datetime] = None,
     ) -> "Request":
-        """Factory method to create a new request with validation."""
-        # Validate description
-        if not description or len(description.strip()) < 10:
-            raise InvalidRequestError("Description must be at least 10 characters")
+        """Factory method to create a new request with validation.
+        
+        Pass ``now`` to stamp a batch of requests with one captured time.
+        """
+        description = strip_min(description, 10, InvalidRequestError, "Description must be at least 10 characters")
         
         return cls(
             request_id=None,
             user_id=user_id,
             title=title.strip(),
             category_slug=category_slug,
-            description=description.strip(),
+            description=description,
             status="new",
             vendor_id=vendor_id,
+            created_at=now,
+            updated_at=now,
         )
     
     def assign(self) -> None:
@@ -84,7 +103,7 @@ class Request:
     
     def cancel(self) -> None:
         """Cancel the request."""
-        if self.status in ["fulfilled", "cancelled"]:
+        if self.status in ("fulfilled", "cancelled"):
             raise InvalidRequestError("Cannot cancel fulfilled or already cancelled requests")
         self.status = "cancelled"
         self.updated_at = datetime.utcnow()
@@ -3,6 +3,11 @@
 from datetime import datetime
 from typing import Optional
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.strings import strip_min
+
+
+# Slug separators normalized to underscores in one pass
+_SLUG_TABLE = str.maketrans({"-": "_", " ": "_"})
 
 
 class InvalidCategoryError(DomainException):
@@ -13,8 +18,10 @@ class InvalidCategoryError(DomainException):
 class ServiceCategory:
     """ServiceCategory entity - represents a type of concierge service."""
     
+    __slots__ = ("category_id", "slug", "name", "display_order", "icon_url", "created_at")
+    
     # Predefined category slugs
-    VALID_SLUGS = ["restaurant", "private_jet", "flight", "car", "hotel", "car_driver"]
+    VALID_SLUGS = frozenset({"restaurant", "private_jet", "flight", "car", "hotel", "car_driver"})
     
     def __init__(
         self,
@@ -30,39 +37,40 @@ class ServiceCategory:
         self.name = name
         self.display_order = display_order
         self.icon_url = icon_url
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = created_at if created_at is not None else datetime.utcnow()
     
     @classmethod
     def create(cls, slug: str, name: str, display_order: int = 0, icon_url: Optional[str] = None) -> "ServiceCategory":
         """Factory method to create a new category with validation."""
-        if not slug or len(slug.strip()) < 2:
-            raise InvalidCategoryError("Category slug must be at least 2 characters")
-        
-        if not name or len(name.strip()) < 2:
-            raise InvalidCategoryError("Category name must be at least 2 characters")
+        slug = strip_min(slug, 2, InvalidCategoryError, "Category slug must be at least 2 characters")
+        name = strip_min(name, 2, InvalidCategoryError, "Category name must be at least 2 characters")
         
         # Normalize slug to lowercase with underscores
-        normalized_slug = slug.strip().lower().replace("-", "_").replace(" ", "_")
+        normalized_slug = slug.lower().translate(_SLUG_TABLE)
         
         return cls(
             category_id=None,
             slug=normalized_slug,
-            name=name.strip(),
+            name=name,
             display_order=display_order,
             icon_url=icon_url,
         )
     
-    def update(self, name: Optional[str] = None, display_order: Optional[int] = None, icon_url: Optional[str] = None) -> None:
-        """Update category details."""
+    def update(self, name: Optional[str] = None, display_order: Optional[int] = None, icon_url: Optional[str] = None) -> bool:
+        """Update category details. Returns True if any field actually changed."""
+        changed = False
         if name is not None:
-            if len(name.strip()) < 2:
-                raise InvalidCategoryError("Category name must be at least 2 characters")
-            self.name = name.strip()
+            name = strip_min(name, 2, InvalidCategoryError, "Category name must be at least 2 characters")
+            changed |= self.name != name
+            self.name = name
         
         if display_order is not None:
+            changed |= self.display_order != display_order
             self.display_order = display_order
         if icon_url is not None:
+            changed |= self.icon_url != icon_url
             self.icon_url = icon_url
+        return changed
     
     def __repr__(self) -> str:
         return f"ServiceCategory(id={self.category_id}, slug={self.slug}, name={self.name}, icon={self.icon_url})"
@@ -3,6 +3,11 @@
 from datetime import datetime
 from typing import Optional
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.strings import strip_min
+
+
+# Slug separators normalized to underscores in one pass
+_SLUG_TABLE = str.maketrans({"-": "_", " ": "_"})
 
 
 class InvalidSubcategoryError(DomainException):
@@ -13,6 +18,8 @@ class InvalidSubcategoryError(DomainException):
 class ServiceSubcategory:
     """ServiceSubcategory entity - represents a sub-type of a service category."""
     
+    __slots__ = ("subcategory_id", "category_id", "slug", "name", "display_order", "icon_url", "created_at")
+    
     def __init__(
         self,
         subcategory_id: Optional[int],
@@ -29,7 +36,7 @@ class ServiceSubcategory:
         self.name = name
         self.display_order = display_order
         self.icon_url = icon_url
-        self.created_at = created_at or datetime.utcnow()
+        self.created_at = created_at if created_at is not None else datetime.utcnow()
     
     @classmethod
     def create(
@@ -41,23 +48,20 @@ class ServiceSubcategory:
         icon_url: Optional[str] = None,
     ) -> "ServiceSubcategory":
         """Factory method to create a new subcategory with validation."""
-        if not slug or len(slug.strip()) < 2:
-            raise InvalidSubcategoryError("Subcategory slug must be at least 2 characters")
-        
-        if not name or len(name.strip()) < 2:
-            raise InvalidSubcategoryError("Subcategory name must be at least 2 characters")
+        slug = strip_min(slug, 2, InvalidSubcategoryError, "Subcategory slug must be at least 2 characters")
+        name = strip_min(name, 2, InvalidSubcategoryError, "Subcategory name must be at least 2 characters")
         
         if category_id <= 0:
             raise InvalidSubcategoryError("Category ID must be a positive integer")
         
         # Normalize slug to lowercase with underscores
-        normalized_slug = slug.strip().lower().replace("-", "_").replace(" ", "_")
+        normalized_slug = slug.lower().translate(_SLUG_TABLE)
         
         return cls(
             subcategory_id=None,
             category_id=category_id,
             slug=normalized_slug,
-            name=name.strip(),
+            name=name,
             display_order=display_order,
             icon_url=icon_url,
         )
@@ -71,9 +75,7 @@ class ServiceSubcategory:
     ) -> None:
         """Update subcategory details."""
         if name is not None:
-            if len(name.strip()) < 2:
-                raise InvalidSubcategoryError("Subcategory name must be at least 2 characters")
-            self.name = name.strip()
+            self.name = strip_min(name, 2, InvalidSubcategoryError, "Subcategory name must be at least 2 characters")
         
         if category_id is not None:
             if category_id <= 0:
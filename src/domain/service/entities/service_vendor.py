@@ -3,6 +3,19 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.strings import strip_min, strip_or_none
+from src.domain.shared.timestamps import default_timestamps
+
+
+# Validation thresholds for vendor fields
+MIN_NAME_LENGTH = 2
+MIN_DESCRIPTION_LENGTH = 10
+MIN_RATING = 0.0
+MAX_RATING = 5.0
+
+_NAME_ERROR = f"Vendor name must be at least {MIN_NAME_LENGTH} characters"
+_DESCRIPTION_ERROR = f"Vendor description must be at least {MIN_DESCRIPTION_LENGTH} characters"
+_RATING_ERROR = f"Rating must be between {MIN_RATING:g} and {MAX_RATING:g}"
 
 
 class InvalidVendorError(DomainException):
@@ -13,6 +26,12 @@ class InvalidVendorError(DomainException):
 class ServiceVendor:
     """ServiceVendor aggregate - represents a service provider (restaurant, hotel, etc.)."""
     
+    __slots__ = (
+        "vendor_id", "category_id", "name", "description", "address", "phone",
+        "website", "whatsapp", "city", "rating", "_metadata", "is_active",
+        "created_at", "updated_at", "category_slug", "category_name",
+    )
+    
     def __init__(
         self,
         vendor_id: Optional[int],
@@ -43,14 +62,59 @@ class ServiceVendor:
         self.whatsapp = whatsapp
         self.city = city
         self.rating = rating
-        self.metadata = metadata or {}
+        # Left None until first access; list pages load vendors without metadata
+        self._metadata = metadata
         self.is_active = is_active
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.created_at, self.updated_at = default_timestamps(created_at, updated_at)
         # Transient
         self.category_slug = category_slug
         self.category_name = category_name
     
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        vendor_id: int,
+        category_id: int,
+        name: str,
+        description: str,
+        address: Optional[str],
+        phone: Optional[str],
+        website: Optional[str],
+        whatsapp: Optional[str],
+        city: Optional[str],
+        rating: float,
+        metadata: Optional[Dict[str, Any]],
+        is_active: bool,
+        created_at: datetime,
+        updated_at: datetime,
+        category_slug: Optional[str] = None,
+        category_name: Optional[str] = None,
+    ) -> "ServiceVendor":
+        """Hydrate a vendor loaded from storage.
+        
+        Every column is supplied by the row, so the defaulting in __init__
+        is skipped.
+        """
+        self = object.__new__(cls)
+        self.vendor_id = vendor_id
+        self.category_id = category_id
+        self.name = name
+        self.description = description
+        self.address = address
+        self.phone = phone
+        self.website = website
+        self.whatsapp = whatsapp
+        self.city = city
+        self.rating = rating
+        self._metadata = metadata
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.category_slug = category_slug
+        self.category_name = category_name
+        return self
+    
     @classmethod
     def create(
         cls,
@@ -66,33 +130,39 @@ class ServiceVendor:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> "ServiceVendor":
         """Factory method to create a new vendor with validation."""
-        # Validate name
-        if not name or len(name.strip()) < 2:
-            raise InvalidVendorError("Vendor name must be at least 2 characters")
-        
-        # Validate description
-        if not description or len(description.strip()) < 10:
-            raise InvalidVendorError("Vendor description must be at least 10 characters")
+        name = strip_min(name, MIN_NAME_LENGTH, InvalidVendorError, _NAME_ERROR)
+        description = strip_min(description, MIN_DESCRIPTION_LENGTH, InvalidVendorError, _DESCRIPTION_ERROR)
         
         # Validate rating
-        if rating < 0 or rating > 5:
-            raise InvalidVendorError("Rating must be between 0 and 5")
+        if not MIN_RATING <= rating <= MAX_RATING:
+            raise InvalidVendorError(_RATING_ERROR)
         
         return cls(
             vendor_id=None,
             category_id=category_id,
-            name=name.strip(),
-            description=description.strip(),
-            address=address.strip() if address else None,
-            phone=phone.strip() if phone else None,
-            website=website.strip() if website else None,
-            whatsapp=whatsapp.strip() if whatsapp else None,
-            city=city.strip() if city else None,
+            name=name,
+            description=description,
+            address=strip_or_none(address),
+            phone=strip_or_none(phone),
+            website=strip_or_none(website),
+            whatsapp=strip_or_none(whatsapp),
+            city=strip_or_none(city),
             rating=rating,
-            metadata=metadata or {},
+            metadata=metadata,
             is_active=True,
         )
     
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Type-specific data; created empty on first access if absent."""
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+    
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]) -> None:
+        self._metadata = value
+    
     def update(
         self,
         name: Optional[str] = None,
@@ -105,87 +175,115 @@ class ServiceVendor:
         rating: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
         is_active: Optional[bool] = None,
-    ) -> None:
-        """Update vendor details."""
+        now: Optional[datetime] = None,
+    ) -> bool:
+        """Update vendor details.
+        
+        Pass ``now`` to stamp a batch of vendors with one captured time.
+        
+        Returns:
+            True if any field actually changed (updated_at is bumped only then)
+        """
+        changed = False
+        
         if name is not None:
-            if len(name.strip()) < 2:
-                raise InvalidVendorError("Vendor name must be at least 2 characters")
-            self.name = name.strip()
+            name = strip_min(name, MIN_NAME_LENGTH, InvalidVendorError, _NAME_ERROR)
+            changed |= self._assign("name", name)
         
         if description is not None:
-            if len(description.strip()) < 10:
-                raise InvalidVendorError("Vendor description must be at least 10 characters")
-            self.description = description.strip()
+            description = strip_min(description, MIN_DESCRIPTION_LENGTH, InvalidVendorError, _DESCRIPTION_ERROR)
+            changed |= self._assign("description", description)
         
         if address is not None:
-            self.address = address.strip() if address else None
+            changed |= self._assign("address", strip_or_none(address))
         
         if phone is not None:
-            self.phone = phone.strip() if phone else None
+            changed |= self._assign("phone", strip_or_none(phone))
         
         if website is not None:
-            self.website = website.strip() if website else None
+            changed |= self._assign("website", strip_or_none(website))
         
         if whatsapp is not None:
-            self.whatsapp = whatsapp.strip() if whatsapp else None
+            changed |= self._assign("whatsapp", strip_or_none(whatsapp))
         
         if city is not None:
-            self.city = city.strip() if city else None
+            changed |= self._assign("city", strip_or_none(city))
         
         if rating is not None:
-            if rating < 0 or rating > 5:
-                raise InvalidVendorError("Rating must be between 0 and 5")
-            self.rating = rating
+            if not MIN_RATING <= rating <= MAX_RATING:
+                raise InvalidVendorError(_RATING_ERROR)
+            changed |= self._assign("rating", rating)
         
         if metadata is not None:
-            self.metadata = metadata
+            changed |= self._assign("metadata", metadata)
         
         if is_active is not None:
-            self.is_active = is_active
+            changed |= self._assign("is_active", is_active)
         
-        self.updated_at = datetime.utcnow()
+        if changed:
+            self.updated_at = now or datetime.utcnow()
+        return changed
+    
+    def _assign(self, field: str, value: Any) -> bool:
+        """Set a field if the value differs. Returns True if it changed."""
+        if getattr(self, field) == value:
+            return False
+        setattr(self, field, value)
+        return True
     
-    def update_metadata(self, key: str, value: Any) -> None:
+    def update_metadata(self, key: str, value: Any, now: Optional[datetime] = None) -> None:
         """Update a specific metadata field."""
         self.metadata[key] = value
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
-    def add_dish(self, name: str, category: str, image_base64: Optional[str] = None) -> None:
-        """Add a dish to restaurant metadata."""
-        if "dishes" not in self.metadata:
-            self.metadata["dishes"] = []
+    def add_dish(
+        self,
+        name: str,
+        category: str,
+        image_base64: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Add a dish to restaurant metadata.
         
-        dish = {"name": name, "category": category}
+        Pass ``now`` when adding several dishes so they share one timestamp.
+        """
+        dishes = self.metadata.setdefault("dishes", [])
         if image_base64:
-            dish["image_base64"] = image_base64
-        
-        self.metadata["dishes"].append(dish)
-        self.updated_at = datetime.utcnow()
+            dishes.append({"name": name, "category": category, "image_base64": image_base64})
+        else:
+            dishes.append({"name": name, "category": category})
+        self.updated_at = now or datetime.utcnow()
     
-    def remove_dish(self, dish_name: str) -> bool:
-        """Remove a dish from restaurant metadata by name."""
-        if "dishes" not in self.metadata:
+    def remove_dish(self, dish_name: str, now: Optional[datetime] = None) -> bool:
+        """Remove a dish from restaurant metadata by name.
+        
+        Compacts the dishes list in place instead of copying it.
+        """
+        dishes = self.metadata.get("dishes")
+        if not dishes:
             return False
         
-        original_count = len(self.metadata["dishes"])
-        self.metadata["dishes"] = [
-            d for d in self.metadata["dishes"] if d.get("name") != dish_name
-        ]
+        write = 0
+        for dish in dishes:
+            if dish.get("name") != dish_name:
+                dishes[write] = dish
+                write += 1
         
-        if len(self.metadata["dishes"]) < original_count:
-            self.updated_at = datetime.utcnow()
+        if write < len(dishes):
+            del dishes[write:]
+            self.updated_at = now or datetime.utcnow()
             return True
         return False
     
-    def deactivate(self) -> None:
+    def deactivate(self, now: Optional[datetime] = None) -> None:
         """Soft delete - deactivate the vendor."""
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
-    def activate(self) -> None:
+    def activate(self, now: Optional[datetime] = None) -> None:
         """Reactivate the vendor."""
         self.is_active = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now or datetime.utcnow()
     
     def __repr__(self) -> str:
         return f"ServiceVendor(id={self.vendor_id}, name={self.name}, category_id={self.category_id})"
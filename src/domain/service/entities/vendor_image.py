@@ -1,9 +1,10 @@
 """VendorImage domain entity."""
 
+import sys
 from datetime import datetime
 from typing import Optional
-from urllib.parse import urlparse
 from src.domain.shared.exceptions import DomainException
+from src.domain.shared.urls import is_http_url
 
 
 class InvalidImageError(DomainException):
@@ -11,29 +12,15 @@ class InvalidImageError(DomainException):
     pass
 
 
-def _validate_url(url: str) -> bool:
-    """Validate URL format and scheme."""
-    if not url:
-        return False
-    try:
-        parsed = urlparse(url)
-        # Must have valid scheme and netloc (domain)
-        if parsed.scheme not in ("http", "https"):
-            return False
-        if not parsed.netloc:
-            return False
-        # Basic domain validation - must have at least one dot or be localhost
-        if "." not in parsed.netloc and "localhost" not in parsed.netloc:
-            return False
-        return True
-    except Exception:
-        return False
-
-
 class VendorImage:
     """VendorImage entity - represents hero carousel or gallery images for a vendor."""
     
-    VALID_IMAGE_TYPES = ["hero", "gallery"]
+    __slots__ = (
+        "image_id", "vendor_id", "image_type", "image_url",
+        "thumbnail_url", "caption", "display_order", "created_at",
+    )
+    
+    VALID_IMAGE_TYPES = frozenset({"hero", "gallery"})
     
     def __init__(
         self,
@@ -48,13 +35,39 @@ class VendorImage:
     ):
         self.image_id = image_id
         self.vendor_id = vendor_id
-        self.image_type = image_type
+        # Interned so is_hero/is_gallery compare by identity first
+        self.image_type = sys.intern(image_type)
         self.image_url = image_url
         self.thumbnail_url = thumbnail_url
         self.caption = caption
         self.display_order = display_order
         self.created_at = created_at or datetime.utcnow()
     
+    @classmethod
+    def from_row(
+        cls,
+        *,
+        image_id: int,
+        vendor_id: int,
+        image_type: str,
+        image_url: str,
+        thumbnail_url: Optional[str],
+        caption: Optional[str],
+        display_order: int,
+        created_at: datetime,
+    ) -> "VendorImage":
+        """Hydrate an image loaded from storage, skipping __init__ defaults."""
+        self = object.__new__(cls)
+        self.image_id = image_id
+        self.vendor_id = vendor_id
+        self.image_type = sys.intern(image_type)
+        self.image_url = image_url
+        self.thumbnail_url = thumbnail_url
+        self.caption = caption
+        self.display_order = display_order
+        self.created_at = created_at
+        return self
+    
     @classmethod
     def create(
         cls,
@@ -69,17 +82,17 @@ class VendorImage:
         # Validate image type
         if image_type not in cls.VALID_IMAGE_TYPES:
             raise InvalidImageError(
-                f"Invalid image type: {image_type}. Must be one of {cls.VALID_IMAGE_TYPES}"
+                f"Invalid image type: {image_type}. Must be one of {sorted(cls.VALID_IMAGE_TYPES)}"
             )
         
         # Validate URL format
-        if not _validate_url(image_url):
+        if not is_http_url(image_url):
             raise InvalidImageError(
                 "image_url must be a valid HTTP/HTTPS URL with a proper domain"
             )
         
         # Validate thumbnail URL if provided
-        if thumbnail_url and not _validate_url(thumbnail_url):
+        if thumbnail_url and not is_http_url(thumbnail_url):
             raise InvalidImageError(
                 "thumbnail_url must be a valid HTTP/HTTPS URL with a proper domain"
             )
@@ -1,24 +1,18 @@
 """ServiceVendor repository interface."""
 
-from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Protocol, Tuple
+from src.domain.shared.repository import CrudRepository
 from src.domain.service.entities.service_vendor import ServiceVendor
 
 
-class ServiceVendorRepository(ABC):
-    """Abstract repository for ServiceVendor persistence."""
+class ServiceVendorRepository(CrudRepository[ServiceVendor, int], Protocol):
+    """Repository protocol for ServiceVendor entities."""
     
-    @abstractmethod
-    def save(self, vendor: ServiceVendor) -> ServiceVendor:
-        """Save a vendor and return with generated ID."""
-        pass
+    def find_by_ids(self, vendor_ids: List[int]) -> Dict[int, ServiceVendor]:
+        """Find several vendors in one query, keyed by vendor ID (missing IDs are omitted)."""
+        ...
     
-    @abstractmethod
-    def find_by_id(self, vendor_id: int) -> Optional[ServiceVendor]:
-        """Find vendor by ID."""
-        pass
-    
-    @abstractmethod
     def find_by_category_id(
         self,
         category_id: int,
@@ -27,40 +21,55 @@ class ServiceVendorRepository(ABC):
         active_only: bool = True,
     ) -> Tuple[List[ServiceVendor], int]:
         """Find all vendors for a category with pagination. Returns (vendors, total_count)."""
-        pass
+        ...
     
-    @abstractmethod
     def find_by_category_slug(
         self,
         category_slug: str,
         skip: int = 0,
         limit: int = 20,
         active_only: bool = True,
-    ) -> Tuple[List[ServiceVendor], int]:
-        """Find all vendors for a category by slug with pagination. Returns (vendors, total_count)."""
-        pass
+        city: Optional[str] = None,
+        after: Optional[Tuple[float, str, int]] = None,
+        include_total: bool = True,
+        summary_only: bool = False,
+    ) -> Tuple[List[ServiceVendor], Optional[int]]:
+        """
+        Find all vendors for a category by slug with pagination. Returns (vendors, total_count).
+        
+        Ordered by (rating DESC, name ASC, vendor_id ASC); `after` is the
+        keyset of the previous page's last vendor and replaces `skip`.
+        include_total=False skips the COUNT query (total_count is None).
+        summary_only=True returns list-view vendors: description holds only
+        a prefix (a little over 150 chars) and metadata is empty.
+        """
+        ...
     
-    @abstractmethod
     def find_all(
         self,
         skip: int = 0,
         limit: int = 20,
         active_only: bool = True,
-    ) -> Tuple[List[ServiceVendor], int]:
-        """Find all vendors with pagination. Returns (vendors, total_count)."""
-        pass
+        city: Optional[str] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+        summary_only: bool = False,
+    ) -> Tuple[List[ServiceVendor], Optional[int]]:
+        """
+        Find all vendors with pagination. Returns (vendors, total_count).
+        
+        Ordered by (created_at DESC, vendor_id DESC); `after` is the keyset
+        of the previous page's last vendor and replaces `skip`.
+        include_total=False skips the COUNT query (total_count is None).
+        summary_only=True returns list-view vendors: description holds only
+        a prefix (a little over 150 chars) and metadata is empty.
+        """
+        ...
     
-    @abstractmethod
-    def update(self, vendor: ServiceVendor) -> ServiceVendor:
-        """Update an existing vendor."""
-        pass
-    
-    @abstractmethod
-    def delete(self, vendor_id: int) -> bool:
-        """Hard delete a vendor by ID."""
-        pass
-    
-    @abstractmethod
     def count_by_category(self, category_id: int, active_only: bool = True) -> int:
         """Count vendors in a category."""
-        pass
+        ...
+    
+    def get_detail_json(self, vendor_id: int) -> Optional[bytes]:
+        """Get a vendor's full detail (with hero and gallery images) as JSON bytes, or None if not found."""
+        ...
@@ -1,24 +1,42 @@
 """VendorImage repository interface."""
 
-from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Protocol
+from src.domain.shared.repository import CrudRepository
 from src.domain.service.entities.vendor_image import VendorImage
 
 
-class VendorImageRepository(ABC):
-    """Abstract repository for VendorImage persistence."""
+class VendorImageRepository(CrudRepository[VendorImage, int], Protocol):
+    """Repository protocol for VendorImage entities."""
     
-    @abstractmethod
-    def save(self, image: VendorImage) -> VendorImage:
-        """Save an image and return with generated ID."""
-        pass
+    def save_with_next_order(self, image: VendorImage) -> VendorImage:
+        """
+        Save an image after the vendor's existing images of the same type.
+        
+        Ignores image.display_order and assigns the next free position.
+        
+        Raises:
+            ResourceNotFoundError: If the vendor does not exist
+        """
+        ...
     
-    @abstractmethod
-    def find_by_id(self, image_id: int) -> Optional[VendorImage]:
-        """Find image by ID."""
-        pass
+    def save_many(self, images: List[VendorImage]) -> List[VendorImage]:
+        """Save several images in one transaction and return them with generated IDs."""
+        ...
+    
+    def replace_images(
+        self,
+        vendor_id: int,
+        image_type: str,
+        new_images: List[VendorImage],
+    ) -> List[VendorImage]:
+        """
+        Replace all of a vendor's images of one type in a single transaction.
+        
+        Returns:
+            The newly saved images with generated IDs
+        """
+        ...
     
-    @abstractmethod
     def find_by_vendor_id(
         self,
         vendor_id: int,
@@ -34,39 +52,47 @@ class VendorImageRepository(ABC):
         Returns:
             List of images ordered by display_order
         """
-        pass
+        ...
     
-    @abstractmethod
     def find_hero_images(self, vendor_id: int) -> List[VendorImage]:
         """Find all hero carousel images for a vendor."""
-        pass
+        ...
     
-    @abstractmethod
     def find_gallery_images(self, vendor_id: int) -> List[VendorImage]:
         """Find all gallery images for a vendor."""
-        pass
+        ...
+    
+    def find_images_grouped(self, vendor_id: int) -> Dict[str, List[VendorImage]]:
+        """
+        Find all images for a vendor in one query, grouped by image type.
+        
+        Returns:
+            Dict with 'hero' and 'gallery' keys, each ordered by display_order
+        """
+        ...
     
-    @abstractmethod
     def find_first_hero_image(self, vendor_id: int) -> Optional[VendorImage]:
         """Find the first hero image for a vendor (for list thumbnails)."""
-        pass
+        ...
     
-    @abstractmethod
-    def update(self, image: VendorImage) -> VendorImage:
-        """Update an existing image."""
-        pass
+    def find_first_hero_images_for_vendors(self, vendor_ids: List[int]) -> Dict[int, VendorImage]:
+        """
+        Find the first hero image of each vendor in a single query.
+        
+        Returns:
+            Dict mapping vendor_id to its first hero image; vendors without
+            hero images are absent
+        """
+        ...
     
-    @abstractmethod
-    def delete(self, image_id: int) -> bool:
-        """Delete an image by ID."""
-        pass
+    def delete_for_vendor(self, vendor_id: int, image_id: int) -> bool:
+        """Delete an image if it belongs to the vendor. Returns False if no such image."""
+        ...
     
-    @abstractmethod
     def delete_by_vendor_id(self, vendor_id: int) -> int:
         """Delete all images for a vendor. Returns count of deleted images."""
-        pass
+        ...
     
-    @abstractmethod
     def reorder(self, vendor_id: int, image_type: str, image_ids: List[int]) -> bool:
         """
         Reorder images by setting display_order based on position in image_ids list.
@@ -79,9 +105,8 @@ class VendorImageRepository(ABC):
         Returns:
             True if successful
         """
-        pass
+        ...
     
-    @abstractmethod
     def get_next_display_order(self, vendor_id: int, image_type: str) -> int:
         """Get the next display_order value for a new image."""
-        pass
+        ...
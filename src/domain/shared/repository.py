@@ -0,0 +1,26 @@
+"""Generic repository base shared by domain repository interfaces."""
+
+from typing import Optional, Protocol, TypeVar
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class CrudRepository(Protocol[T, ID]):
+    """Repository protocol with the save/find/update/delete contract."""
+
+    def save(self, entity: T) -> T:
+        """Save an entity and return it with its generated ID."""
+        ...
+
+    def find_by_id(self, id_: ID) -> Optional[T]:
+        """Find an entity by ID."""
+        ...
+
+    def update(self, entity: T) -> T:
+        """Update an existing entity."""
+        ...
+
+    def delete(self, id_: ID) -> bool:
+        """Delete an entity by ID. Returns True if it existed."""
+        ...
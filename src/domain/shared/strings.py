@@ -0,0 +1,38 @@
+"""String validation helpers shared by domain entities."""
+
+from typing import Optional, Type
+
+from src.domain.shared.exceptions import DomainException
+
+
+def strip_min(
+    value: Optional[str],
+    min_len: int,
+    error: Type[DomainException],
+    message: str,
+) -> str:
+    """Return value stripped of surrounding whitespace, or raise if too short.
+    
+    Strips once and reuses the result for both the length check and the
+    stored value. Values already shorter than min_len are rejected before
+    stripping, since stripping cannot make them longer.
+    
+    Args:
+        value: Raw input (None counts as empty)
+        min_len: Minimum length after stripping
+        error: Entity-specific exception to raise
+        message: Exception message
+    """
+    if not value or len(value) < min_len:
+        raise error(message)
+    stripped = value.strip()
+    if len(stripped) < min_len:
+        raise error(message)
+    return stripped
+
+
+def strip_or_none(value: Optional[str]) -> Optional[str]:
+    """Return value stripped of surrounding whitespace, or None if blank."""
+    if not value:
+        return None
+    return value.strip() or None
@@ -0,0 +1,19 @@
+"""Timestamp helpers shared by domain entities."""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def default_timestamps(
+    created_at: Optional[datetime],
+    updated_at: Optional[datetime],
+) -> Tuple[datetime, datetime]:
+    """Return (created_at, updated_at), filling missing values with the current time.
+    
+    Both defaults share one utcnow() call, so a new entity's timestamps match.
+    """
+    if created_at is None or updated_at is None:
+        now = datetime.utcnow()
+        created_at = created_at if created_at is not None else now
+        updated_at = updated_at if updated_at is not None else now
+    return created_at, updated_at
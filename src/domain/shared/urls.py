@@ -0,0 +1,27 @@
+"""URL validation shared by domain entities and use cases."""
+
+from functools import lru_cache
+from urllib.parse import urlparse
+
+
+@lru_cache(maxsize=4096)
+def is_http_url(url: str) -> bool:
+    """Check that url is an http(s) URL with a dotted or localhost host.
+
+    Results are cached: bulk image inserts repeat the same URLs.
+    """
+    if not url:
+        return False
+    try:
+        parsed = urlparse(url)
+        # Must have valid scheme and netloc (domain)
+        if parsed.scheme not in ("http", "https"):
+            return False
+        if not parsed.netloc:
+            return False
+        # Basic domain validation - must have at least one dot or be localhost
+        if "." not in parsed.netloc and "localhost" not in parsed.netloc:
+            return False
+        return True
+    except Exception:
+        return False
@@ -1,25 +1,61 @@
 """Shared Value Objects across the domain."""
 
+from operator import attrgetter
 from typing import Optional
 import re
 from datetime import datetime
 
 
 class ValueObject:
-    """Base class for all value objects - immutable and compared by value."""
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, self.__class__):
+    """Base class for all value objects - immutable and compared by value.
+
+    Subclasses declare their fields in ``__slots__``; equality and hashing
+    use all slots along the class hierarchy, and the hash is computed once
+    per instance. The field getter is built once per subclass when it is
+    defined, so comparisons read the slots directly.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name != "_hash" and name not in fields:
+                    fields.append(name)
+        if len(fields) == 1:
+            # attrgetter returns a bare value for a single field; keep keys tuples
+            getter = attrgetter(fields[0])
+            cls._get_key = staticmethod(lambda obj: (getter(obj),))
+        elif fields:
+            cls._get_key = staticmethod(attrgetter(*fields))
+        else:
+            cls._get_key = staticmethod(lambda obj: ())
+
+    def _key(self) -> tuple:
+        return self._get_key(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, type(self)):
             return NotImplemented
-        return self.__dict__ == other.__dict__
+        return self._key() == other._key()
 
-    def __hash__(self) -> int:
-        return hash(tuple(sorted(self.__dict__.items())))
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            # The class is part of the hash: UserId(5) and UserTier(5) differ
+            self._hash = hash((type(self), *self._key()))
+            return self._hash
 
 
 class UserId(ValueObject):
     """User ID value object - immutable and validated."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: int):
         if value <= 0:
             raise ValueError("UserId must be a positive integer")
@@ -39,8 +75,10 @@ class UserId(ValueObject):
 class Email(ValueObject):
     """Email value object - immutable and validated."""
 
+    __slots__ = ("_value",)
+
     # RFC 5322 simplified regex for email validation
-    EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
     def __init__(self, value: str):
         if not value or not isinstance(value, str):
@@ -48,7 +86,7 @@ class Email(ValueObject):
         
         value = value.strip().lower()
         
-        if not re.match(self.EMAIL_REGEX, value):
+        if not self.EMAIL_REGEX.match(value):
             raise ValueError(f"Invalid email format: {value}")
         
         self._value = value
@@ -67,6 +105,8 @@ class Email(ValueObject):
 class FullName(ValueObject):
     """Full name value object - immutable and validated."""
 
+    __slots__ = ("_first_name", "_last_name")
+
     def __init__(self, first_name: str, last_name: str):
         if not first_name or not isinstance(first_name, str):
             raise ValueError("First name must be a non-empty string")
@@ -98,11 +138,13 @@ class FullName(ValueObject):
 class UserTier(ValueObject):
     """User tier value object - immutable and validated."""
 
-    VALID_TIERS = {5000, 25000, 100000}
+    __slots__ = ("_value",)
+
+    VALID_TIERS = frozenset({5000, 25000, 100000})
 
     def __init__(self, value: int):
         if value not in self.VALID_TIERS:
-            raise ValueError(f"Invalid tier: {value}. Must be one of {self.VALID_TIERS}")
+            raise ValueError(f"Invalid tier: {value}. Must be one of {sorted(self.VALID_TIERS)}")
         self._value = value
 
     @property
@@ -119,6 +161,8 @@ class UserTier(ValueObject):
 class HashedPassword(ValueObject):
     """Hashed password value object - immutable."""
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: str):
         if not value or not isinstance(value, str):
             raise ValueError("Hashed password must be a non-empty string")
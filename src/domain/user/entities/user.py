@@ -1,11 +1,12 @@
 """User domain entity - encapsulating user business logic."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 import bcrypt
 
 from src.domain.shared.exceptions import InvalidPasswordError, InvalidUserError
+from src.domain.shared.timestamps import default_timestamps
 
 
 class User:
@@ -21,6 +22,10 @@ class User:
         phone_number: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        full_name: Optional[str] = None,
+        tier: Optional[Any] = None,
+        is_active: bool = True,
+        is_admin: bool = False,
     ):
         """Create a new User entity.
         
@@ -33,15 +38,22 @@ class User:
             phone_number: Optional phone number
             created_at: Account creation timestamp
             updated_at: Last update timestamp
+            full_name: Stored display name; derived from first/last name if omitted
+            tier: Subscription plan tier (PlanTier), None until a plan is purchased
+            is_active: Whether the account is active
+            is_admin: Whether the user has admin privileges
         """
         self.user_id = user_id
         self.email = email
         self.hashed_password = hashed_password
         self.first_name = first_name
         self.last_name = last_name
+        self.full_name = full_name or first_name + " " + last_name
         self.phone_number = phone_number
-        self.created_at = created_at or datetime.utcnow()
-        self.updated_at = updated_at or datetime.utcnow()
+        self.tier = tier
+        self.is_active = is_active
+        self.is_admin = is_admin
+        self.created_at, self.updated_at = default_timestamps(created_at, updated_at)
 
     # ============ Business Logic Methods ============
 
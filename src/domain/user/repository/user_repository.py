@@ -5,32 +5,73 @@ Defines the persistence contract required by application use cases.
 
 from __future__ import annotations
 
-from typing import Optional, Protocol, List
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional, Protocol, List, Tuple
 
 from src.domain.user.entities.user import User
 
 
+class UserListRow(NamedTuple):
+    """Read-only projection of a user for read views (no password hash).
+
+    Field names match the User entity, so it can stand in for one when
+    building response DTOs.
+    """
+
+    user_id: int
+    email: str
+    first_name: str
+    last_name: str
+    full_name: str
+    phone_number: Optional[str]
+    tier: Optional[Any]
+    is_active: bool
+    is_admin: bool
+    created_at: datetime
+    updated_at: datetime
+
+
 class UserRepository(Protocol):
-    async def save(self, user: User) -> User:
+    def create(
+        self,
+        email: str,
+        hashed_password: str,
+        first_name: str,
+        last_name: str,
+        phone_number: Optional[str] = None,
+        is_admin: bool = False,
+    ) -> User:
+        ...
+
+    def save(self, user: User) -> User:
+        ...
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        ...
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        ...
+
+    def delete(self, user_id: int) -> bool:
         ...
 
-    async def find_by_id(self, user_id: int) -> Optional[User]:
+    def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         ...
 
-    async def find_by_email(self, email: str) -> Optional[User]:
+    def find_all_admins(self) -> List[User]:
         ...
 
-    async def update(self, user: User) -> User:
+    def count_all(self) -> int:
         ...
 
-    async def delete(self, user_id: int) -> bool:
+    def find_page_projection(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserListRow], int]:
         ...
 
-    async def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+    def find_projection_by_id(self, user_id: int) -> Optional[UserListRow]:
         ...
 
-    async def count_all(self) -> int:
+    def update_fields(self, user_id: int, changes: Dict[str, Any]) -> Optional[User]:
         ...
 
-    async def update(self, user: User) -> User:
+    def update(self, user: User) -> User:
         ...
@@ -3,10 +3,15 @@
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-from jose import jwt, JWTError
+from jose import jwk, jwt, JWTError
 
 from src.config import settings
 
+# Built once: given a Key object, jose skips re-parsing the secret (including
+# a failed JSON/JWK parse attempt) on every encode and every verify
+_SIGNING_KEY = jwk.construct(settings.jwt_secret_key, settings.jwt_algorithm)
+_DEFAULT_EXPIRATION = timedelta(hours=settings.jwt_expiration_hours)
+
 
 def create_access_token(
     data: Dict[str, Any],
@@ -23,17 +28,11 @@ def create_access_token(
         Encoded JWT token string
     """
     to_encode = data.copy()
-    
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=settings.jwt_expiration_hours)
-    
-    to_encode.update({"exp": expire})
+    to_encode["exp"] = datetime.utcnow() + (expires_delta or _DEFAULT_EXPIRATION)
     
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
+        _SIGNING_KEY,
         algorithm=settings.jwt_algorithm,
     )
     
@@ -53,7 +52,7 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
+            _SIGNING_KEY,
             algorithms=[settings.jwt_algorithm],
         )
         return payload
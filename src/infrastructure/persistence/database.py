@@ -2,7 +2,7 @@
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
 
 from src.config import settings
 from src.infrastructure.persistence.models.user import Base
@@ -17,10 +17,17 @@ from src.infrastructure.persistence.models.plan import PlanModel, SubscriptionMo
 from src.infrastructure.persistence.models.notification import NotificationModel
 from src.infrastructure.persistence.models.content import BannerModel, CityModel
 
-# Create engine with NullPool for async contexts
+# Create engine once per process with a pool of persistent connections shared
+# across requests, so sessions reuse connections instead of reconnecting.
 engine = create_engine(
     settings.database_url,
-    poolclass=NullPool,
+    poolclass=QueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+    connect_args={"options": f"-c statement_timeout={settings.db_statement_timeout_ms}"},
     echo=settings.debug,
 )
 
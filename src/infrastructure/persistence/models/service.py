@@ -23,7 +23,12 @@ class ServiceCategoryModel(Base):
     
     # Relationships
     vendors = relationship("ServiceVendorModel", back_populates="category", cascade="all, delete-orphan")
-    subcategories = relationship("ServiceSubcategoryModel", back_populates="category", cascade="all, delete-orphan")
+    subcategories = relationship(
+        "ServiceSubcategoryModel",
+        back_populates="category",
+        cascade="all, delete-orphan",
+        order_by="ServiceSubcategoryModel.display_order",
+    )
     
     __table_args__ = (
         Index('idx_category_slug', 'slug'),
@@ -95,6 +100,9 @@ class ServiceVendorModel(Base):
     # Status
     is_active = Column(Boolean, nullable=False, default=True)
     
+    # Set when images submitted with the vendor could not be saved in the background
+    image_ingest_failed = Column(Boolean, nullable=False, default=False, server_default="false")
+    
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -143,7 +151,11 @@ class VendorImageModel(Base):
     __table_args__ = (
         Index('idx_image_vendor_id', 'vendor_id'),
         Index('idx_image_type', 'image_type'),
-        Index('idx_image_vendor_type', 'vendor_id', 'image_type'),
+        # Covers the per-vendor/type lookups ordered by display_order
+        Index(
+            'idx_image_vendor_type_order', 'vendor_id', 'image_type', 'display_order',
+            postgresql_include=['image_url', 'thumbnail_url', 'caption'],
+        ),
         Index('idx_image_display_order', 'display_order'),
     )
     
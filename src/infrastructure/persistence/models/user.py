@@ -1,7 +1,7 @@
 """SQLAlchemy User model - Database ORM representation."""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index, Enum as SQLEnum, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from src.domain.plan.entities.plan_tier import PlanTier
@@ -37,6 +37,10 @@ class UserModel(Base):
     is_active = Column(Boolean, nullable=False, default=True)
     is_admin = Column(Boolean, nullable=False, default=False)  # Admin flag
     
+    # Denormalized unread notification count, kept in step by the
+    # notification repository and reconciled nightly
+    unread_notifications = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -47,6 +51,8 @@ class UserModel(Base):
     # Indexes for query performance
     __table_args__ = (
         Index('idx_user_email', 'email'),
+        # Emails are stored lowercased; this keeps case variants from coexisting
+        Index('ix_users_email_lower', func.lower(email), unique=True),
         Index('idx_user_created', 'created_at'),
     )
     
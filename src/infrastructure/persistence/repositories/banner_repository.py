@@ -4,11 +4,10 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from src.domain.content.entities.banner import Banner
-from src.domain.content.repository.banner_repository import BannerRepository
 from src.infrastructure.persistence.models.content import BannerModel
 
 
-class PostgreSQLBannerRepository(BannerRepository):
+class PostgreSQLBannerRepository:
     """SQLAlchemy-based BannerRepository for PostgreSQL."""
 
     def __init__(self, db_session: Session):
@@ -1,6 +1,7 @@
 """Booking repository implementation using SQLAlchemy."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.domain.booking.entities.booking import Booking
@@ -46,6 +47,17 @@ class BookingRepository:
             q = q.filter(BookingModel.status == status)
         return q.count()
 
+    def find_page_by_user_and_status(self, user_id: int, status: Optional[str] = None, skip: int = 0, limit: int = 20) -> Tuple[List[Booking], int]:
+        """Page of a user's bookings plus their total, counted with COUNT(*) OVER () in the same query."""
+        q = self.db.query(BookingModel, func.count().over().label("total")).filter(BookingModel.user_id == user_id)
+        if status:
+            q = q.filter(BookingModel.status == status)
+        rows = q.order_by(BookingModel.start_at.desc()).offset(skip).limit(limit).all()
+        if not rows:
+            # Past the last page there is no row to carry the total
+            return [], self.count_by_user_and_status(user_id, status) if skip else 0
+        return [self._to_entity(b) for b, _ in rows], rows[0].total
+
     def find_all(self, status: Optional[str] = None, skip: int = 0, limit: int = 20) -> List[Booking]:
         q = self.db.query(BookingModel)
         if status:
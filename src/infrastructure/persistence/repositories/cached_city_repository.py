@@ -0,0 +1,61 @@
+"""Caching decorator for the city repository."""
+
+import copy
+from typing import List, Optional
+
+from src.domain.content.entities.city import City
+from src.domain.content.repository.city_repository import CityRepository
+from src.shared.utils.ttl_cache import TTLCache
+
+
+# The city list is read on every page render; find_all results are keyed
+# by (active_only,).
+_CITY_TTL_SECONDS = 300
+_city_lists = TTLCache(maxsize=2, ttl=_CITY_TTL_SECONDS)
+
+
+class CachedCityRepository:
+    """CityRepository that serves find_all from a TTL cache.
+
+    Lists are cached as tuples, so callers cannot append to a shared list.
+    """
+
+    def __init__(self, inner: CityRepository):
+        """Wrap the repository that performs the actual persistence."""
+        self._inner = inner
+
+    async def find_all(self, active_only: bool = True) -> List[City]:
+        """Find all cities, from cache when possible."""
+        key = (active_only,)
+        cities = _city_lists.get(key)
+        if cities is None:
+            cities = tuple(await self._inner.find_all(active_only=active_only))
+            _city_lists.set(key, cities)
+        return [copy.copy(city) for city in cities]
+
+    async def find_by_id(self, city_id: int) -> Optional[City]:
+        """Find a city by ID (not cached)."""
+        return await self._inner.find_by_id(city_id)
+
+    async def create(self, city: City) -> City:
+        """Create a city and drop the cached lists."""
+        created = await self._inner.create(city)
+        self.invalidate()
+        return created
+
+    async def update(self, city: City) -> City:
+        """Update a city and drop the cached lists."""
+        updated = await self._inner.update(city)
+        self.invalidate()
+        return updated
+
+    async def delete(self, city_id: int) -> bool:
+        """Delete a city and drop the cached lists."""
+        deleted = await self._inner.delete(city_id)
+        self.invalidate()
+        return deleted
+
+    @staticmethod
+    def invalidate() -> None:
+        """Drop every cached city list."""
+        _city_lists.clear()
@@ -0,0 +1,173 @@
+"""Caching decorator for the user repository."""
+
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.user.entities.user import User
+from src.domain.user.repository.user_repository import UserListRow, UserRepository
+from src.shared.utils.ttl_cache import TTLCache
+
+
+# Profile and display lookups resolve the same users repeatedly. Auth checks
+# use the uncached repository (get_auth_user_repository). Misses are
+# remembered briefly to absorb retries for unknown emails/IDs.
+_USER_TTL_SECONDS = 60
+_MISS_TTL_SECONDS = 1
+_by_email = TTLCache(maxsize=10_000, ttl=_USER_TTL_SECONDS)
+_by_id = TTLCache(maxsize=10_000, ttl=_USER_TTL_SECONDS)
+_misses = TTLCache(maxsize=10_000, ttl=_MISS_TTL_SECONDS)
+
+_MISSING = object()
+
+
+class CachedUserRepository:
+    """UserRepository that serves find_by_id/find_by_email from a TTL cache.
+
+    Not for login, password or admin checks: the cached entity may predate
+    a password change, demotion or deactivation made by another worker.
+    """
+
+    def __init__(self, inner: UserRepository):
+        """Wrap the repository that performs the actual persistence."""
+        self._inner = inner
+
+    def create(
+        self,
+        email: str,
+        hashed_password: str,
+        first_name: str,
+        last_name: str,
+        phone_number: Optional[str] = None,
+        is_admin: bool = False,
+    ) -> User:
+        """Insert a new user and drop any cached miss for its email."""
+        created = self._inner.create(
+            email=email,
+            hashed_password=hashed_password,
+            first_name=first_name,
+            last_name=last_name,
+            phone_number=phone_number,
+            is_admin=is_admin,
+        )
+        self._invalidate(created)
+        return created
+
+    def save(self, user: User) -> User:
+        """Save a new user and drop any cached miss for its email."""
+        saved = self._inner.save(user)
+        self._invalidate(saved)
+        return saved
+
+    def find_by_id(self, user_id: int) -> Optional[User]:
+        """Retrieve user by ID, from cache when possible."""
+        cached = _by_id.get(user_id, _MISSING)
+        if cached is not _MISSING:
+            return copy.copy(cached)
+        if _misses.get(("id", user_id)) is not None:
+            return None
+
+        user = self._inner.find_by_id(user_id)
+        self._remember(user, ("id", user_id))
+        return user
+
+    def find_projection_by_id(self, user_id: int) -> Optional[UserListRow]:
+        """Retrieve a user's read-only projection, from cache when possible.
+
+        Rows are immutable, so a cached entity is projected without a copy.
+        A database row is not cached, since it lacks the password hash.
+        """
+        cached = _by_id.get(user_id, _MISSING)
+        if cached is not _MISSING:
+            return UserListRow(
+                cached.user_id,
+                cached.email,
+                cached.first_name,
+                cached.last_name,
+                cached.full_name,
+                cached.phone_number,
+                cached.tier,
+                cached.is_active,
+                cached.is_admin,
+                cached.created_at,
+                cached.updated_at,
+            )
+        if _misses.get(("id", user_id)) is not None:
+            return None
+
+        row = self._inner.find_projection_by_id(user_id)
+        if row is None:
+            _misses.set(("id", user_id), True)
+        return row
+
+    def find_by_email(self, email: str) -> Optional[User]:
+        """Retrieve user by email, from cache when possible."""
+        cached = _by_email.get(email, _MISSING)
+        if cached is not _MISSING:
+            return copy.copy(cached)
+        if _misses.get(("email", email)) is not None:
+            return None
+
+        user = self._inner.find_by_email(email)
+        self._remember(user, ("email", email))
+        return user
+
+    def update(self, user: User) -> User:
+        """Update a user and invalidate its cache entries."""
+        updated = self._inner.update(user)
+        self._invalidate(user)
+        self._invalidate(updated)
+        return updated
+
+    def update_fields(self, user_id: int, changes: Dict[str, Any]) -> Optional[User]:
+        """Apply column changes to a user and invalidate its cache entries."""
+        updated = self._inner.update_fields(user_id, changes)
+        _by_id.invalidate(user_id)
+        if updated:
+            self._invalidate(updated)
+        return updated
+
+    def delete(self, user_id: int) -> bool:
+        """Delete a user and invalidate its cache entries.
+
+        The email entry is dropped via the cached entity when there is one;
+        a cache miss does not add a lookup before the DELETE.
+        """
+        cached = _by_id.pop(user_id)
+        deleted = self._inner.delete(user_id)
+        if cached is not None:
+            self._invalidate(cached)
+        return deleted
+
+    def find_all_admins(self) -> List[User]:
+        """Find all admin users (not cached)."""
+        return self._inner.find_all_admins()
+
+    def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+        """Retrieve all users with pagination (not cached)."""
+        return self._inner.find_all(skip=skip, limit=limit)
+
+    def count_all(self) -> int:
+        """Count total number of users (not cached)."""
+        return self._inner.count_all()
+
+    def find_page_projection(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserListRow], int]:
+        """Retrieve a page of user list rows with the total count (not cached)."""
+        return self._inner.find_page_projection(skip=skip, limit=limit)
+
+    @staticmethod
+    def _remember(user: Optional[User], miss_key: tuple) -> None:
+        """Cache a lookup result under both keys, or record the miss."""
+        if user is None:
+            _misses.set(miss_key, True)
+            return
+        snapshot = copy.copy(user)
+        _by_id.set(user.user_id, snapshot)
+        _by_email.set(user.email, snapshot)
+
+    @staticmethod
+    def _invalidate(user: User) -> None:
+        """Drop cached entries and misses for a user's ID and email."""
+        _by_id.invalidate(user.user_id)
+        _by_email.invalidate(user.email)
+        _misses.invalidate(("id", user.user_id))
+        _misses.invalidate(("email", user.email))
@@ -4,11 +4,10 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from src.domain.content.entities.city import City
-from src.domain.content.repository.city_repository import CityRepository
 from src.infrastructure.persistence.models.content import CityModel
 
 
-class PostgreSQLCityRepository(CityRepository):
+class PostgreSQLCityRepository:
     """SQLAlchemy-based CityRepository for PostgreSQL."""
 
     def __init__(self, db_session: Session):
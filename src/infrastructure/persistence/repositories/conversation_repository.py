@@ -1,8 +1,9 @@
 """Conversation repository implementation."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from src.domain.conversation.entities.conversation import Conversation, Message
 from src.infrastructure.persistence.models.conversation import ConversationModel, MessageModel
@@ -10,6 +11,11 @@ from src.infrastructure.persistence.models.request import RequestModel
 from src.infrastructure.persistence.models.service import ServiceVendorModel, VendorImageModel
 
 
+# List views only show each vendor's first hero image, so the image
+# prefetch skips gallery rows (one IN query, hero rows only)
+_HERO_IMAGES = ServiceVendorModel.images.and_(VendorImageModel.image_type == "hero")
+
+
 class ConversationRepository:
     """PostgreSQL implementation of conversation persistence."""
     
@@ -30,10 +36,9 @@ class ConversationRepository:
         return self._to_entity(db_conversation)
     
     def find_by_id(self, conversation_id: int) -> Optional[Conversation]:
-        """Find conversation by ID with messages."""
+        """Find conversation by ID, without its messages."""
         db_conversation = (
             self.db.query(ConversationModel)
-            .options(joinedload(ConversationModel.messages))
             .options(joinedload(ConversationModel.request))
             .filter(ConversationModel.id == conversation_id)
             .first()
@@ -41,18 +46,10 @@ class ConversationRepository:
         if not db_conversation:
             return None
         
-        # Load messages
-        db_messages = (
-            self.db.query(MessageModel)
-            .filter(MessageModel.conversation_id == conversation_id)
-            .order_by(MessageModel.created_at.asc())
-            .all()
-        )
-        
-        return self._to_entity(db_conversation, db_messages)
+        return self._to_entity(db_conversation)
     
-    def find_by_request_id(self, request_id: int) -> Optional[Conversation]:
-        """Find conversation by request ID."""
+    def find_by_request_id(self, request_id: int, with_messages: bool = True) -> Optional[Conversation]:
+        """Find conversation by request ID, with all messages unless disabled."""
         db_conversation = (
             self.db.query(ConversationModel)
             .filter(ConversationModel.request_id == request_id)
@@ -60,6 +57,8 @@ class ConversationRepository:
         )
         if not db_conversation:
             return None
+        if not with_messages:
+            return self._to_entity(db_conversation)
         
         db_messages = (
             self.db.query(MessageModel)
@@ -70,8 +69,14 @@ class ConversationRepository:
         
         return self._to_entity(db_conversation, db_messages)
     
-    def find_by_user_id(self, user_id: int, skip: int = 0, limit: int = 20) -> List[Conversation]:
-        """Find all conversations for a user with eager loading."""
+    def find_by_user_id(
+        self, user_id: int, skip: int = 0, limit: int = 20, with_last_message: bool = False
+    ) -> List[Conversation]:
+        """Find all conversations for a user with eager loading.
+        
+        With ``with_last_message``, each conversation carries only its most
+        recent message, fetched for the whole page in one extra query.
+        """
         db_conversations = (
             self.db.query(ConversationModel)
             .join(RequestModel, ConversationModel.request_id == RequestModel.id)
@@ -83,16 +88,19 @@ class ConversationRepository:
             .options(
                 joinedload(ConversationModel.request)
                 .joinedload(RequestModel.vendor)
-                .selectinload(ServiceVendorModel.images)
+                .selectinload(_HERO_IMAGES)
             )
-            .options(selectinload(ConversationModel.messages))
             .filter(ConversationModel.user_id == user_id)
             .order_by(ConversationModel.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
-        return [self._to_entity(c) for c in db_conversations]
+        if not with_last_message:
+            return [self._to_entity(c) for c in db_conversations]
+        
+        last_messages = self._latest_messages([c.id for c in db_conversations], 1)
+        return [self._to_entity(c, last_messages.get(c.id, [])) for c in db_conversations]
     
     def find_all(self, skip: int = 0, limit: int = 20) -> List[Conversation]:
         """Find all conversations (admin use) with eager loading."""
@@ -106,10 +114,9 @@ class ConversationRepository:
             .options(
                 joinedload(ConversationModel.request)
                 .joinedload(RequestModel.vendor)
-                .selectinload(ServiceVendorModel.images)
+                .selectinload(_HERO_IMAGES)
             )
             .options(joinedload(ConversationModel.user))
-            .options(selectinload(ConversationModel.messages))
             .order_by(ConversationModel.created_at.desc())
             .offset(skip)
             .limit(limit)
@@ -182,6 +189,44 @@ class ConversationRepository:
         messages = [self._message_to_entity(m) for m in db_messages]
         return messages, total
     
+    def _latest_messages(
+        self, conversation_ids: Iterable[int], per_conversation: int
+    ) -> Dict[int, List[MessageModel]]:
+        """Load the newest messages of several conversations in one query.
+        
+        Ranks messages with ROW_NUMBER() per conversation and keeps the top
+        ``per_conversation``, returned oldest first for each conversation.
+        """
+        conversation_ids = list(conversation_ids)
+        if not conversation_ids:
+            return {}
+        
+        ranked = (
+            select(
+                MessageModel,
+                func.row_number()
+                .over(
+                    partition_by=MessageModel.conversation_id,
+                    order_by=(MessageModel.created_at.desc(), MessageModel.id.desc()),
+                )
+                .label("rank"),
+            )
+            .where(MessageModel.conversation_id.in_(conversation_ids))
+            .subquery()
+        )
+        latest = aliased(MessageModel, ranked)
+        db_messages = (
+            self.db.query(latest)
+            .filter(ranked.c.rank <= per_conversation)
+            .order_by(latest.conversation_id, latest.created_at.asc(), latest.id.asc())
+            .all()
+        )
+        
+        by_conversation: Dict[int, List[MessageModel]] = {}
+        for db_message in db_messages:
+            by_conversation.setdefault(db_message.conversation_id, []).append(db_message)
+        return by_conversation
+    
     def _to_entity(
         self, model: ConversationModel, messages: List[MessageModel] = None
     ) -> Conversation:
@@ -215,12 +260,11 @@ class ConversationRepository:
                 if hero_images:
                     vendor_image_url = hero_images[0].image_url
         
-        # Use provided messages or load from model
+        # Only explicitly loaded messages; touching model.messages would
+        # lazy-load every message of the conversation
         message_entities = []
-        if messages is not None:
+        if messages:
             message_entities = [self._message_to_entity(m) for m in messages]
-        elif hasattr(model, 'messages') and model.messages:
-            message_entities = [self._message_to_entity(m) for m in model.messages]
         
         return Conversation(
             conversation_id=model.id,
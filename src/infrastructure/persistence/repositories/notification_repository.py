@@ -1,14 +1,16 @@
 """NotificationRepository implementation - PostgreSQL persistence."""
 
-from typing import List, Optional
+from collections import Counter
+from typing import Dict, List, Optional
+from sqlalchemy import Integer, column, false, func, insert, select, update, values
 from sqlalchemy.orm import Session
 
 from src.domain.notification.entities.notification import Notification
-from src.domain.notification.repository.notification_repository import NotificationRepository
 from src.infrastructure.persistence.models.notification import NotificationModel
+from src.infrastructure.persistence.models.user import UserModel
 
 
-class PostgreSQLNotificationRepository(NotificationRepository):
+class PostgreSQLNotificationRepository:
     """SQLAlchemy-based NotificationRepository for PostgreSQL."""
 
     def __init__(self, db_session: Session):
@@ -53,9 +55,37 @@ class PostgreSQLNotificationRepository(NotificationRepository):
         self._session.add(model)
         self._session.flush()
         notification.notification_id = model.id
+        if not notification.is_read:
+            self._adjust_unread(notification.user_id, 1)
         self._session.commit()
         return notification
 
+    def create_many(self, notifications: List[Notification]) -> List[Notification]:
+        """Create several notifications with one multi-row INSERT ... RETURNING."""
+        if not notifications:
+            return []
+        rows = [
+            {
+                "user_id": notification.user_id,
+                "title": notification.title,
+                "message": notification.message,
+                "notification_type": notification.notification_type,
+                "is_read": notification.is_read,
+                "related_id": notification.related_id,
+            }
+            for notification in notifications
+        ]
+        ids = self._session.scalars(
+            insert(NotificationModel).returning(NotificationModel.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        unread_per_user = Counter(n.user_id for n in notifications if not n.is_read)
+        self._adjust_unread_many(unread_per_user)
+        self._session.commit()
+        for notification, notification_id in zip(notifications, ids):
+            notification.notification_id = notification_id
+        return notifications
+
     def mark_as_read(self, notification_id: int) -> bool:
         """Mark a notification as read."""
         model = self._session.query(NotificationModel).filter(
@@ -63,26 +93,101 @@ class PostgreSQLNotificationRepository(NotificationRepository):
         ).first()
         
         if model:
-            model.is_read = True
+            if not model.is_read:
+                model.is_read = True
+                self._adjust_unread(model.user_id, -1)
             self._session.commit()
             return True
         return False
 
+    def mark_as_read_many(self, notification_ids: List[int], user_id: int) -> int:
+        """Mark a user's notifications as read in a single UPDATE."""
+        if not notification_ids:
+            return 0
+        count = self._session.query(NotificationModel).filter(
+            NotificationModel.id.in_(set(notification_ids)),
+            NotificationModel.user_id == user_id,
+            NotificationModel.is_read == False
+        ).update({"is_read": True}, synchronize_session=False)
+        if count:
+            self._adjust_unread(user_id, -count)
+        self._session.commit()
+        return count
+
     def mark_all_as_read(self, user_id: int) -> int:
         """Mark all notifications as read for a user."""
         count = self._session.query(NotificationModel).filter(
             NotificationModel.user_id == user_id,
             NotificationModel.is_read == False
         ).update({"is_read": True})
+        if count:
+            self._adjust_unread(user_id, -count)
         self._session.commit()
         return count
 
     def count_unread(self, user_id: int) -> int:
-        """Count unread notifications for a user."""
-        return self._session.query(NotificationModel).filter(
-            NotificationModel.user_id == user_id,
-            NotificationModel.is_read == False
-        ).count()
+        """Count unread notifications for a user (denormalized counter)."""
+        count = self._session.execute(
+            select(UserModel.unread_notifications).where(UserModel.id == user_id)
+        ).scalar_one_or_none()
+        return count or 0
+
+    def reconcile_unread_counts(self) -> int:
+        """Reset every user's unread counter from the notifications table.
+        
+        Returns:
+            Number of users whose counter was corrected
+        """
+        actual = (
+            select(func.count(NotificationModel.id))
+            .where(
+                NotificationModel.user_id == UserModel.id,
+                NotificationModel.is_read == false(),
+            )
+            .scalar_subquery()
+        )
+        result = self._session.execute(
+            update(UserModel)
+            .where(UserModel.unread_notifications != actual)
+            .values(unread_notifications=actual, updated_at=UserModel.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        self._session.commit()
+        return result.rowcount
+
+    def _adjust_unread(self, user_id: int, delta: int) -> None:
+        """Shift a user's unread counter within the current transaction."""
+        self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            # Keep updated_at: its onupdate would otherwise mark the profile changed
+            .values(
+                unread_notifications=func.greatest(UserModel.unread_notifications + delta, 0),
+                updated_at=UserModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    def _adjust_unread_many(self, deltas: Dict[int, int]) -> None:
+        """Shift several users' unread counters with one UPDATE ... FROM (VALUES ...)."""
+        if not deltas:
+            return
+        if len(deltas) == 1:
+            (user_id, delta), = deltas.items()
+            self._adjust_unread(user_id, delta)
+            return
+        shifts = values(
+            column("user_id", Integer), column("delta", Integer), name="shifts"
+        ).data(list(deltas.items()))
+        self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == shifts.c.user_id)
+            .values(
+                unread_notifications=func.greatest(UserModel.unread_notifications + shifts.c.delta, 0),
+                updated_at=UserModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
     def _to_entity(self, model: NotificationModel) -> Notification:
         """Convert ORM model to domain entity."""
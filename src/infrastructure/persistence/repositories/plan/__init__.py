@@ -1,6 +1,7 @@
 """Plan repositories."""
 
 from .plan_repository import PostgreSQLPlanRepository
+from .cached_plan_repository import CachedPlanRepository
 from .subscription_repository import PostgreSQLSubscriptionRepository
 
-__all__ = ["PostgreSQLPlanRepository", "PostgreSQLSubscriptionRepository"]
+__all__ = ["PostgreSQLPlanRepository", "CachedPlanRepository", "PostgreSQLSubscriptionRepository"]
@@ -0,0 +1,77 @@
+"""Caching decorator for the plan repository."""
+
+import copy
+from typing import Dict, List, Optional
+
+from src.domain.plan.entities.plan import Plan
+from src.domain.plan.repository.plan_repository import PlanRepository
+from src.shared.utils.ttl_cache import TTLCache
+
+
+# Plans are a handful of near-static rows read on every subscription view.
+_PLAN_TTL_SECONDS = 300
+_by_id = TTLCache(maxsize=256, ttl=_PLAN_TTL_SECONDS)
+
+
+class CachedPlanRepository:
+    """PlanRepository that serves find_by_id/find_by_ids from a TTL cache."""
+
+    def __init__(self, inner: PlanRepository):
+        """Wrap the repository that performs the actual persistence."""
+        self._inner = inner
+
+    def find_all(self, active_only: bool = True) -> List[Plan]:
+        """Find all plans (not cached)."""
+        return self._inner.find_all(active_only=active_only)
+
+    def find_by_id(self, plan_id: int) -> Optional[Plan]:
+        """Find a plan by ID, from cache when possible."""
+        cached = _by_id.get(plan_id)
+        if cached is not None:
+            return copy.copy(cached)
+
+        plan = self._inner.find_by_id(plan_id)
+        if plan is not None:
+            _by_id.set(plan_id, copy.copy(plan))
+        return plan
+
+    def find_by_ids(self, plan_ids: List[int]) -> Dict[int, Plan]:
+        """Find several plans, querying only the IDs not already cached."""
+        plans: Dict[int, Plan] = {}
+        missing = []
+        for plan_id in set(plan_ids):
+            cached = _by_id.get(plan_id)
+            if cached is not None:
+                plans[plan_id] = copy.copy(cached)
+            else:
+                missing.append(plan_id)
+
+        if missing:
+            for plan_id, plan in self._inner.find_by_ids(missing).items():
+                _by_id.set(plan_id, copy.copy(plan))
+                plans[plan_id] = plan
+        return plans
+
+    def create(self, plan: Plan) -> Plan:
+        """Create a new plan (cached on first lookup)."""
+        return self._inner.create(plan)
+
+    def update(self, plan: Plan) -> Plan:
+        """Update a plan and invalidate its cache entry."""
+        updated = self._inner.update(plan)
+        self.invalidate(plan.plan_id)
+        return updated
+
+    def delete(self, plan_id: int) -> bool:
+        """Delete a plan and invalidate its cache entry."""
+        deleted = self._inner.delete(plan_id)
+        self.invalidate(plan_id)
+        return deleted
+
+    @staticmethod
+    def invalidate(plan_id: Optional[int] = None) -> None:
+        """Drop one cached plan, or every cached plan when no ID is given."""
+        if plan_id is None:
+            _by_id.clear()
+        else:
+            _by_id.invalidate(plan_id)
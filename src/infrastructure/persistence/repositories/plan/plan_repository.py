@@ -1,14 +1,13 @@
 """PlanRepository implementation - PostgreSQL persistence."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.domain.plan.entities.plan import Plan
-from src.domain.plan.repository.plan_repository import PlanRepository
 from src.infrastructure.persistence.models.plan import PlanModel
 
 
-class PostgreSQLPlanRepository(PlanRepository):
+class PostgreSQLPlanRepository:
     """SQLAlchemy-based PlanRepository for PostgreSQL."""
 
     def __init__(self, db_session: Session):
@@ -31,6 +30,15 @@ class PostgreSQLPlanRepository(PlanRepository):
         ).first()
         return self._to_entity(model) if model else None
 
+    def find_by_ids(self, plan_ids: List[int]) -> Dict[int, Plan]:
+        """Find several plans in one query (WHERE id IN ...), keyed by plan ID."""
+        if not plan_ids:
+            return {}
+        models = self._session.query(PlanModel).filter(
+            PlanModel.id.in_(set(plan_ids))
+        ).all()
+        return {model.id: self._to_entity(model) for model in models}
+
     def create(self, plan: Plan) -> Plan:
         """Create a new plan."""
         model = PlanModel(
@@ -1,15 +1,14 @@
 """SubscriptionRepository implementation - PostgreSQL persistence."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
 from src.domain.plan.entities.subscription import Subscription, SubscriptionStatus
-from src.domain.plan.repository.subscription_repository import SubscriptionRepository
 from src.infrastructure.persistence.models.plan import SubscriptionModel
 
 
-class PostgreSQLSubscriptionRepository(SubscriptionRepository):
+class PostgreSQLSubscriptionRepository:
     """SQLAlchemy-based SubscriptionRepository for PostgreSQL."""
 
     def __init__(self, db_session: Session):
@@ -41,6 +40,29 @@ class PostgreSQLSubscriptionRepository(SubscriptionRepository):
         ).first()
         return self._to_entity(model) if model else None
 
+    def find_active_by_user_ids(self, user_ids: List[int]) -> Dict[int, Subscription]:
+        """Find the active subscription of several users in one query, keyed by user ID.
+        
+        Users without an active subscription are omitted. If a user has more
+        than one, the one ending last wins (DISTINCT ON user_id).
+        """
+        if not user_ids:
+            return {}
+        now = datetime.utcnow()
+        models = (
+            self._session.query(SubscriptionModel)
+            .filter(
+                SubscriptionModel.user_id.in_(set(user_ids)),
+                SubscriptionModel.status == SubscriptionStatus.ACTIVE,
+                SubscriptionModel.start_date <= now,
+                SubscriptionModel.end_date >= now,
+            )
+            .distinct(SubscriptionModel.user_id)
+            .order_by(SubscriptionModel.user_id, SubscriptionModel.end_date.desc())
+            .all()
+        )
+        return {model.user_id: self._to_entity(model) for model in models}
+
     def create(self, subscription: Subscription) -> Subscription:
         """Create a new subscription."""
         model = SubscriptionModel(
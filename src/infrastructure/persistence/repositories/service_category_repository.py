@@ -1,17 +1,31 @@
 """ServiceCategory repository implementation."""
 
-from typing import List, Optional
+import copy
+from typing import Dict, List, NamedTuple, Optional
 from sqlalchemy.orm import Session
 
 from src.domain.service.entities.service_category import ServiceCategory
 from src.domain.service.entities.service_subcategory import ServiceSubcategory
-from src.domain.service.repository.service_category_repository import ServiceCategoryRepository as IServiceCategoryRepository
 from src.infrastructure.persistence.models.service import ServiceCategoryModel, ServiceSubcategoryModel
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
+from src.shared.utils.ttl_cache import TTLCache
 
 
-class ServiceCategoryRepository(IServiceCategoryRepository):
+# The whole category list is cached as one snapshot with its indexes.
+_ALL_CATEGORIES_KEY = "all"
+_category_cache = TTLCache(maxsize=1, ttl=300)
+
+
+class _CategorySnapshot(NamedTuple):
+    """Cached category list plus O(1) indexes built from the same rows."""
+
+    ordered: List[ServiceCategory]
+    by_id: Dict[int, ServiceCategory]
+    by_slug: Dict[str, ServiceCategory]
+
+
+class ServiceCategoryRepository:
     """PostgreSQL implementation of ServiceCategory persistence."""
     
     def __init__(self, db: Session):
@@ -23,13 +37,14 @@ class ServiceCategoryRepository(IServiceCategoryRepository):
             slug=category.slug,
             name=category.name,
             display_order=category.display_order,
-            icon_url=getattr(category, 'icon_url', None),
+            icon_url=category.icon_url,
             created_at=category.created_at,
         )
         self.db.add(db_category)
         try:
             self.db.commit()
             self.db.refresh(db_category)
+            self.invalidate_cache()
             return self._to_entity(db_category)
         except IntegrityError:
             # Unique constraint on slug violated — translate to a clear error
@@ -38,59 +53,57 @@ class ServiceCategoryRepository(IServiceCategoryRepository):
     
     def find_by_id(self, category_id: int) -> Optional[ServiceCategory]:
         """Find category by ID."""
-        db_category = (
-            self.db.query(ServiceCategoryModel)
-            .filter(ServiceCategoryModel.id == category_id)
-            .first()
-        )
-        return self._to_entity(db_category) if db_category else None
+        category = self._snapshot().by_id.get(category_id)
+        # Hand out a copy: callers mutate the entity before calling update()
+        return copy.copy(category) if category else None
     
     def find_by_slug(self, slug: str) -> Optional[ServiceCategory]:
         """Find category by slug."""
-        db_category = (
-            self.db.query(ServiceCategoryModel)
-            .filter(ServiceCategoryModel.slug == slug)
-            .first()
-        )
-        return self._to_entity(db_category) if db_category else None
+        category = self._snapshot().by_slug.get(slug)
+        return copy.copy(category) if category else None
     
     def find_all(self) -> List[ServiceCategory]:
-        """Find all categories ordered by display_order."""
-        db_categories = (
-            self.db.query(ServiceCategoryModel)
-            .order_by(ServiceCategoryModel.display_order.asc())
-            .all()
-        )
-        return [self._to_entity(c) for c in db_categories]
+        """Find all categories ordered by display_order (served from cache when warm)."""
+        return list(self._snapshot().ordered)
+    
+    def _snapshot(self) -> _CategorySnapshot:
+        """Return the cached categories, loading and indexing them on a miss."""
+        snapshot = _category_cache.get(_ALL_CATEGORIES_KEY)
+        if snapshot is None:
+            db_categories = (
+                self.db.query(ServiceCategoryModel)
+                .order_by(ServiceCategoryModel.display_order.asc())
+                .all()
+            )
+            ordered = [self._to_entity(c) for c in db_categories]
+            snapshot = _CategorySnapshot(
+                ordered=ordered,
+                by_id={c.category_id: c for c in ordered},
+                by_slug={c.slug: c for c in ordered},
+            )
+            _category_cache.set(_ALL_CATEGORIES_KEY, snapshot)
+        return snapshot
     
     def find_all_with_subcategories(self) -> List[dict]:
-        """Find all categories with their subcategories eagerly loaded."""
+        """Find all categories with their subcategories eagerly loaded.
+
+        Issues exactly two queries regardless of category count: one for the
+        categories and one ``WHERE category_id IN (...)`` for subcategories,
+        already ordered by display_order via the relationship.
+        """
         db_categories = (
             self.db.query(ServiceCategoryModel)
-            .options(joinedload(ServiceCategoryModel.subcategories))
+            .options(selectinload(ServiceCategoryModel.subcategories))
             .order_by(ServiceCategoryModel.display_order.asc())
             .all()
         )
-        result = []
-        for cat in db_categories:
-            category_entity = self._to_entity(cat)
-            subcategory_entities = [
-                ServiceSubcategory(
-                    subcategory_id=sc.id,
-                    category_id=sc.category_id,
-                    slug=sc.slug,
-                    name=sc.name,
-                    display_order=sc.display_order,
-                    icon_url=sc.icon_url,
-                    created_at=sc.created_at,
-                )
-                for sc in sorted(cat.subcategories, key=lambda s: s.display_order)
-            ]
-            result.append({
-                "category": category_entity,
-                "subcategories": subcategory_entities,
-            })
-        return result
+        return [
+            {
+                "category": self._to_entity(cat),
+                "subcategories": [self._to_subcategory_entity(sc) for sc in cat.subcategories],
+            }
+            for cat in db_categories
+        ]
     
     def update(self, category: ServiceCategory) -> ServiceCategory:
         """Update an existing category."""
@@ -103,9 +116,10 @@ class ServiceCategoryRepository(IServiceCategoryRepository):
         if db_category:
             db_category.name = category.name
             db_category.display_order = category.display_order
-            db_category.icon_url = getattr(category, 'icon_url', None)
+            db_category.icon_url = category.icon_url
             self.db.commit()
             self.db.refresh(db_category)
+            self.invalidate_cache()
             return self._to_entity(db_category)
         
         return category
@@ -121,10 +135,16 @@ class ServiceCategoryRepository(IServiceCategoryRepository):
         if db_category:
             self.db.delete(db_category)
             self.db.commit()
+            self.invalidate_cache()
             return True
         
         return False
     
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached categories and indexes so the next read hits the database."""
+        _category_cache.clear()
+    
     def _to_entity(self, model: ServiceCategoryModel) -> ServiceCategory:
         """Convert ORM model to domain entity."""
         return ServiceCategory(
@@ -132,6 +152,18 @@ class ServiceCategoryRepository(IServiceCategoryRepository):
             slug=model.slug,
             name=model.name,
             display_order=model.display_order,
-            icon_url=getattr(model, 'icon_url', None),
+            icon_url=model.icon_url,
+            created_at=model.created_at,
+        )
+    
+    def _to_subcategory_entity(self, model: ServiceSubcategoryModel) -> ServiceSubcategory:
+        """Convert subcategory ORM model to domain entity."""
+        return ServiceSubcategory(
+            subcategory_id=model.id,
+            category_id=model.category_id,
+            slug=model.slug,
+            name=model.name,
+            display_order=model.display_order,
+            icon_url=model.icon_url,
             created_at=model.created_at,
         )
@@ -2,12 +2,11 @@
 
 from typing import Optional, List
 from sqlalchemy.orm import Session
-from src.domain.service.repository.service_subcategory_repository import ServiceSubcategoryRepository
 from src.domain.service.entities.service_subcategory import ServiceSubcategory
 from src.infrastructure.persistence.models.service import ServiceSubcategoryModel
 
 
-class ServiceSubcategoryRepositoryImpl(ServiceSubcategoryRepository):
+class ServiceSubcategoryRepositoryImpl:
     """SQLAlchemy-based ServiceSubcategoryRepository."""
     
     def __init__(self, db_session: Session):
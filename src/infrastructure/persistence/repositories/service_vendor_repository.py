@@ -1,14 +1,24 @@
 """ServiceVendor repository implementation."""
 
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Text, and_, cast, false, func, literal, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.orm import Query, Session, defer, joinedload
 
 from src.domain.service.entities.service_vendor import ServiceVendor
-from src.domain.service.repository.service_vendor_repository import ServiceVendorRepository as IServiceVendorRepository
-from src.infrastructure.persistence.models.service import ServiceVendorModel, ServiceCategoryModel
+from src.infrastructure.persistence.models.service import (
+    ServiceVendorModel,
+    ServiceCategoryModel,
+    VendorImageModel,
+)
 
+# Description prefix loaded for list views: one more than the list view's
+# 150-char cut, so callers can still tell whether text was truncated
+SUMMARY_DESCRIPTION_CHARS = 151
 
-class ServiceVendorRepository(IServiceVendorRepository):
+
+class ServiceVendorRepository:
     """PostgreSQL implementation of ServiceVendor persistence."""
     
     def __init__(self, db: Session):
@@ -32,10 +42,16 @@ class ServiceVendorRepository(IServiceVendorRepository):
             updated_at=vendor.updated_at,
         )
         self.db.add(db_vendor)
+        # Flush for the generated ID and map before commit expires the row, so
+        # no refresh SELECT or lazy category load is needed. Callers that need
+        # category details (CreateVendorUseCase) already have the category.
+        self.db.flush()
+        saved = self._to_entity(db_vendor, include_category=False)
+        saved.category_slug = vendor.category_slug
+        saved.category_name = vendor.category_name
         self.db.commit()
-        self.db.refresh(db_vendor)
         
-        return self._to_entity(db_vendor)
+        return saved
     
     def find_by_id(self, vendor_id: int) -> Optional[ServiceVendor]:
         """Find vendor by ID."""
@@ -47,6 +63,18 @@ class ServiceVendorRepository(IServiceVendorRepository):
         )
         return self._to_entity(db_vendor) if db_vendor else None
     
+    def find_by_ids(self, vendor_ids: List[int]) -> Dict[int, ServiceVendor]:
+        """Find several vendors in one query (WHERE id IN ...), keyed by vendor ID."""
+        if not vendor_ids:
+            return {}
+        db_vendors = (
+            self.db.query(ServiceVendorModel)
+            .options(joinedload(ServiceVendorModel.category))
+            .filter(ServiceVendorModel.id.in_(set(vendor_ids)))
+            .all()
+        )
+        return {db_vendor.id: self._to_entity(db_vendor) for db_vendor in db_vendors}
+    
     def find_by_category_id(
         self,
         category_id: int,
@@ -87,8 +115,19 @@ class ServiceVendorRepository(IServiceVendorRepository):
         limit: int = 20,
         active_only: bool = True,
         city: Optional[str] = None,
-    ) -> Tuple[List[ServiceVendor], int]:
-        """Find all vendors for a category by slug with pagination and optional city filter."""
+        after: Optional[Tuple[float, str, int]] = None,
+        include_total: bool = True,
+        summary_only: bool = False,
+    ) -> Tuple[List[ServiceVendor], Optional[int]]:
+        """
+        Find all vendors for a category by slug with pagination and optional city filter.
+        
+        Ordered by (rating DESC, name ASC, id ASC). When `after` holds those
+        values for the last row of the previous page, the page is fetched
+        with a keyset seek instead of OFFSET and `skip` is ignored. With
+        include_total=False the COUNT(*) query is skipped and total is None.
+        summary_only=True loads a list-view projection (see _fetch_page).
+        """
         query = (
             self.db.query(ServiceVendorModel)
             .join(ServiceCategoryModel)
@@ -102,17 +141,36 @@ class ServiceVendorRepository(IServiceVendorRepository):
         if city:
             query = query.filter(ServiceVendorModel.city == city)
         
-        total = query.count()
+        total = query.count() if include_total else None
         
-        db_vendors = (
+        if after is not None:
+            last_rating, last_name, last_id = after
+            query = query.filter(
+                or_(
+                    ServiceVendorModel.rating < last_rating,
+                    and_(
+                        ServiceVendorModel.rating == last_rating,
+                        or_(
+                            ServiceVendorModel.name > last_name,
+                            and_(ServiceVendorModel.name == last_name, ServiceVendorModel.id > last_id),
+                        ),
+                    ),
+                )
+            )
+        else:
+            query = query.offset(skip)
+        
+        query = (
             query
-            .order_by(ServiceVendorModel.rating.desc(), ServiceVendorModel.name.asc())
-            .offset(skip)
+            .order_by(
+                ServiceVendorModel.rating.desc(),
+                ServiceVendorModel.name.asc(),
+                ServiceVendorModel.id.asc(),
+            )
             .limit(limit)
-            .all()
         )
         
-        return [self._to_entity(v) for v in db_vendors], total
+        return self._fetch_page(query, summary_only), total
     
     def find_all(
         self,
@@ -120,8 +178,19 @@ class ServiceVendorRepository(IServiceVendorRepository):
         limit: int = 20,
         active_only: bool = True,
         city: Optional[str] = None,
-    ) -> Tuple[List[ServiceVendor], int]:
-        """Find all vendors with pagination and optional city filter."""
+        after: Optional[Tuple[datetime, int]] = None,
+        include_total: bool = True,
+        summary_only: bool = False,
+    ) -> Tuple[List[ServiceVendor], Optional[int]]:
+        """
+        Find all vendors with pagination and optional city filter.
+        
+        Ordered by (created_at DESC, id DESC). When `after` holds those values
+        for the last row of the previous page, the page is fetched with a
+        keyset seek instead of OFFSET and `skip` is ignored. With
+        include_total=False the COUNT(*) query is skipped and total is None.
+        summary_only=True loads a list-view projection (see _fetch_page).
+        """
         query = (
             self.db.query(ServiceVendorModel)
             .options(joinedload(ServiceVendorModel.category))
@@ -133,17 +202,22 @@ class ServiceVendorRepository(IServiceVendorRepository):
         if city:
             query = query.filter(ServiceVendorModel.city == city)
         
-        total = query.count()
+        total = query.count() if include_total else None
         
-        db_vendors = (
+        if after is not None:
+            query = query.filter(
+                tuple_(ServiceVendorModel.created_at, ServiceVendorModel.id) < tuple_(*after)
+            )
+        else:
+            query = query.offset(skip)
+        
+        query = (
             query
-            .order_by(ServiceVendorModel.created_at.desc())
-            .offset(skip)
+            .order_by(ServiceVendorModel.created_at.desc(), ServiceVendorModel.id.desc())
             .limit(limit)
-            .all()
         )
         
-        return [self._to_entity(v) for v in db_vendors], total
+        return self._fetch_page(query, summary_only), total
     
     def find_by_city(
         self,
@@ -175,11 +249,12 @@ class ServiceVendorRepository(IServiceVendorRepository):
         return [self._to_entity(v) for v in db_vendors], total
     
     def update(self, vendor: ServiceVendor) -> ServiceVendor:
-        """Update an existing vendor."""
-        db_vendor = (
-            self.db.query(ServiceVendorModel)
-            .filter(ServiceVendorModel.id == vendor.vendor_id)
-            .first()
+        """Update an existing vendor and return it with its category joined."""
+        # Served from the identity map when find_by_id ran in this session
+        db_vendor = self.db.get(
+            ServiceVendorModel,
+            vendor.vendor_id,
+            options=[joinedload(ServiceVendorModel.category)],
         )
         
         if db_vendor:
@@ -195,9 +270,10 @@ class ServiceVendorRepository(IServiceVendorRepository):
             db_vendor.is_active = vendor.is_active
             db_vendor.updated_at = vendor.updated_at
             
+            self.db.flush()
+            updated = self._to_entity(db_vendor)
             self.db.commit()
-            self.db.refresh(db_vendor)
-            return self._to_entity(db_vendor)
+            return updated
         
         return vendor
     
@@ -216,6 +292,15 @@ class ServiceVendorRepository(IServiceVendorRepository):
         
         return False
     
+    def mark_image_ingest_failed(self, vendor_id: int) -> None:
+        """Flag that a vendor's background image ingest failed."""
+        self.db.execute(
+            update(ServiceVendorModel)
+            .where(ServiceVendorModel.id == vendor_id)
+            .values(image_ingest_failed=True)
+        )
+        self.db.commit()
+    
     def count_by_category(self, category_id: int, active_only: bool = True) -> int:
         """Count vendors in a category."""
         query = (
@@ -228,27 +313,129 @@ class ServiceVendorRepository(IServiceVendorRepository):
         
         return query.count()
     
-    def _to_entity(self, model: ServiceVendorModel) -> ServiceVendor:
-        """Convert ORM model to domain entity."""
+    def get_detail_json(self, vendor_id: int) -> Optional[bytes]:
+        """Build the vendor detail document in a single statement.
+        
+        PostgreSQL joins the category and images, aggregates hero and gallery
+        images with FILTER, and renders the VendorDetailDTO shape as JSON, so
+        the API can return the bytes without building entities or DTOs.
+        """
+        image = VendorImageModel
+        image_json = func.json_build_object(
+            "id", image.id,
+            "image_type", image.image_type,
+            "url", image.image_url,
+            "thumbnail_url", image.thumbnail_url,
+            "caption", image.caption,
+            "display_order", image.display_order,
+        )
+        empty_list = cast(literal("[]"), JSON)
+        
+        def images_of_type(image_type: str):
+            return func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(image_json, image.display_order, image.id)
+                ).filter(image.image_type == image_type),
+                empty_list,
+            )
+        
+        vendor = ServiceVendorModel
+        category = ServiceCategoryModel
+        detail = func.json_build_object(
+            "id", vendor.id,
+            "category_id", vendor.category_id,
+            "category_slug", category.slug,
+            "category_name", category.name,
+            "name", vendor.name,
+            "description", vendor.description,
+            "city", vendor.city,
+            "address", vendor.address,
+            "phone", vendor.phone,
+            "website", vendor.website,
+            "whatsapp", vendor.whatsapp,
+            "rating", vendor.rating,
+            "hero_images", images_of_type("hero"),
+            "gallery_images", images_of_type("gallery"),
+            "images_processing", false(),
+            "image_ingest_failed", vendor.image_ingest_failed,
+            "metadata", func.coalesce(vendor.vendor_metadata, cast(literal("{}"), JSON)),
+            "is_active", vendor.is_active,
+            "created_at", vendor.created_at,
+            "updated_at", vendor.updated_at,
+        )
+        
+        # Cast to text so the driver hands back the JSON string unparsed
+        stmt = (
+            select(cast(detail, Text))
+            .select_from(vendor)
+            .outerjoin(category, category.id == vendor.category_id)
+            .outerjoin(image, image.vendor_id == vendor.id)
+            .where(vendor.id == vendor_id)
+            .group_by(vendor.id, category.id)
+        )
+        document = self.db.execute(stmt).scalar_one_or_none()
+        return document.encode("utf-8") if document is not None else None
+    
+    def _fetch_page(self, query: Query, summary_only: bool) -> List[ServiceVendor]:
+        """Run a vendor page query.
+        
+        In summary mode the description is cut in SQL to its first
+        SUMMARY_DESCRIPTION_CHARS characters and metadata is not loaded, so
+        list views don't transfer bytes they would discard.
+        """
+        if not summary_only:
+            return [self._to_entity(v) for v in query.all()]
+        
+        rows = (
+            query
+            .options(
+                defer(ServiceVendorModel.description),
+                defer(ServiceVendorModel.vendor_metadata),
+            )
+            .add_columns(func.left(ServiceVendorModel.description, SUMMARY_DESCRIPTION_CHARS))
+            .all()
+        )
+        vendors = []
+        for model, description_prefix in rows:
+            vendor = self._to_entity(model, load_details=False)
+            vendor.description = description_prefix
+            vendors.append(vendor)
+        return vendors
+    
+    def _to_entity(
+        self,
+        model: ServiceVendorModel,
+        include_category: bool = True,
+        load_details: bool = True,
+    ) -> ServiceVendor:
+        """Convert ORM model to domain entity.
+        
+        Args:
+            model: The vendor row
+            include_category: Read category slug/name from the relationship;
+                pass False to avoid a lazy load when it was not joined.
+            load_details: Read description and metadata; pass False when
+                those columns were deferred.
+        """
         category_slug = None
         category_name = None
         
-        if hasattr(model, 'category') and model.category:
+        if include_category and model.category:
             category_slug = model.category.slug
             category_name = model.category.name
         
-        return ServiceVendor(
+        return ServiceVendor.from_row(
             vendor_id=model.id,
             category_id=model.category_id,
             name=model.name,
-            description=model.description,
+            description=model.description if load_details else "",
             address=model.address,
             phone=model.phone,
             website=model.website,
             whatsapp=model.whatsapp,
             city=model.city,
             rating=model.rating,
-            metadata=model.vendor_metadata or {},
+            metadata=model.vendor_metadata if load_details else None,
             is_active=model.is_active,
             created_at=model.created_at,
             updated_at=model.updated_at,
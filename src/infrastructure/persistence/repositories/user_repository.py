@@ -1,14 +1,33 @@
 """UserRepository implementation - PostgreSQL persistence."""
 
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from src.domain.user.entities.user import User
+from src.domain.user.repository.user_repository import UserListRow
 from src.domain.shared.exceptions import DuplicateResourceError
 from src.infrastructure.persistence.models.user import UserModel
 
 
+# Columns of a UserListRow, in field order
+_PROJECTION_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.full_name,
+    UserModel.phone_number,
+    UserModel.tier,
+    UserModel.is_active,
+    UserModel.is_admin,
+    UserModel.created_at,
+    UserModel.updated_at,
+)
+
+
 class PostgreSQLUserRepository:
     """SQLAlchemy-based UserRepository for PostgreSQL."""
 
@@ -16,44 +35,83 @@ class PostgreSQLUserRepository:
         """Initialize repository with database session."""
         self._session = db_session
 
-    def save(self, user: User) -> User:
-        """Save a new user to database.
+    def create(
+        self,
+        email: str,
+        hashed_password: str,
+        first_name: str,
+        last_name: str,
+        phone_number: Optional[str] = None,
+        is_admin: bool = False,
+    ) -> User:
+        """Insert a new user and return it with its database ID.
         
         Args:
-            user: Domain User entity to persist
+            email: User email
+            hashed_password: Bcrypt hashed password
+            first_name: User's first name
+            last_name: User's last name
+            phone_number: Optional phone number
+            is_admin: Whether the user has admin privileges
             
         Returns:
-            Saved user with persistence ID
+            Created User entity
             
         Raises:
             DuplicateResourceError: If email already exists
         """
+        now = datetime.utcnow()
         try:
             # Create ORM model (skip ID for autoincrement)
             model = UserModel(
-                email=user.email,
-                hashed_password=user.hashed_password,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                full_name=f"{user.first_name} {user.last_name}",
-                phone_number=user.phone_number,
+                email=email,
+                hashed_password=hashed_password,
+                first_name=first_name,
+                last_name=last_name,
+                full_name=first_name + " " + last_name,
+                phone_number=phone_number,
                 tier=None,  # Default tier, will be set by subscription
                 is_active=True,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
+                is_admin=is_admin,
+                created_at=now,
+                updated_at=now,
             )
             self._session.add(model)
             self._session.flush()  # Get ID from autoincrement
-            # Update domain entity with generated ID
-            user.user_id = model.id
+            # Map before commit expires the row
+            user = self._to_entity(model)
             self._session.commit()
             return user
         except IntegrityError as e:
             self._session.rollback()
             if "users_email_key" in str(e) or "duplicate" in str(e).lower():
-                raise DuplicateResourceError(f"User with email {user.email} already exists")
+                raise DuplicateResourceError(f"User with email {email} already exists")
             raise
 
+    def save(self, user: User) -> User:
+        """Save a new user to database.
+        
+        Args:
+            user: Domain User entity to persist
+            
+        Returns:
+            Saved user with persistence ID
+            
+        Raises:
+            DuplicateResourceError: If email already exists
+        """
+        created = self.create(
+            email=user.email,
+            hashed_password=user.hashed_password,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            phone_number=user.phone_number,
+            is_admin=user.is_admin,
+        )
+        # Update domain entity with generated ID
+        user.user_id = created.user_id
+        return user
+
     def find_by_id(self, user_id: int) -> Optional[User]:
         """Retrieve user by ID.
         
@@ -84,9 +142,26 @@ class PostgreSQLUserRepository:
 
         return self._to_entity(model) if model else None
 
+    def find_projection_by_id(self, user_id: int) -> Optional[UserListRow]:
+        """Retrieve the read-only projection of a user by ID.
+        
+        Selects only the response columns, skipping the ORM instance and
+        entity that find_by_id builds.
+        
+        Args:
+            user_id: User ID to find
+            
+        Returns:
+            UserListRow or None if not found
+        """
+        row = self._session.execute(
+            select(*_PROJECTION_COLUMNS).where(UserModel.id == user_id)
+        ).first()
+        return UserListRow._make(row) if row else None
+
     def _to_entity(self, model: UserModel) -> User:
         """Convert SQLAlchemy UserModel to domain User entity."""
-        user = User(
+        return User(
             user_id=model.id,
             email=model.email,
             hashed_password=model.hashed_password,
@@ -95,11 +170,11 @@ class PostgreSQLUserRepository:
             phone_number=model.phone_number,
             created_at=model.created_at,
             updated_at=model.updated_at,
+            full_name=model.full_name,
+            tier=model.tier,
+            is_active=model.is_active,
+            is_admin=model.is_admin,
         )
-        user.tier = model.tier
-        user.is_active = model.is_active
-        user.is_admin = getattr(model, 'is_admin', False)
-        return user
 
     def update(self, user: User) -> User:
         """Update an existing user.
@@ -117,7 +192,8 @@ class PostgreSQLUserRepository:
         if model:
             model.first_name = user.first_name
             model.last_name = user.last_name
-            model.full_name = f"{user.first_name} {user.last_name}"
+            # Names may have been edited on the entity; rebuild the stored name
+            model.full_name = user.first_name + " " + user.last_name
             model.phone_number = user.phone_number
             model.hashed_password = user.hashed_password  # Allow password updates
             self._session.commit()
@@ -126,6 +202,43 @@ class PostgreSQLUserRepository:
         
         return user
 
+    def update_fields(self, user_id: int, changes: Dict[str, Any]) -> Optional[User]:
+        """Apply column changes to a user in a single UPDATE ... RETURNING.
+        
+        Args:
+            user_id: User ID to update
+            changes: Column values to set (e.g. first_name, tier, is_admin)
+            
+        Returns:
+            Updated user entity, or None if not found
+        """
+        if not changes:
+            return self.find_by_id(user_id)
+
+        values = dict(changes, updated_at=datetime.utcnow())
+        if "first_name" in values or "last_name" in values:
+            # Unchanged name parts come from the row being updated
+            values["full_name"] = func.concat(
+                values.get("first_name", UserModel.first_name),
+                " ",
+                values.get("last_name", UserModel.last_name),
+            )
+
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**values)
+            .returning(UserModel)
+            # The request session may already hold this user (e.g. the admin
+            # check loaded the caller); overwrite it with the returned row
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        model = self._session.scalars(stmt).one_or_none()
+        # Map before commit expires the returned row
+        user = self._to_entity(model) if model else None
+        self._session.commit()
+        return user
+
     def delete(self, user_id: int) -> bool:
         """Delete a user by ID.
         
@@ -135,16 +248,11 @@ class PostgreSQLUserRepository:
         Returns:
             True if deleted, False if not found
         """
-        model = self._session.query(UserModel).filter(
+        deleted = self._session.query(UserModel).filter(
             UserModel.id == user_id
-        ).first()
-        
-        if model:
-            self._session.delete(model)
-            self._session.commit()
-            return True
-        
-        return False
+        ).delete(synchronize_session=False)
+        self._session.commit()
+        return deleted > 0
 
     def find_all_admins(self):
         """Find all admin users.
@@ -178,3 +286,29 @@ class PostgreSQLUserRepository:
             Total user count
         """
         return self._session.query(UserModel).count()
+
+    def find_page_projection(self, skip: int = 0, limit: int = 100) -> Tuple[List[UserListRow], int]:
+        """Retrieve a page of user list rows together with the total user count.
+        
+        Selects only the columns list views serialize (no password hash, no
+        ORM instances), and takes the total from COUNT(*) OVER () on the same
+        query, so listing needs one round trip instead of find_all + count_all.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (UserListRow projections, total user count)
+        """
+        stmt = (
+            select(*_PROJECTION_COLUMNS, func.count().over().label("total"))
+            .order_by(UserModel.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = self._session.execute(stmt).all()
+        if not rows:
+            # Past the last page there is no row to carry the total
+            return [], self.count_all() if skip else 0
+        return [UserListRow._make(row[:-1]) for row in rows], rows[0].total
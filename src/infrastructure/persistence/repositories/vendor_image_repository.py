@@ -1,15 +1,20 @@
 """VendorImage repository implementation."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.exc import IntegrityError
 
 from src.domain.service.entities.vendor_image import VendorImage
-from src.domain.service.repository.vendor_image_repository import VendorImageRepository as IVendorImageRepository
-from src.infrastructure.persistence.models.service import VendorImageModel
+from src.domain.shared.exceptions import ResourceNotFoundError
+from src.infrastructure.persistence.models.service import ServiceVendorModel, VendorImageModel
 
 
-class VendorImageRepository(IVendorImageRepository):
+# PostgreSQL SQLSTATE for foreign_key_violation
+_FOREIGN_KEY_VIOLATION = "23503"
+
+
+class VendorImageRepository:
     """PostgreSQL implementation of VendorImage persistence."""
     
     def __init__(self, db: Session):
@@ -32,6 +37,107 @@ class VendorImageRepository(IVendorImageRepository):
         
         return self._to_entity(db_image)
     
+    def save_with_next_order(self, image: VendorImage) -> VendorImage:
+        """
+        Save an image at the end of its type's display order.
+        
+        The vendor row is locked first (FOR NO KEY UPDATE), which serializes
+        concurrent appends for the same vendor so they cannot compute the
+        same display_order; the next order is then computed by a subquery
+        inside the INSERT.
+        
+        Raises:
+            ResourceNotFoundError: If the vendor does not exist
+        """
+        vendor_exists = self.db.execute(
+            select(ServiceVendorModel.id)
+            .where(ServiceVendorModel.id == image.vendor_id)
+            .with_for_update(key_share=True)
+        ).first()
+        if vendor_exists is None:
+            self.db.rollback()
+            raise ResourceNotFoundError(f"Vendor {image.vendor_id} not found")
+        
+        next_order = (
+            select(func.coalesce(func.max(VendorImageModel.display_order), 0) + 1)
+            .where(VendorImageModel.vendor_id == image.vendor_id)
+            .where(VendorImageModel.image_type == image.image_type)
+            .scalar_subquery()
+        )
+        stmt = (
+            insert(VendorImageModel)
+            .values(
+                vendor_id=image.vendor_id,
+                image_type=image.image_type,
+                image_url=image.image_url,
+                thumbnail_url=image.thumbnail_url,
+                caption=image.caption,
+                display_order=next_order,
+                created_at=image.created_at,
+            )
+            .returning(VendorImageModel.id, VendorImageModel.display_order)
+        )
+        try:
+            image_id, display_order = self.db.execute(stmt).one()
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if getattr(e.orig, "pgcode", None) == _FOREIGN_KEY_VIOLATION:
+                raise ResourceNotFoundError(f"Vendor {image.vendor_id} not found")
+            raise
+        
+        image.image_id = image_id
+        image.display_order = display_order
+        return image
+    
+    def save_many(self, images: List[VendorImage]) -> List[VendorImage]:
+        """Save several images in one transaction and return them with generated IDs."""
+        if not images:
+            return []
+        saved = self._insert_many(images)
+        self.db.commit()
+        return saved
+    
+    def replace_images(
+        self,
+        vendor_id: int,
+        image_type: str,
+        new_images: List[VendorImage],
+    ) -> List[VendorImage]:
+        """Replace all of a vendor's images of one type: one DELETE, one batched INSERT, one commit."""
+        try:
+            (
+                self.db.query(VendorImageModel)
+                .filter(VendorImageModel.vendor_id == vendor_id)
+                .filter(VendorImageModel.image_type == image_type)
+                .delete(synchronize_session=False)
+            )
+            saved = self._insert_many(new_images)
+            self.db.commit()
+            return saved
+        except Exception:
+            self.db.rollback()
+            raise
+    
+    def _insert_many(self, images: List[VendorImage]) -> List[VendorImage]:
+        """Add and flush images without committing; returns them with generated IDs."""
+        db_images = [
+            VendorImageModel(
+                vendor_id=image.vendor_id,
+                image_type=image.image_type,
+                image_url=image.image_url,
+                thumbnail_url=image.thumbnail_url,
+                caption=image.caption,
+                display_order=image.display_order,
+                created_at=image.created_at,
+            )
+            for image in images
+        ]
+        self.db.add_all(db_images)
+        # Flush to get IDs in one batched INSERT; map before commit expires the rows
+        self.db.flush()
+        return [self._to_entity(db_image) for db_image in db_images]
+    
     def find_by_id(self, image_id: int) -> Optional[VendorImage]:
         """Find image by ID."""
         db_image = (
@@ -71,6 +177,15 @@ class VendorImageRepository(IVendorImageRepository):
         """Find all gallery images for a vendor."""
         return self.find_by_vendor_id(vendor_id, image_type="gallery")
     
+    def find_images_grouped(self, vendor_id: int) -> Dict[str, List[VendorImage]]:
+        """Find all images for a vendor in one query, grouped by image type."""
+        grouped: Dict[str, List[VendorImage]] = {
+            image_type: [] for image_type in VendorImage.VALID_IMAGE_TYPES
+        }
+        for image in self.find_by_vendor_id(vendor_id):
+            grouped.setdefault(image.image_type, []).append(image)
+        return grouped
+    
     def find_first_hero_image(self, vendor_id: int) -> Optional[VendorImage]:
         """Find the first hero image for a vendor (for list thumbnails)."""
         db_image = (
@@ -82,6 +197,24 @@ class VendorImageRepository(IVendorImageRepository):
         )
         return self._to_entity(db_image) if db_image else None
     
+    def find_first_hero_images_for_vendors(self, vendor_ids: List[int]) -> Dict[int, VendorImage]:
+        """Find the first hero image of each vendor in one query (DISTINCT ON vendor_id)."""
+        if not vendor_ids:
+            return {}
+        db_images = (
+            self.db.query(VendorImageModel)
+            .filter(VendorImageModel.vendor_id.in_(set(vendor_ids)))
+            .filter(VendorImageModel.image_type == "hero")
+            .distinct(VendorImageModel.vendor_id)
+            .order_by(
+                VendorImageModel.vendor_id,
+                VendorImageModel.display_order.asc(),
+                VendorImageModel.id.asc(),
+            )
+            .all()
+        )
+        return {db_image.vendor_id: self._to_entity(db_image) for db_image in db_images}
+    
     def update(self, image: VendorImage) -> VendorImage:
         """Update an existing image."""
         db_image = (
@@ -114,6 +247,17 @@ class VendorImageRepository(IVendorImageRepository):
         
         return False
     
+    def delete_for_vendor(self, vendor_id: int, image_id: int) -> bool:
+        """Delete an image only if it belongs to the vendor, in one DELETE."""
+        count = (
+            self.db.query(VendorImageModel)
+            .filter(VendorImageModel.id == image_id)
+            .filter(VendorImageModel.vendor_id == vendor_id)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return count > 0
+    
     def delete_by_vendor_id(self, vendor_id: int) -> int:
         """Delete all images for a vendor.
 
@@ -133,18 +277,22 @@ class VendorImageRepository(IVendorImageRepository):
     
     def reorder(self, vendor_id: int, image_type: str, image_ids: List[int]) -> bool:
         """Reorder images by setting display_order based on position in image_ids list."""
+        if not image_ids:
+            return True
+        
+        order_by_id = {image_id: order for order, image_id in enumerate(image_ids)}
         try:
-            for order, image_id in enumerate(image_ids):
-                db_image = (
-                    self.db.query(VendorImageModel)
-                    .filter(VendorImageModel.id == image_id)
-                    .filter(VendorImageModel.vendor_id == vendor_id)
-                    .filter(VendorImageModel.image_type == image_type)
-                    .first()
+            # One UPDATE ... SET display_order = CASE id WHEN ... END for all images
+            (
+                self.db.query(VendorImageModel)
+                .filter(VendorImageModel.id.in_(order_by_id))
+                .filter(VendorImageModel.vendor_id == vendor_id)
+                .filter(VendorImageModel.image_type == image_type)
+                .update(
+                    {VendorImageModel.display_order: case(order_by_id, value=VendorImageModel.id)},
+                    synchronize_session=False,
                 )
-                if db_image:
-                    db_image.display_order = order
-            
+            )
             self.db.commit()
             return True
         except Exception:
@@ -163,7 +311,7 @@ class VendorImageRepository(IVendorImageRepository):
     
     def _to_entity(self, model: VendorImageModel) -> VendorImage:
         """Convert ORM model to domain entity."""
-        return VendorImage(
+        return VendorImage.from_row(
             image_id=model.id,
             vendor_id=model.vendor_id,
             image_type=model.image_type,
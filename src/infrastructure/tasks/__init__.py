@@ -2,10 +2,12 @@
 
 from src.infrastructure.tasks.scheduler import start_scheduler, stop_scheduler, get_scheduler_status
 from src.infrastructure.tasks.subscription_checker import check_expiring_subscriptions
+from src.infrastructure.tasks.notification_counter import reconcile_unread_notification_counts
 
 __all__ = [
     "start_scheduler",
     "stop_scheduler",
     "get_scheduler_status",
     "check_expiring_subscriptions",
+    "reconcile_unread_notification_counts",
 ]
@@ -0,0 +1,55 @@
+"""Background ingestion of vendor images created alongside a vendor."""
+
+from typing import List
+
+from fastapi import BackgroundTasks
+
+from src.application.service.services.image_ingest_queue import ImageIngestQueue
+from src.domain.service.entities.vendor_image import VendorImage
+from src.infrastructure.persistence.database import SessionLocal
+from src.infrastructure.persistence.repositories.service_vendor_repository import ServiceVendorRepository
+from src.infrastructure.persistence.repositories.vendor_image_repository import VendorImageRepository
+from src.shared.logger.config import get_logger
+
+logger = get_logger(__name__)
+
+
+def ingest_vendor_images(vendor_id: int, images: List[VendorImage]) -> int:
+    """
+    Persist a batch of vendor images in a dedicated session.
+
+    Runs after the HTTP response, when the request-scoped session is already
+    closed, so it opens its own. On failure the vendor is flagged with
+    image_ingest_failed so clients can see the images were not saved.
+
+    Returns:
+        Number of images saved
+    """
+    db = SessionLocal()
+    try:
+        saved = VendorImageRepository(db).save_many(images)
+        logger.info("Ingested %d images for vendor %s", len(saved), vendor_id)
+        return len(saved)
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to ingest images for vendor %s", vendor_id)
+        try:
+            ServiceVendorRepository(db).mark_image_ingest_failed(vendor_id)
+        except Exception:
+            db.rollback()
+            logger.exception("Failed to flag image ingest failure for vendor %s", vendor_id)
+        return 0
+    finally:
+        db.close()
+
+
+class BackgroundImageIngestQueue(ImageIngestQueue):
+    """ImageIngestQueue backed by FastAPI BackgroundTasks."""
+
+    def __init__(self, background_tasks: BackgroundTasks):
+        self.background_tasks = background_tasks
+
+    def enqueue_batch(self, vendor_id: int, images: List[VendorImage]) -> None:
+        """Schedule the batch to run once the response has been sent."""
+        if images:
+            self.background_tasks.add_task(ingest_vendor_images, vendor_id, images)
@@ -0,0 +1,29 @@
+"""Background task to reconcile denormalized unread notification counts."""
+
+from src.infrastructure.persistence.database import SessionLocal
+from src.infrastructure.persistence.repositories.notification_repository import PostgreSQLNotificationRepository
+from src.shared.logger.config import get_logger
+
+logger = get_logger(__name__)
+
+
+def reconcile_unread_notification_counts() -> int:
+    """
+    Recompute users.unread_notifications from the notifications table.
+    
+    Returns:
+        Number of users whose counter was corrected
+    """
+    db = SessionLocal()
+    
+    try:
+        notification_repo = PostgreSQLNotificationRepository(db)
+        corrected = notification_repo.reconcile_unread_counts()
+        logger.info(f"Unread notification counts reconciled. Corrected {corrected} users")
+        return corrected
+        
+    except Exception as e:
+        logger.error(f"Error reconciling unread notification counts: {e}")
+        return 0
+    finally:
+        db.close()
@@ -3,6 +3,7 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from src.infrastructure.tasks.subscription_checker import run_subscription_checker
+from src.infrastructure.tasks.notification_counter import reconcile_unread_notification_counts
 from src.shared.logger.config import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +24,15 @@ def start_scheduler():
         replace_existing=True,
     )
     
+    # Repair drift in the denormalized unread counters - runs daily at 3 AM
+    scheduler.add_job(
+        reconcile_unread_notification_counts,
+        trigger=CronTrigger(hour=3, minute=0),
+        id="unread_notification_reconciler",
+        name="Reconcile unread notification counts",
+        replace_existing=True,
+    )
+    
     logger.info("Starting background scheduler...")
     scheduler.start()
     logger.info("Background scheduler started successfully")
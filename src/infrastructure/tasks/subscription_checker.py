@@ -37,12 +37,13 @@ def check_expiring_subscriptions() -> int:
         
         logger.info(f"Checking {len(all_subscriptions)} subscriptions for expiration")
         
+        now = datetime.utcnow()
         for subscription in all_subscriptions:
-            if subscription.status != SubscriptionStatus.ACTIVE:
+            if subscription.status is not SubscriptionStatus.ACTIVE:
                 continue
                 
             # Check days remaining
-            days_left = subscription.days_remaining()
+            days_left = subscription.days_remaining_at(now)
             
             # Notify if expiring in 3 days or less
             if days_left is not None and 0 < days_left <= 3:
@@ -0,0 +1,41 @@
+"""Response classes shared by the API."""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by pydantic-core's Rust encoder instead of json.dumps.
+
+    Output is compact UTF-8 JSON, like Starlette's JSONResponse, and
+    datetimes/enums that slip through un-serialized are encoded natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def json_bytes_response(content: bytes, status_code: int = 200) -> Response:
+    """Return JSON that is already serialized (e.g. rendered by the database)."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize a response DTO directly to a JSON Response.
+
+    Returning a model normally makes FastAPI dump it to a dict, re-validate
+    that dict against response_model, and serialize it again. For DTOs the
+    application already built from trusted entities (often via
+    model_construct), one model_dump_json pass is enough. Keep
+    response_model on the route for OpenAPI docs.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
@@ -23,7 +23,7 @@ from src.infrastructure.web.dependencies import (
     get_conversation_use_case,
     get_current_user,
     get_send_message_use_case,
-    get_user_repository,
+    get_auth_user_repository,
     get_create_booking_use_case,
     get_current_admin_user,
     get_list_all_conversations_use_case,
@@ -50,12 +50,12 @@ class AdminInfo(BaseModel):
 
 def get_admin_user(
     user_id: int = Depends(get_current_user),
-    user_repo: UserRepository = Depends(get_user_repository),
+    user_repo: UserRepository = Depends(get_auth_user_repository),
 ):
     """Dependency to ensure user is an admin."""
     user = user_repo.find_by_id(user_id)
     
-    if not user or not getattr(user, 'is_admin', False):
+    if not user or not user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
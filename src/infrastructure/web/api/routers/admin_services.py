@@ -56,6 +56,8 @@ from src.infrastructure.web.dependencies import (
     get_delete_subcategory_use_case,
     get_service_subcategory_repository,
 )
+from src.infrastructure.web.api.responses import json_bytes_response, model_response
+from src.infrastructure.web.api.streaming import stream_json_list
 from src.shared.logger.config import get_logger
 
 logger = get_logger(__name__)
@@ -90,8 +92,10 @@ def create_vendor(
 def list_all_vendors(
     category_slug: str = Query(None, description="Optional: Filter by category slug"),
     city: str = Query(None, description="Optional: Filter by city"),
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, description="Offset paging; prefer cursor for deep pages"),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None, description="Optional: next_cursor from the previous page"),
+    include_total: bool = Query(True, description="Set false to skip counting the total"),
     admin_id: int = Depends(get_current_admin_user),
     use_case: ListVendorsByCategoryUseCase = Depends(get_list_vendors_by_category_use_case),
 ) -> VendorListResponseDTO:
@@ -101,12 +105,14 @@ def list_all_vendors(
     Optionally filter by category slug and/or city. 
     Shows all vendors including inactive ones.
     """
-    return use_case.execute(
+    return model_response(use_case.execute(
         category_slug=category_slug,
         skip=skip,
         limit=limit,
         city=city,
-    )
+        cursor=cursor,
+        include_total=include_total,
+    ))
 
 
 @router.get("/vendors/{vendor_id}", response_model=VendorDetailDTO)
@@ -118,7 +124,7 @@ def get_vendor(
     """
     Get vendor details (admin view).
     """
-    return use_case.execute(vendor_id)
+    return json_bytes_response(use_case.execute(vendor_id))
 
 
 @router.put("/vendors/{vendor_id}", response_model=VendorDetailDTO)
@@ -186,8 +192,8 @@ def list_categories_with_subcategories(
     admin_id: int = Depends(get_current_admin_user),
     use_case = Depends(get_list_categories_with_subcategories_use_case),
 ) -> ServiceCategoryWithSubcategoriesListResponseDTO:
-    """List all categories with their subcategories nested (admin view)."""
-    return use_case.execute()
+    """List all categories with their subcategories nested (admin view), streamed per category."""
+    return stream_json_list("categories", use_case.iter_categories())
 
 
 @router.post("/categories", response_model=ServiceCategoryWithSubcategoriesDTO, status_code=status.HTTP_201_CREATED)
@@ -265,8 +271,8 @@ def list_all_subcategories(
     admin_id: int = Depends(get_current_admin_user),
     use_case = Depends(get_list_all_subcategories_use_case),
 ) -> ServiceSubcategoryListResponseDTO:
-    """List all service subcategories (admin view)."""
-    return use_case.execute()
+    """List all service subcategories (admin view), streamed one at a time."""
+    return stream_json_list("subcategories", use_case.iter_subcategories())
 
 
 @router.get("/subcategories/{subcategory_id}", response_model=ServiceSubcategoryResponseDTO)
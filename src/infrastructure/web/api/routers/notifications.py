@@ -5,11 +5,13 @@ from fastapi import APIRouter, Depends, Query
 from src.application.notification.dto.notification_dto import (
     NotificationListResponseDTO,
     MarkAsReadResponseDTO,
+    MarkNotificationsAsReadRequestDTO,
     UnreadCountResponseDTO,
 )
 from src.application.notification.use_cases.notification_use_cases import (
     GetUserNotificationsUseCase,
     MarkNotificationAsReadUseCase,
+    MarkNotificationsAsReadUseCase,
     MarkAllNotificationsAsReadUseCase,
     GetUnreadCountUseCase,
 )
@@ -47,6 +49,13 @@ def get_mark_as_read_use_case(
     return MarkNotificationAsReadUseCase(notification_repo)
 
 
+def get_mark_many_as_read_use_case(
+    notification_repo: PostgreSQLNotificationRepository = Depends(get_notification_repository),
+) -> MarkNotificationsAsReadUseCase:
+    """Get mark several notifications as read use case."""
+    return MarkNotificationsAsReadUseCase(notification_repo)
+
+
 def get_mark_all_as_read_use_case(
     notification_repo: PostgreSQLNotificationRepository = Depends(get_notification_repository),
 ) -> MarkAllNotificationsAsReadUseCase:
@@ -105,6 +114,18 @@ async def mark_as_read(
     return use_case.execute(notification_id, user_id)
 
 
+@router.put("/read", response_model=MarkAsReadResponseDTO, summary="Mark several notifications as read")
+async def mark_many_as_read(
+    dto: MarkNotificationsAsReadRequestDTO,
+    user_id: int = Depends(get_current_user),
+    use_case: MarkNotificationsAsReadUseCase = Depends(get_mark_many_as_read_use_case),
+) -> MarkAsReadResponseDTO:
+    """
+    Mark the given notifications as read for current user.
+    """
+    return use_case.execute(dto, user_id)
+
+
 @router.put("/mark-all-read", response_model=MarkAsReadResponseDTO, summary="Mark all notifications as read")
 async def mark_all_as_read(
     user_id: int = Depends(get_current_user),
@@ -28,6 +28,8 @@ from src.infrastructure.web.dependencies import (
     get_vendor_detail_use_case,
     get_vendor_image_use_case,
 )
+from src.infrastructure.web.api.responses import json_bytes_response, model_response
+from src.infrastructure.web.api.streaming import stream_json_list
 from src.shared.logger.config import get_logger
 
 logger = get_logger(__name__)
@@ -58,9 +60,10 @@ def list_categories_with_subcategories(
     List all service categories with their subcategories nested.
     
     Returns the full category tree in a single call — each category
-    includes its list of subcategories.
+    includes its list of subcategories. The body is streamed one category
+    at a time.
     """
-    return use_case.execute()
+    return stream_json_list("categories", use_case.iter_categories())
 
 
 @router.get("/categories/{category_id}/subcategories", response_model=ServiceSubcategoryListResponseDTO)
@@ -94,8 +97,10 @@ from typing import Optional
 )
 def list_vendors(
     category_slug: Optional[str] = None,
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, description="Offset paging; prefer cursor for deep pages"),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(True, description="Set false to skip counting the total"),
     city: Optional[str] = Query(None, description="Filter vendors by city"),
     use_case: ListVendorsByCategoryUseCase = Depends(get_list_vendors_by_category_use_case),
 ) -> VendorListResponseDTO:
@@ -105,13 +110,17 @@ def list_vendors(
     
     Query Parameters:
     - city: Optional city name to filter vendors (e.g., ?city=Riyadh)
+    - cursor: Optional next_cursor from the previous page (keyset paging)
+    - include_total: Set false to skip the total count (total is null)
     """
-    return use_case.execute(
+    return model_response(use_case.execute(
         category_slug=category_slug,
         skip=skip,
         limit=limit,
         city=city,
-    )
+        cursor=cursor,
+        include_total=include_total,
+    ))
 
 
 @router.get("/vendors/{vendor_id}", response_model=VendorDetailDTO)
@@ -125,7 +134,7 @@ def get_vendor_detail(
     Includes hero images, gallery images, and type-specific metadata
     (dishes for restaurants, rooms for hotels, etc.).
     """
-    return use_case.execute(vendor_id)
+    return json_bytes_response(use_case.execute(vendor_id))
 
 
 @router.get("/images/{image_id}", response_model=VendorImageDTO)
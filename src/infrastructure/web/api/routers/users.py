@@ -14,7 +14,11 @@ from src.application.user.use_cases.user_use_cases import (
     DeleteAccountUseCase,
 )
 from src.domain.user.repository.user_repository import UserRepository
-from src.infrastructure.web.dependencies import get_current_user, get_user_repository
+from src.infrastructure.web.dependencies import (
+    get_auth_user_repository,
+    get_current_user,
+    get_user_repository,
+)
 from src.shared.logger.config import get_logger
 
 logger = get_logger(__name__)
@@ -39,19 +43,7 @@ def get_current_user_profile(
             detail="User not found"
         )
     
-    return UserResponse(
-        id=user.user_id,
-        email=user.email,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        full_name=f"{user.first_name} {user.last_name}",
-        phone_number=user.phone_number,
-        tier=getattr(user, 'tier', None),
-        is_active=getattr(user, 'is_active', True),
-        created_at=user.created_at,
-        is_admin=getattr(user, 'is_admin', False),
-        updated_at=user.updated_at,
-    )
+    return UserResponse.from_entity(user)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -82,26 +74,14 @@ def update_current_user_profile(
     
     logger.info(f"User profile updated: {updated_user.email}")
     
-    return UserResponse(
-        id=updated_user.user_id,
-        email=updated_user.email,
-        first_name=updated_user.first_name,
-        last_name=updated_user.last_name,
-        full_name=f"{updated_user.first_name} {updated_user.last_name}",
-        phone_number=updated_user.phone_number,
-        tier=getattr(updated_user, 'tier', None),
-        is_active=getattr(updated_user, 'is_active', True),
-        is_admin=getattr(updated_user, 'is_admin', False),
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-    )
+    return UserResponse.from_entity(updated_user)
 
 
 @router.post("/change-password", response_model=ChangePasswordResponse)
 def change_password(
     request: ChangePasswordRequest,
     user_id: int = Depends(get_current_user),
-    user_repo: UserRepository = Depends(get_user_repository),
+    user_repo: UserRepository = Depends(get_auth_user_repository),
 ) -> ChangePasswordResponse:
     """Change the current user's password."""
     use_case = ChangePasswordUseCase(user_repo)
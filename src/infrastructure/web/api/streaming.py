@@ -0,0 +1,28 @@
+"""Helpers for streaming large JSON list responses."""
+
+from typing import Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+def iter_json_list(key: str, items: Iterable[BaseModel]) -> Iterator[bytes]:
+    """
+    Encode ``{"<key>": [item, ...]}`` incrementally, one item at a time.
+
+    Only the item currently being serialized is held as JSON, instead of the
+    full response body plus the complete DTO tree.
+    """
+    yield b'{"' + key.encode("utf-8") + b'":['
+    first = True
+    for item in items:
+        if not first:
+            yield b","
+        yield item.model_dump_json().encode("utf-8")
+        first = False
+    yield b"]}"
+
+
+def stream_json_list(key: str, items: Iterable[BaseModel]) -> StreamingResponse:
+    """Build a StreamingResponse emitting ``{"<key>": [...]}`` from a lazy iterable."""
+    return StreamingResponse(iter_json_list(key, items), media_type="application/json")
@@ -339,7 +339,10 @@ async def websocket_chat(
     
     try:
         # 3. Verify user has access to this conversation
+        # All repos/services share this one session for the socket's lifetime
         conversation_repo = ConversationRepository(db)
+        user_repo = PostgreSQLUserRepository(db)
+        notification_service = NotificationService(db)
         conversation = conversation_repo.find_by_id(conversation_id)
         
         if not conversation:
@@ -391,9 +394,6 @@ async def websocket_chat(
                 
                 # Send notification to the other party (if user sends, notify admin; if admin sends, notify user)
                 try:
-                    user_repo = PostgreSQLUserRepository(db)
-                    notification_service = NotificationService(db)
-                    
                     if sender_type == "user":
                         # User sent message - notify admins (skip for now, can be enhanced later)
                         pass
@@ -17,6 +17,7 @@ from src.infrastructure.web.dependencies.injection import (
 	get_send_message_use_case,
 	get_submit_request_use_case,
 	get_user_repository,
+	get_auth_user_repository,
 	get_user_use_case,
 	get_list_all_users_use_case,
 	get_user_by_id_use_case,
@@ -75,6 +76,7 @@ __all__ = [
 	"get_current_admin_user",
 	"get_optional_user",
 	"get_user_repository",
+	"get_auth_user_repository",
 	"get_create_user_use_case",
 	"get_authenticate_user_use_case",
 	"get_user_use_case",
@@ -1,7 +1,7 @@
 """FastAPI dependency injection setup."""
 
 from typing import Optional, Generator
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
@@ -74,6 +74,8 @@ from src.application.content.use_cases.content_use_cases import (
     UpdateBannerUseCase,
     DeleteBannerUseCase,
 )
+from src.domain.content.repository.city_repository import CityRepository
+from src.domain.plan.repository.plan_repository import PlanRepository
 from src.domain.request.repository.request_repository import RequestRepository
 from src.domain.user.repository.user_repository import UserRepository
 from src.infrastructure.persistence.database import SessionLocal
@@ -82,16 +84,20 @@ from src.infrastructure.persistence.repositories.request_repository import (
     RequestRepository as PostgreSQLRequestRepository,
 )
 from src.infrastructure.persistence.repositories.user_repository import PostgreSQLUserRepository
+from src.infrastructure.persistence.repositories.cached_user_repository import CachedUserRepository
 from src.infrastructure.persistence.repositories.service_category_repository import ServiceCategoryRepository
 from src.infrastructure.persistence.repositories.service_subcategory_repository_impl import ServiceSubcategoryRepositoryImpl
 from src.infrastructure.persistence.repositories.service_vendor_repository import ServiceVendorRepository
 from src.infrastructure.persistence.repositories.vendor_image_repository import VendorImageRepository
 from src.infrastructure.persistence.repositories.booking_repository import BookingRepository
 from src.infrastructure.persistence.repositories.plan.plan_repository import PostgreSQLPlanRepository
+from src.infrastructure.persistence.repositories.plan.cached_plan_repository import CachedPlanRepository
 from src.infrastructure.persistence.repositories.plan.subscription_repository import PostgreSQLSubscriptionRepository
 from src.infrastructure.persistence.repositories.notification_repository import PostgreSQLNotificationRepository
 from src.infrastructure.persistence.repositories.banner_repository import PostgreSQLBannerRepository
 from src.infrastructure.persistence.repositories.city_repository import PostgreSQLCityRepository
+from src.infrastructure.persistence.repositories.cached_city_repository import CachedCityRepository
+from src.infrastructure.tasks.image_ingest import BackgroundImageIngestQueue
 from src.infrastructure.auth.jwt_handler import get_user_id_from_token, get_token_claims
 from src.shared.logger.config import get_logger
 from src.application.notification.services.notification_service import NotificationService
@@ -105,6 +111,10 @@ def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides database session.
     
+    FastAPI caches this per request, so every repository and service built
+    for one request shares the same session (and pooled connection). Depend
+    on get_db rather than opening SessionLocal() in providers.
+    
     Yields:
         SQLAlchemy Session instance
     """
@@ -116,7 +126,20 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
-    """Provide a user repository bound to the current DB session."""
+    """Provide a user repository bound to the current DB session.
+
+    Lookups by ID/email are served from a short per-process cache; writes
+    through the repository invalidate it.
+    """
+    return CachedUserRepository(PostgreSQLUserRepository(db))
+
+
+def get_auth_user_repository(db: Session = Depends(get_db)) -> UserRepository:
+    """Provide an uncached user repository for authentication and authorization.
+
+    Password checks and admin/active checks must see the current row, not a
+    cached copy that predates a password change, demotion or deactivation.
+    """
     return PostgreSQLUserRepository(db)
 
 
@@ -127,7 +150,7 @@ def get_create_user_use_case(
 
 
 def get_authenticate_user_use_case(
-    user_repository: UserRepository = Depends(get_user_repository),
+    user_repository: UserRepository = Depends(get_auth_user_repository),
 ) -> AuthenticateUserUseCase:
     return AuthenticateUserUseCase(user_repository)
 
@@ -192,7 +215,7 @@ def get_booking_repository(db: Session = Depends(get_db)) -> BookingRepository:
 
 
 def get_vendor_image_repository(db: Session = Depends(get_db)) -> VendorImageRepository:
-    """Provide a vendor image repository (moved earlier to avoid forward-reference issues)."""
+    """Provide a vendor image repository."""
     return VendorImageRepository(db)
 
 
@@ -356,11 +379,6 @@ def get_service_category_repository(db: Session = Depends(get_db)) -> ServiceCat
     return ServiceCategoryRepository(db)
 
 
-def get_vendor_image_repository(db: Session = Depends(get_db)) -> VendorImageRepository:
-    """Provide a vendor image repository."""
-    return VendorImageRepository(db)
-
-
 def get_list_categories_use_case(
     category_repo: ServiceCategoryRepository = Depends(get_service_category_repository),
 ) -> ListCategoriesUseCase:
@@ -453,10 +471,9 @@ def get_list_vendors_by_category_use_case(
 
 def get_vendor_detail_use_case(
     vendor_repo: ServiceVendorRepository = Depends(get_service_vendor_repository),
-    image_repo: VendorImageRepository = Depends(get_vendor_image_repository),
 ) -> GetVendorDetailUseCase:
     """Provide use case for getting vendor details."""
-    return GetVendorDetailUseCase(vendor_repo, image_repo)
+    return GetVendorDetailUseCase(vendor_repo)
 
 
 def get_vendor_image_use_case(
@@ -467,12 +484,18 @@ def get_vendor_image_use_case(
 
 
 def get_create_vendor_use_case(
+    background_tasks: BackgroundTasks,
     category_repo: ServiceCategoryRepository = Depends(get_service_category_repository),
     vendor_repo: ServiceVendorRepository = Depends(get_service_vendor_repository),
     image_repo: VendorImageRepository = Depends(get_vendor_image_repository),
 ) -> CreateVendorUseCase:
-    """Provide use case for creating vendors (admin)."""
-    return CreateVendorUseCase(category_repo, vendor_repo, image_repo)
+    """Provide use case for creating vendors (admin); images are saved in the background."""
+    return CreateVendorUseCase(
+        category_repo,
+        vendor_repo,
+        image_repo,
+        image_queue=BackgroundImageIngestQueue(background_tasks),
+    )
 
 
 def get_update_vendor_use_case(
@@ -492,19 +515,17 @@ def get_delete_vendor_use_case(
 
 
 def get_add_vendor_image_use_case(
-    vendor_repo: ServiceVendorRepository = Depends(get_service_vendor_repository),
     image_repo: VendorImageRepository = Depends(get_vendor_image_repository),
 ) -> AddVendorImageUseCase:
     """Provide use case for adding vendor images (admin)."""
-    return AddVendorImageUseCase(vendor_repo, image_repo)
+    return AddVendorImageUseCase(image_repo)
 
 
 def get_delete_vendor_image_use_case(
-    vendor_repo: ServiceVendorRepository = Depends(get_service_vendor_repository),
     image_repo: VendorImageRepository = Depends(get_vendor_image_repository),
 ) -> DeleteVendorImageUseCase:
     """Provide use case for deleting vendor images (admin)."""
-    return DeleteVendorImageUseCase(vendor_repo, image_repo)
+    return DeleteVendorImageUseCase(image_repo)
 
 
 def get_reorder_vendor_images_use_case(
@@ -552,9 +573,9 @@ def get_current_admin_user(
 
 # ============= Plan Dependencies =============
 
-def get_plan_repository(db: Session = Depends(get_db)) -> PostgreSQLPlanRepository:
-    """Provide a plan repository."""
-    return PostgreSQLPlanRepository(db)
+def get_plan_repository(db: Session = Depends(get_db)) -> PlanRepository:
+    """Provide a plan repository (cached by plan ID)."""
+    return CachedPlanRepository(PostgreSQLPlanRepository(db))
 
 
 def get_subscription_repository(db: Session = Depends(get_db)) -> PostgreSQLSubscriptionRepository:
@@ -563,14 +584,14 @@ def get_subscription_repository(db: Session = Depends(get_db)) -> PostgreSQLSubs
 
 
 def get_list_plans_use_case(
-    plan_repo: PostgreSQLPlanRepository = Depends(get_plan_repository),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
 ) -> ListPlansUseCase:
     """Provide list plans use case."""
     return ListPlansUseCase(plan_repo)
 
 
 def get_purchase_plan_use_case(
-    plan_repo: PostgreSQLPlanRepository = Depends(get_plan_repository),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
     subscription_repo: PostgreSQLSubscriptionRepository = Depends(get_subscription_repository),
     user_repo: UserRepository = Depends(get_user_repository),
 ) -> PurchasePlanUseCase:
@@ -581,7 +602,7 @@ def get_purchase_plan_use_case(
 def get_verify_payment_use_case(
     subscription_repo: PostgreSQLSubscriptionRepository = Depends(get_subscription_repository),
     user_repo: UserRepository = Depends(get_user_repository),
-    plan_repo: PostgreSQLPlanRepository = Depends(get_plan_repository),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
     db: Session = Depends(get_db),
 ) -> VerifyPaymentUseCase:
     """Provide verify payment use case."""
@@ -591,7 +612,7 @@ def get_verify_payment_use_case(
 
 def get_user_subscription_use_case(
     subscription_repo: PostgreSQLSubscriptionRepository = Depends(get_subscription_repository),
-    plan_repo: PostgreSQLPlanRepository = Depends(get_plan_repository),
+    plan_repo: PlanRepository = Depends(get_plan_repository),
 ) -> GetUserSubscriptionUseCase:
     """Provide get user subscription use case."""
     return GetUserSubscriptionUseCase(subscription_repo, plan_repo)
@@ -603,9 +624,9 @@ def get_banner_repository(db: Session = Depends(get_db)) -> PostgreSQLBannerRepo
     return PostgreSQLBannerRepository(db)
 
 
-def get_city_repository(db: Session = Depends(get_db)) -> PostgreSQLCityRepository:
-    """Provide a city repository."""
-    return PostgreSQLCityRepository(db)
+def get_city_repository(db: Session = Depends(get_db)) -> CityRepository:
+    """Provide a city repository (cached city lists)."""
+    return CachedCityRepository(PostgreSQLCityRepository(db))
 
 
 def get_list_banners_use_case(
@@ -616,7 +637,7 @@ def get_list_banners_use_case(
 
 
 def get_list_cities_use_case(
-    city_repo: PostgreSQLCityRepository = Depends(get_city_repository),
+    city_repo: CityRepository = Depends(get_city_repository),
 ) -> ListCitiesUseCase:
     """Provide list cities use case."""
     return ListCitiesUseCase(city_repo)
@@ -12,7 +12,7 @@ from src.domain.shared.exceptions import ValidationError
 MAX_IMAGE_SIZE_BYTES = 8 * 1024 * 1024  # 8MB
 MAX_DISH_IMAGE_SIZE_BYTES = 500 * 1024  # 500KB for dish/item images in metadata
 THUMBNAIL_SIZE = (200, 200)
-VALID_MIME_TYPES = ["image/jpeg", "image/png", "image/webp"]
+VALID_MIME_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
 MIME_TO_FORMAT = {
     "image/jpeg": "JPEG",
     "image/png": "PNG",
@@ -160,7 +160,7 @@ def process_image(
     # Validate mime type
     if not validate_mime_type(mime_type):
         raise ValidationError(
-            f"Unsupported image type: {mime_type}. Supported types: {VALID_MIME_TYPES}"
+            f"Unsupported image type: {mime_type}. Supported types: {sorted(VALID_MIME_TYPES)}"
         )
     
     # Decode base64
@@ -216,7 +216,7 @@ def process_dish_image(base64_string: str, mime_type: Optional[str] = None) -> s
     
     if not validate_mime_type(final_mime):
         raise ValidationError(
-            f"Unsupported image type: {final_mime}. Supported types: {VALID_MIME_TYPES}"
+            f"Unsupported image type: {final_mime}. Supported types: {sorted(VALID_MIME_TYPES)}"
         )
     
     # Return original base64 (keeping data URI format if present)
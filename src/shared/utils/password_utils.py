@@ -1,11 +1,53 @@
 """Password hashing and verification utilities."""
 
+import time
+
 import bcrypt
 
+# Bounds for the bcrypt cost factor. Each round doubles hashing time; the
+# cost is stored in every hash, so changing it never breaks existing hashes.
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 14
+
+_bcrypt_rounds = 12
+
+
+def configure_bcrypt_rounds(rounds: int) -> int:
+    """
+    Set the bcrypt cost used for new hashes, clamped to the allowed bounds.
+    
+    Returns:
+        The cost factor now in effect
+    """
+    global _bcrypt_rounds
+    _bcrypt_rounds = max(MIN_BCRYPT_ROUNDS, min(MAX_BCRYPT_ROUNDS, rounds))
+    return _bcrypt_rounds
+
+
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """
+    Pick the lowest bcrypt cost whose hash takes at least target_ms here.
+    
+    Times one hash at the minimum cost and doubles the estimate per round,
+    so calibration costs a single fast hash at startup.
+    
+    Returns:
+        The cost factor now in effect
+    """
+    started = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=MIN_BCRYPT_ROUNDS))
+    estimate_ms = (time.perf_counter() - started) * 1000
+    
+    rounds = MIN_BCRYPT_ROUNDS
+    while estimate_ms < target_ms and rounds < MAX_BCRYPT_ROUNDS:
+        rounds += 1
+        estimate_ms *= 2
+    return configure_bcrypt_rounds(rounds)
+
 
 def hash_password(password: str) -> str:
     """
-    Hash password using bcrypt.
+    Hash password using bcrypt at the configured cost.
     
     Args:
         password: Plain text password to hash
@@ -13,7 +55,7 @@ def hash_password(password: str) -> str:
     Returns:
         Bcrypt hashed password string
     """
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 